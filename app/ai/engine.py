@@ -78,15 +78,16 @@ async def process_message(req: ChatRequest) -> ChatResponse:
 
     game_ready = session.state == ConversationState.GENERATING
     download_url: Optional[str] = None
-    preview_log: Optional[str] = None
+    job_id: Optional[str] = None
 
     if game_ready:
         from app.generator.project_builder import generate_game
-        from app.mcp.godot_mcp import validate_project
 
+        # Returns with a playable procedural-art build; validation and the
+        # AI art revision follow through the job channel.
         result = await generate_game(session.spec)
         download_url = f"/api/download/{session.spec.name.replace(' ', '_')}"
-        preview_log = await validate_project(result["project_dir"])
+        job_id = result["job_id"]
         session.state = ConversationState.COMPLETE
 
     suggestions = get_suggestions(session.state, session.spec)
@@ -96,7 +97,7 @@ async def process_message(req: ChatRequest) -> ChatResponse:
         state=session.state,
         game_ready=game_ready or session.state == ConversationState.COMPLETE,
         download_url=download_url,
-        preview_log=preview_log,
+        job_id=job_id,
         spec=session.spec if session.state != ConversationState.GREETING else None,
         suggestions=suggestions,
         can_undo=len(session.snapshots) > 0,
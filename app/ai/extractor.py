@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from app.models import Dimension, Genre, InputMethod, MultiplayerMode
+from app.models import Dimension, Genre, InputMethod, MultiplayerMode, Quality
 
 _GENRE_MAP: dict[str, Genre] = {
     "platformer": Genre.PLATFORMER,
@@ -71,6 +71,17 @@ _DIFFICULTY_MAP = {
     "impossible": "hard",
 }
 
+_QUALITY_MAP = {
+    "auto": Quality.AUTO,
+    "automatic": Quality.AUTO,
+    "adaptive": Quality.AUTO,
+    "low": Quality.LOW,
+    "medium": Quality.MEDIUM,
+    "high": Quality.HIGH,
+    "max": Quality.HIGH,
+    "maximum": Quality.HIGH,
+}
+
 
 def extract_game_params(text: str) -> dict:
     """Return a dict of game-spec fields extracted from *text*."""
@@ -188,6 +199,17 @@ def extract_game_params(text: str) -> dict:
         elif re.search(pattern, low) and re.search(r"\b(?:background|bg|backdrop)\b", low):
             params["color_bg"] = color
 
+    quality_match = re.search(
+        r"\b(auto(?:matic)?|adaptive|low|medium|high|max(?:imum)?)[- ]?(?:quality|graphics|detail|settings)\b", low
+    )
+    if quality_match:
+        params["quality"] = _QUALITY_MAP[quality_match.group(1)]
+        low = low.replace(quality_match.group(0), " ")  # "medium quality" is no difficulty
+    elif re.search(r"\b(?:potato|low[- ]end|weak|old)\s+(?:pc|computer|laptop|phone|hardware)\b", low):
+        params["quality"] = Quality.LOW
+    if re.search(r"\b(?:fps\s*(?:counter|meter|display|overlay)|(?:perf(?:ormance)?|debug)\s*overlay|show\s+(?:the\s+)?fps)\b", low):
+        params["perf_overlay"] = True
+
     for kw, diff in _DIFFICULTY_MAP.items():
         if re.search(rf"\b{kw}\b", low):
             params["difficulty"] = diff
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from app.ai.intent import Intent
-from app.models import ConversationState, Genre, SessionData
+from app.models import ConversationState, Genre, Quality, SessionData
 
 _GENRE_LABELS = {
     Genre.PLATFORMER: "2D Platformer",
@@ -108,6 +108,10 @@ def build_response(session: SessionData, intent: Intent) -> str:
             parts.append("- **Parallax Background:** Yes")
         if spec.weather != "none":
             parts.append(f"- **Weather:** {spec.weather.title()}")
+        if spec.quality != Quality.HIGH:
+            parts.append(f"- **Graphics Quality:** {spec.quality.value.title()}")
+        if spec.perf_overlay:
+            parts.append("- **FPS Overlay:** Yes")
         parts.append(f"- **Difficulty:** {spec.difficulty.title()}")
         parts.append(
             "\n**Want to enhance your game?** Try adding:\n"
@@ -138,6 +142,10 @@ def build_response(session: SessionData, intent: Intent) -> str:
             summary += f"- Particles: {spec.particle_type.title() if spec.particle_type != 'none' else 'Yes'}\n"
         if spec.weather != "none":
             summary += f"- Weather: {spec.weather.title()}\n"
+        if spec.quality != Quality.HIGH:
+            summary += f"- Graphics quality: {spec.quality.value.title()}\n"
+        if spec.perf_overlay:
+            summary += "- FPS overlay: Yes\n"
         summary += (
             f"- Difficulty: {spec.difficulty.title()}\n\n"
             f"Check the **preview** for a visual snapshot of your game.\n"
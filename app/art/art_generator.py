@@ -10,15 +10,25 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 import urllib.request
 import urllib.error
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from app.art.postprocess import (
+    FRAME_SIZE,
+    ITEM_SIZE,
+    TOPDOWN_SIZE,
+    ArtItem,
+    postprocess_assets,
+)
 
 HORDE_API = "https://stablehorde.net/api/v2"
 ANON_KEY = "0000000000"
 POLL_INTERVAL = 8
 MAX_POLLS = 30
+MAX_CONCURRENT_JOBS = 3
 
 
 def _post_json(url: str, data: dict, api_key: str = ANON_KEY) -> dict:
@@ -46,8 +56,12 @@ def _get_json(url: str) -> dict:
 
 async def generate_image(prompt: str, dest: Path,
                          width: int = 512, height: int = 512,
-                         model: str = "Deliberate") -> bool:
-    """Submit an image generation job and wait for result. Returns True on success."""
+                         model: str = "Deliberate",
+                         cancelled: Optional[threading.Event] = None) -> bool:
+    """Submit an image generation job and wait for result. Returns True on success.
+
+    Nothing is written to *dest* once *cancelled* is set.
+    """
     payload = {
         "prompt": prompt,
         "params": {
@@ -89,16 +103,24 @@ async def generate_image(prompt: str, dest: Path,
         return False
 
     try:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        urllib.request.urlretrieve(img_url, str(dest))
-        # Convert webp to png for Godot compatibility
-        _convert_to_png(dest)
-        return True
+        return await asyncio.to_thread(_download, img_url, dest, cancelled)
     except Exception as e:
         print(f"[art] Download error for {dest.name}: {e}")
         return False
 
 
+def _download(url: str, dest: Path, cancelled: Optional[threading.Event]) -> bool:
+    with urllib.request.urlopen(url, timeout=60) as resp:
+        data = resp.read()
+    if cancelled is not None and cancelled.is_set():
+        return False
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
+    # Convert webp to png for Godot compatibility
+    _convert_to_png(dest)
+    return True
+
+
 def _convert_to_png(path: Path) -> None:
     """Convert webp to PNG using Pillow if available, otherwise keep as-is."""
     try:
@@ -133,28 +155,58 @@ class GameArtGenerator:
         parts.append("high quality")
         return ", ".join(parts)
 
-    async def generate_all(self, spec) -> dict[str, bool]:
-        """Generate all game assets in parallel batches. Returns dict of name->success."""
+    async def generate_all(self, spec,
+                           on_result: Optional[Callable[[str, bool], None]] = None,
+                           cancelled: Optional[threading.Event] = None,
+                           ) -> dict[str, bool]:
+        """Generate all game assets concurrently. Returns dict of name->success.
+
+        *on_result* is called with (name, success) as soon as each image
+        finishes, so callers can patch art into a project while the rest of
+        the batch is still rendering. Once every download is in, the images
+        are post-processed as one batch (see app.art.postprocess). Setting
+        *cancelled* stops downloads and post-processing from writing files.
+        """
         requests = self._build_request_list(spec)
         results = {}
 
-        # Process in batches of 3 to be nice to the free API
-        batch_size = 3
-        for i in range(0, len(requests), batch_size):
-            batch = requests[i:i + batch_size]
-            tasks = [
-                generate_image(prompt, self.assets_dir / name, w, h)
-                for name, prompt, w, h in batch
-            ]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            for j, (name, _, _, _) in enumerate(batch):
-                res = batch_results[j]
-                results[name] = res is True
-                status = "✓" if res is True else "✗"
-                print(f"[art] {status} {name}")
+        # At most 3 jobs in flight to be nice to the free API
+        slots = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+
+        async def _run(name: str, prompt: str, w: int, h: int) -> None:
+            async with slots:
+                try:
+                    ok = await generate_image(prompt, self.assets_dir / name, w, h,
+                                              cancelled=cancelled)
+                except Exception as e:
+                    print(f"[art] Error generating {name}: {e}")
+                    ok = False
+            results[name] = ok
+            status = "✓" if ok else "✗"
+            print(f"[art] {status} {name}")
+            if on_result:
+                on_result(name, ok)
+
+        await asyncio.gather(*(_run(*req) for req in requests))
 
+        done = [self._postprocess_item(name) for name, ok in results.items() if ok]
+        if done:
+            await asyncio.to_thread(postprocess_assets, done, self.art_style, cancelled)
         return results
 
+    def _postprocess_item(self, name: str) -> ArtItem:
+        """Target size and keying for one asset; backgrounds are left full-size."""
+        path = self.assets_dir / name
+        if name.startswith("background"):
+            return path, None, False
+        if name.startswith("collectible"):
+            return path, ITEM_SIZE, True
+        return path, TOPDOWN_SIZE if self.genre == "topdown" else FRAME_SIZE, True
+
+    def asset_names(self, spec) -> list[str]:
+        """File names of every asset generate_all will attempt."""
+        return [name for name, _, _, _ in self._build_request_list(spec)]
+
     def _build_request_list(self, spec) -> list[tuple[str, str, int, int]]:
         """Build list of (filename, prompt, width, height) for all needed assets."""
         genre_desc = {
@@ -0,0 +1,116 @@
+"""Texture atlas packer for generated art.
+
+Packs a project's sprites and item art into one (or, if they do not fit in
+MAX_ATLAS_SIZE, a few) power-of-two atlas pages and writes a Godot
+AtlasTexture resource per sprite, so the game uploads a single texture and
+batches the draws instead of binding a separate PNG per asset.
+
+Characters face right in the source art; their mirrored, left-facing copy
+is packed too (as "<key>_left") so flipped animations stay in the atlas.
+
+Layout written into the assets dir::
+
+    atlas_0.png                 packed page(s)
+    atlas/<key>.tres            AtlasTexture region per sprite
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+MAX_ATLAS_SIZE = 2048
+PADDING = 2
+
+
+def pack_atlases(assets_dir: Path, names: list[str],
+                 mirrored: Iterable[str] = (),
+                 cancelled: Optional[threading.Event] = None) -> dict[str, str]:
+    """Pack *names* (PNG files in *assets_dir*) and return art key -> AtlasTexture res path.
+
+    Packed source PNGs are removed; nothing references them any more.
+    Nothing is written once *cancelled* is set, and {} is returned.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        print("[art] Pillow not installed, skipping atlas packing")
+        return {}
+
+    mirrored = set(mirrored)
+    sprites: dict[str, Image.Image] = {}
+    for name in names:
+        key = name.rsplit(".", 1)[0]
+        with Image.open(assets_dir / name) as img:
+            sprites[key] = img.convert("RGBA")
+        if name in mirrored:
+            sprites[key + "_left"] = ImageOps.mirror(sprites[key])
+    if not sprites:
+        return {}
+
+    # Tallest first gives tight shelves
+    keys = sorted(sprites, key=lambda k: (sprites[k].height, sprites[k].width), reverse=True)
+    sizes = [(sprites[k].width + PADDING * 2, sprites[k].height + PADDING * 2) for k in keys]
+    page_size, placements = _choose_page_size(sizes)
+
+    page_count = placements[-1][0] + 1 if placements else 0
+    pages = [Image.new("RGBA", (page_size, page_size), (0, 0, 0, 0)) for _ in range(page_count)]
+    regions, resources = {}, {}
+    for key, (page, x, y) in zip(keys, placements):
+        img = sprites[key]
+        pages[page].paste(img, (x + PADDING, y + PADDING))
+        resources[key] = _atlas_texture_tres(page, x + PADDING, y + PADDING, img.width, img.height)
+        regions[key] = f"res://assets/atlas/{key}.tres"
+
+    if cancelled is not None and cancelled.is_set():
+        return {}
+    atlas_dir = assets_dir / "atlas"
+    atlas_dir.mkdir(exist_ok=True)
+    for key, tres in resources.items():
+        (atlas_dir / f"{key}.tres").write_text(tres)
+    for i, page in enumerate(pages):
+        page.save(assets_dir / f"atlas_{i}.png", "PNG", optimize=True)
+    for name in names:
+        (assets_dir / name).unlink(missing_ok=True)
+    return regions
+
+
+def _choose_page_size(sizes: list[tuple[int, int]]) -> tuple[int, list[tuple[int, int, int]]]:
+    """Smallest power-of-two square page that holds everything, spilling to extra pages at the cap."""
+    longest = max(max(w, h) for w, h in sizes)
+    area = sum(w * h for w, h in sizes)
+    page_size = 64
+    while page_size < MAX_ATLAS_SIZE and (page_size < longest or page_size * page_size < area):
+        page_size *= 2
+    while True:
+        placements = _shelf_pack(sizes, page_size)
+        if placements[-1][0] == 0 or page_size >= MAX_ATLAS_SIZE:
+            return page_size, placements
+        page_size *= 2
+
+
+def _shelf_pack(sizes: list[tuple[int, int]], page_size: int) -> list[tuple[int, int, int]]:
+    """Place rects left-to-right on shelves; returns (page, x, y) per rect."""
+    placements = []
+    page = x = y = shelf_height = 0
+    for w, h in sizes:
+        if x + w > page_size:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + h > page_size:
+            page, x, y, shelf_height = page + 1, 0, 0, 0
+        placements.append((page, x, y))
+        x += w
+        shelf_height = max(shelf_height, h)
+    return placements
+
+
+def _atlas_texture_tres(page: int, x: int, y: int, w: int, h: int) -> str:
+    return f'''[gd_resource type="AtlasTexture" load_steps=2 format=3]
+
+[ext_resource type="Texture2D" path="res://assets/atlas_{page}.png" id="1"]
+
+[resource]
+atlas = ExtResource("1")
+region = Rect2({x}, {y}, {w}, {h})
+'''
@@ -0,0 +1,117 @@
+"""Post-processing for downloaded AI art.
+
+AI Horde returns 256×256+ images on a solid background. Before they ship we
+colour-key the background away, trim to the content's bounding box, and
+downscale to the frame sizes the generated SpriteGenerator uses, so Godot
+neither draws opaque squares nor rescales big textures at runtime. Pixel
+and retro art styles are additionally quantized to a small palette.
+
+Background removal runs vectorized over a stack of same-sized images.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+# Mirrors SpriteGenerator.FRAME_SIZE / TOPDOWN_SIZE in the generated autoload
+FRAME_SIZE = (48, 64)
+TOPDOWN_SIZE = (48, 48)
+ITEM_SIZE = (32, 32)
+
+PALETTE_SIZES = {"pixel": 16, "retro": 32}
+KEY_TOLERANCE = 40.0
+ALPHA_CUTOFF = 8
+
+# (path, target size or None to keep, colour-key the background)
+ArtItem = tuple[Path, Optional[tuple[int, int]], bool]
+
+
+def postprocess_assets(items: list[ArtItem], art_style: str = "",
+                       cancelled: Optional[threading.Event] = None) -> None:
+    """Clean up a batch of downloaded images in place (PNG in, PNG out).
+
+    Stops before the next write once *cancelled* is set.
+    """
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError:
+        print("[art] NumPy/Pillow not installed, shipping art unprocessed")
+        return
+
+    arrays = []
+    for path, _, _ in items:
+        with Image.open(path) as img:
+            arrays.append(np.asarray(img.convert("RGBA")))
+
+    by_shape: dict[tuple, list[int]] = defaultdict(list)
+    for i, (_, _, keyed) in enumerate(items):
+        if keyed:
+            by_shape[arrays[i].shape].append(i)
+    for indices in by_shape.values():
+        keyed_stack = remove_background(np.stack([arrays[i] for i in indices]))
+        for j, i in enumerate(indices):
+            arrays[i] = trim(keyed_stack[j])
+
+    palette = PALETTE_SIZES.get(art_style)
+    resample = Image.Resampling.NEAREST if palette else Image.Resampling.LANCZOS
+    for (path, size, _), arr in zip(items, arrays):
+        if cancelled is not None and cancelled.is_set():
+            return
+        img = Image.fromarray(arr, "RGBA")
+        if size:
+            img = fit(img, size, resample)
+        if palette:
+            img = img.quantize(palette, method=Image.Quantize.FASTOCTREE)
+        img.save(path, "PNG", optimize=True)
+
+
+def remove_background(stack):
+    """Colour-key a (N, H, W, 4) uint8 stack against each image's border colour.
+
+    The key is the median border pixel; pixels within KEY_TOLERANCE of it
+    become transparent, with a linear alpha ramp over the next
+    KEY_TOLERANCE to keep edges soft.
+    """
+    import numpy as np
+
+    rgb = stack[..., :3].astype(np.float32)
+    border = np.concatenate(
+        [rgb[:, 0, :], rgb[:, -1, :], rgb[:, :, 0], rgb[:, :, -1]], axis=1,
+    )
+    key = np.median(border, axis=1)
+    dist = np.linalg.norm(rgb - key[:, None, None, :], axis=-1)
+    coverage = np.clip((dist - KEY_TOLERANCE) / KEY_TOLERANCE, 0.0, 1.0)
+
+    out = stack.copy()
+    out[..., 3] = (stack[..., 3] * coverage).astype(np.uint8)
+    return out
+
+
+def trim(arr):
+    """Crop an (H, W, 4) array to the bounding box of its visible pixels."""
+    import numpy as np
+
+    visible = arr[..., 3] > ALPHA_CUTOFF
+    rows = np.flatnonzero(visible.any(axis=1))
+    cols = np.flatnonzero(visible.any(axis=0))
+    if rows.size == 0:
+        return arr
+    return arr[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+
+
+def fit(img, size: tuple[int, int], resample):
+    """Scale *img* to fit inside *size* (keeping aspect), centred on a transparent canvas."""
+    from PIL import Image
+
+    w, h = size
+    scale = min(w / img.width, h / img.height)
+    scaled = img.resize(
+        (max(1, round(img.width * scale)), max(1, round(img.height * scale))), resample,
+    )
+    canvas = Image.new("RGBA", size, (0, 0, 0, 0))
+    canvas.paste(scaled, ((w - scaled.width) // 2, (h - scaled.height) // 2))
+    return canvas
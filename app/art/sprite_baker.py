@@ -0,0 +1,264 @@
+"""Build-time rasterizer for the procedural character sprites.
+
+The generated SpriteGenerator autoload can draw placeholder characters
+pixel by pixel with Image.set_pixel, but doing that at runtime costs a full
+redraw of every frame for every enemy that spawns. This module renders the
+same frames with NumPy while the project is generated, packs them into one
+sprite sheet per character and writes a SpriteFrames resource over it, so
+the game only has to load() them.
+
+The drawing code mirrors _draw_platformer_frame / _draw_topdown_frame in
+the generated sprite_generator.gd pixel for pixel; keep them in sync.
+
+Layout written into the assets dir::
+
+    baked/<name>.png            sprite sheet
+    baked/<name>.tres           SpriteFrames over the sheet
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+# Mirrors SpriteGenerator.FRAME_SIZE / TOPDOWN_SIZE (width, height)
+FRAME_SIZE = (48, 64)
+TOPDOWN_SIZE = (48, 48)
+
+Color = tuple[float, float, float, float]
+WHITE: Color = (1.0, 1.0, 1.0, 1.0)
+
+# (animation, frame count, speed, loop) — same table as create_platformer_frames
+PLATFORMER_ANIMS = [
+    (f"{action}_{side}", frames, speed, loop)
+    for action, frames, speed, loop in [
+        ("idle", 2, 2.0, True),
+        ("run", 4, 6.0, True),
+        ("jump", 1, 1.0, False),
+        ("fall", 1, 1.0, False),
+        ("attack", 2, 6.0, False),
+    ]
+    for side in ("right", "left")
+]
+
+TOPDOWN_DIRS = ["down", "up", "left", "right"]
+TOPDOWN_ANIMS = [
+    (f"{action}_{direction}", frames, speed, loop)
+    for action, frames, speed, loop in [
+        ("idle", 1, 1.0, True),
+        ("walk", 3, 5.0, True),
+        ("attack", 2, 6.0, False),
+    ]
+    for direction in TOPDOWN_DIRS
+]
+
+
+# ── Godot Color helpers ─────────────────────────────────────────────────
+
+def parse_color(hex_str: str) -> Color:
+    """Color("#rrggbb[aa]") as GDScript parses it."""
+    h = hex_str.lstrip("#")
+    a = int(h[6:8], 16) / 255.0 if len(h) >= 8 else 1.0
+    return (int(h[0:2], 16) / 255.0, int(h[2:4], 16) / 255.0, int(h[4:6], 16) / 255.0, a)
+
+
+def lightened(c: Color, amount: float) -> Color:
+    return (c[0] + (1.0 - c[0]) * amount, c[1] + (1.0 - c[1]) * amount,
+            c[2] + (1.0 - c[2]) * amount, c[3])
+
+
+def darkened(c: Color, amount: float) -> Color:
+    return (c[0] * (1.0 - amount), c[1] * (1.0 - amount), c[2] * (1.0 - amount), c[3])
+
+
+def godot_color(c: Color) -> str:
+    return f"Color({c[0]:.4f}, {c[1]:.4f}, {c[2]:.4f}, {c[3]:.4f})"
+
+
+def _rgba8(c: Color):
+    import numpy as np
+
+    return np.array([min(255, max(0, round(v * 255))) for v in c], dtype=np.uint8)
+
+
+# ── frame rasterizers ───────────────────────────────────────────────────
+
+def platformer_frame(body: Color, detail: Color, anim: str, frame: int, flip: bool):
+    """One (H, W, 4) platformer frame; *anim* is the right-facing name."""
+    import numpy as np
+
+    w, h = FRAME_SIZE
+    img = np.zeros((h, w, 4), dtype=np.uint8)
+    cx = w // 2
+    detail8 = _rgba8(detail)
+
+    img[4:16, cx - 6:cx + 6] = _rgba8(body)
+    eye_x = cx + 2 if not flip else cx - 4
+    img[8, eye_x:eye_x + 2] = _rgba8(WHITE)
+
+    body_offset = int(math.sin(frame * 1.2) * 1.5) if anim.startswith("run") else 0
+    img[16:34 + body_offset, cx - 5:cx + 5] = _rgba8(darkened(body, 0.15))
+
+    y = 34
+    if anim.startswith("idle"):
+        _legs_standing(img, cx, y, detail8, frame)
+    elif anim.startswith("run"):
+        offsets = [[-4, 3], [-2, 5], [0, 4], [3, -4], [5, -2], [4, 0]]
+        off = offsets[frame % 6]
+        for ly in range(y, y + 12):
+            progress = (ly - y) / 12.0
+            for lx in (cx - 3 + int(off[0] * progress), cx + 1 + int(off[1] * progress)):
+                for px in (lx, lx + 1):
+                    if 0 <= px < w:
+                        img[ly, px] = detail8
+    elif anim.startswith("jump"):
+        tuck = 2 if frame == 0 else 0
+        img[y:y + 10 - tuck, [cx - 4, cx - 3, cx + 2, cx + 3]] = detail8
+    elif anim.startswith("fall"):
+        spread = 3 + frame
+        for ly in range(y, y + 11):
+            lx = cx - 3 - int(spread * (ly - y) / 11.0)
+            rx = cx + 2 + int(spread * (ly - y) / 11.0)
+            if lx >= 0 and lx + 1 < w:
+                img[ly, lx:lx + 2] = detail8
+            if rx >= 0 and rx + 1 < w:
+                img[ly, rx:rx + 2] = detail8
+    elif anim.startswith("attack"):
+        _legs_standing(img, cx, y, detail8, 0)
+        arm_len = [4, 10, 7][frame]
+        arm_y = 20 + [-2, -4, 0][frame]
+        dir_x = 1 if not flip else -1
+        arm_light = _rgba8(lightened(detail, 0.3))
+        for i in range(arm_len):
+            px = cx + 5 * dir_x + i * dir_x
+            if 0 <= px < w and 0 <= arm_y < h:
+                img[arm_y, px] = detail8
+                if arm_y + 1 < h:
+                    img[arm_y + 1, px] = arm_light
+
+    if flip:
+        img = img[:, ::-1]
+    return img
+
+
+def _legs_standing(img, cx: int, y: int, color, frame: int) -> None:
+    spread = 1 if frame % 2 == 0 else 2
+    img[y:y + 12, [cx - 3 - spread, cx - 2 - spread, cx + 1 + spread, cx + 2 + spread]] = color
+
+
+def topdown_frame(body: Color, detail: Color, action: str, direction: str, frame: int):
+    """One (H, W, 4) top-down frame."""
+    import numpy as np
+
+    w, h = TOPDOWN_SIZE
+    img = np.zeros((h, w, 4), dtype=np.uint8)
+    cx, cy = w // 2, h // 2
+    detail8 = _rgba8(detail)
+
+    ys, xs = np.mgrid[0:h, 0:w]
+    dist = np.hypot(xs - cx, ys - cy)
+    img[dist < 10] = _rgba8(darkened(body, 0.3))
+    img[dist < 8] = _rgba8(body)
+
+    ex, ey = {"down": (0, 3), "up": (0, -3), "left": (-3, 0), "right": (3, 0)}[direction]
+    img[cy + ey, cx + ex - 1] = _rgba8(WHITE)
+    img[cy + ey, cx + ex + 1] = _rgba8(WHITE)
+
+    if action == "walk":
+        bob_y = int(math.sin(frame * 1.8) * 1.5)
+        if cy + 10 + bob_y < h:
+            img[cy + 10 + bob_y, cx - 3:cx + 3] = detail8
+    if action == "attack":
+        ax, ay = ex * 2, ey * 2
+        for i in range(6 + frame * 3):
+            # GDScript integer division truncates toward zero
+            px = cx + ax + int(ax * i / 3)
+            py = cy + ay + int(ay * i / 3)
+            if 0 <= px < w and 0 <= py < h:
+                img[py, px] = detail8
+    return img
+
+
+# ── sheet + SpriteFrames output ─────────────────────────────────────────
+
+def bake_character(assets_dir: Path, name: str, kind: str,
+                   body: Color, detail: Color) -> str | None:
+    """Render a character's full animation set; returns the SpriteFrames res path.
+
+    *kind* is "platformer" or "topdown". Returns None when NumPy/Pillow are
+    missing, in which case the game falls back to drawing at runtime.
+    """
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError:
+        print("[art] NumPy/Pillow not installed, sprites will be drawn at runtime")
+        return None
+
+    if kind == "topdown":
+        size, anims = TOPDOWN_SIZE, TOPDOWN_ANIMS
+        render = lambda anim, i: topdown_frame(body, detail, *anim.split("_"), i)  # noqa: E731
+    else:
+        size, anims = FRAME_SIZE, PLATFORMER_ANIMS
+        render = lambda anim, i: platformer_frame(  # noqa: E731
+            body, detail, anim.replace("_left", "_right"), i, anim.endswith("_left"),
+        )
+
+    # Identical frames (every 1-frame pose, mirrored idles…) share one cell
+    cells: list = []
+    cell_of: dict[bytes, int] = {}
+    animations = []
+    for anim, count, speed, loop in anims:
+        frames = []
+        for i in range(count):
+            img = render(anim, i)
+            key = img.tobytes()
+            if key not in cell_of:
+                cell_of[key] = len(cells)
+                cells.append(img)
+            frames.append(cell_of[key])
+        animations.append((anim, frames, speed, loop))
+
+    cols = math.ceil(math.sqrt(len(cells)))
+    rows = math.ceil(len(cells) / cols)
+    w, h = size
+    sheet = np.zeros((rows * h, cols * w, 4), dtype=np.uint8)
+    for idx, cell in enumerate(cells):
+        r, c = divmod(idx, cols)
+        sheet[r * h:(r + 1) * h, c * w:(c + 1) * w] = cell
+
+    baked_dir = assets_dir / "baked"
+    baked_dir.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(sheet, "RGBA").save(baked_dir / f"{name}.png", "PNG", optimize=True)
+    regions = [((i % cols) * w, (i // cols) * h, w, h) for i in range(len(cells))]
+    (baked_dir / f"{name}.tres").write_text(
+        _sprite_frames_tres(f"res://assets/baked/{name}.png", regions, animations),
+    )
+    return f"res://assets/baked/{name}.tres"
+
+
+def _sprite_frames_tres(sheet_path: str, regions: list[tuple[int, int, int, int]],
+                        animations: list[tuple[str, list[int], float, bool]]) -> str:
+    subs = "\n".join(
+        f'[sub_resource type="AtlasTexture" id="AtlasTexture_{i}"]\n'
+        f'atlas = ExtResource("1")\n'
+        f'region = Rect2({x}, {y}, {w}, {h})\n'
+        for i, (x, y, w, h) in enumerate(regions)
+    )
+    anim_entries = []
+    for anim, frames, speed, loop in animations:
+        frame_entries = ", ".join(
+            f'{{\n"duration": 1.0,\n"texture": SubResource("AtlasTexture_{f}")\n}}' for f in frames
+        )
+        anim_entries.append(
+            f'{{\n"frames": [{frame_entries}],\n"loop": {str(loop).lower()},\n'
+            f'"name": &"{anim}",\n"speed": {speed}\n}}'
+        )
+    return f'''[gd_resource type="SpriteFrames" load_steps={len(regions) + 2} format=3]
+
+[ext_resource type="Texture2D" path="{sheet_path}" id="1"]
+
+{subs}
+[resource]
+animations = [{", ".join(anim_entries)}]
+'''
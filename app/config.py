@@ -1,8 +1,12 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 GENERATED_GAMES_DIR = BASE_DIR / "generated_games"
+REVISIONS_DIR = GENERATED_GAMES_DIR / ".revisions"
+CHECK_CACHE_DIR = GENERATED_GAMES_DIR / ".check_cache"
+BENCH_BASELINE_PATH = GENERATED_GAMES_DIR / ".bench_baseline.json"
 STATIC_DIR = Path(__file__).resolve().parent / "static"
-GODOT_BIN = "godot"
+GODOT_BIN = os.environ.get("GODOT_BIN", "godot")
 
 GENERATED_GAMES_DIR.mkdir(exist_ok=True)
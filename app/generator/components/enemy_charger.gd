@@ -18,7 +18,7 @@ var _charge_dir := Vector2.ZERO
 
 func _ready() -> void:
 	var color := GameManager.color_secondary.darkened(0.15)
-	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.3))
+	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.3), "enemy_1")
 	sprite.play("idle_right")
 
 
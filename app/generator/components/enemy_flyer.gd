@@ -17,7 +17,7 @@ var _diving := false
 func _ready() -> void:
 	_origin = global_position
 	var color := GameManager.color_secondary.lightened(0.2)
-	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.3))
+	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.3), "enemy_2")
 	sprite.play("idle_right")
 
 
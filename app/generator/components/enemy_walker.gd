@@ -12,7 +12,7 @@ var _hp := 3
 
 func _ready() -> void:
 	var color := GameManager.color_secondary
-	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.3))
+	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.3), "enemy_1")
 	sprite.play("run_right")
 	_dir = [-1.0, 1.0].pick_random()
 
@@ -30,9 +30,9 @@ var _was_on_floor := false
 
 
 func _ready() -> void:
-	# Primary Color is dynamically fed by project setup
-	var color := Color(GlobalColors.primary_color)
-	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.4))
+	# Primary colour comes from the GameManager autoload
+	var color := GameManager.color_primary
+	sprite.sprite_frames = SpriteGenerator.create_platformer_frames(color, color.lightened(0.4), "player")
 	sprite.play("idle_right")
 
 
@@ -0,0 +1,224 @@
+"""Build-time dungeon layouts for top-down levels.
+
+A level is a graph of rectangular rooms joined by corridors, rasterized to
+a tile grid and written into the level scene as one TileMapLayer over a
+shared TileSet, rather than a node per wall and floor. Godot batches the
+drawing and collision of tiles itself, so a level's scene and load cost
+follow its entity count, not its size.
+
+Layouts depend on nothing but (level_seed, level_num), so they are
+reproducible and can be inspected from Python::
+
+    dungeon = build_dungeon(3042, 3)
+    len(dungeon.rooms), dungeon.goal, dungeon.pixel(dungeon.rooms[0].center)
+
+Layout written into the project::
+
+    levels/dungeon_tiles.tres   TileSet shared by every level
+"""
+
+from __future__ import annotations
+
+import base64
+import random
+import struct
+from collections import deque
+from dataclasses import dataclass, field
+
+from app.art.sprite_baker import Color, darkened
+
+TILE = 16
+# Rooms sit one per cell of a coarse grid, leaving room for the walls and
+# corridors between neighbours
+CELL_TILES = 28
+MIN_ROOM, MAX_ROOM = 9, 22
+CORRIDOR_WIDTH = 3
+MAX_ROOMS = 15
+# Chance that two neighbouring rooms the spanning tree didn't join get a corridor anyway
+LOOP_CHANCE = 0.3
+
+# Atlas column of each tile in dungeon_tiles.tres
+FLOOR, FLOOR_ALT, WALL = range(3)
+WALL_COLOR: Color = (0.3, 0.22, 0.18, 1.0)
+
+_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+@dataclass
+class Room:
+    """A rectangle of floor tiles."""
+
+    x: int
+    y: int
+    w: int
+    h: int
+
+    @property
+    def center(self) -> tuple[int, int]:
+        return self.x + self.w // 2, self.y + self.h // 2
+
+    def random_tile(self, rng: random.Random, margin: int = 2) -> tuple[int, int]:
+        return (rng.randint(self.x + margin, self.x + self.w - 1 - margin),
+                rng.randint(self.y + margin, self.y + self.h - 1 - margin))
+
+
+@dataclass
+class Dungeon:
+    """One level's rooms, the corridors between them and its tile grid."""
+
+    rooms: list[Room]
+    edges: list[tuple[int, int]]
+    tiles: dict[tuple[int, int], int] = field(default_factory=dict)  # (x, y) -> FLOOR/FLOOR_ALT/WALL
+    start: int = 0   # room the player starts in
+    goal: int = 0    # room farthest from start by corridor hops
+
+    @staticmethod
+    def pixel(tile: tuple[int, int]) -> tuple[int, int]:
+        """Centre of *tile* in level pixels."""
+        return tile[0] * TILE + TILE // 2, tile[1] * TILE + TILE // 2
+
+    def entity_tiles(self, rng: random.Random, count: int, skip_start: bool = True) -> list[tuple[int, int]]:
+        """*count* distinct floor tiles dealt round-robin across the rooms, goal room first."""
+        rooms = [i for i in self._by_distance() if not (skip_start and i == self.start)] or [self.start]
+        picked: set[tuple[int, int]] = set()
+        spots = []
+        for n in range(count):
+            room = self.rooms[rooms[n % len(rooms)]]
+            for _ in range(20):
+                tile = room.random_tile(rng)
+                if tile not in picked:
+                    break
+            picked.add(tile)
+            spots.append(tile)
+        return spots
+
+    def tile_map_data(self) -> str:
+        """TileMapLayer.tile_map_data for the grid, base64 encoded as Godot writes it.
+
+        Format 0: a uint16 version, then per cell int16 x, int16 y and
+        uint16 source id, atlas x, atlas y and alternative, little-endian.
+        """
+        data = bytearray(struct.pack("<H", 0))
+        for (x, y), atlas_x in sorted(self.tiles.items()):
+            data += struct.pack("<hhHHHH", x, y, 0, atlas_x, 0, 0)
+        return base64.b64encode(bytes(data)).decode("ascii")
+
+    def _by_distance(self) -> list[int]:
+        """Room indices ordered by corridor hops from the start room, farthest first."""
+        hops = _hops(len(self.rooms), self.edges, self.start)
+        return sorted(range(len(self.rooms)), key=lambda i: (-hops[i], i))
+
+
+def build_dungeon(level_seed: int, level_num: int) -> Dungeon:
+    """Lay out level *level_num*: 1 + 2n rooms (up to MAX_ROOMS), the goal room largest."""
+    rng = random.Random(level_seed)
+    room_count = min(MAX_ROOMS, 1 + 2 * level_num)
+
+    # Random walk over the coarse grid; each new room hangs off an existing one
+    cells = [(0, 0)]
+    index_of = {(0, 0): 0}
+    edges: list[tuple[int, int]] = []
+    while len(cells) < room_count:
+        parent = rng.randrange(len(cells))
+        dx, dy = rng.choice(_DIRECTIONS)
+        cell = (cells[parent][0] + dx, cells[parent][1] + dy)
+        if cell in index_of:
+            continue
+        index_of[cell] = len(cells)
+        cells.append(cell)
+        edges.append((parent, index_of[cell]))
+    joined = {frozenset(e) for e in edges}
+    for (cx, cy), i in index_of.items():
+        for dx, dy in ((1, 0), (0, 1)):
+            j = index_of.get((cx + dx, cy + dy))
+            if j is not None and frozenset((i, j)) not in joined and rng.random() < LOOP_CHANCE:
+                edges.append((i, j))
+
+    hops = _hops(room_count, edges, 0)
+    goal = max(range(room_count), key=lambda i: (hops[i], i))
+    rooms = []
+    for i, (cx, cy) in enumerate(cells):
+        if i == goal:
+            w = h = MAX_ROOM
+        else:
+            w, h = rng.randint(MIN_ROOM, MAX_ROOM), rng.randint(MIN_ROOM, MAX_ROOM)
+        x = cx * CELL_TILES + rng.randint(1, CELL_TILES - 1 - w)
+        y = cy * CELL_TILES + rng.randint(1, CELL_TILES - 1 - h)
+        rooms.append(Room(x, y, w, h))
+
+    floor: set[tuple[int, int]] = set()
+    for room in rooms:
+        floor.update((x, y) for x in range(room.x, room.x + room.w) for y in range(room.y, room.y + room.h))
+    for a, b in edges:
+        floor.update(_corridor(rooms[a].center, rooms[b].center, rng.random() < 0.5))
+
+    tiles = {t: FLOOR_ALT if rng.random() < 0.12 else FLOOR for t in floor}
+    for x, y in floor:
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (x + dx, y + dy) not in floor:
+                    tiles[(x + dx, y + dy)] = WALL
+    return Dungeon(rooms, edges, tiles, start=0, goal=goal)
+
+
+def tileset_resource(floor_color: Color) -> str:
+    """TileSet .tres with floor, alternate floor and wall tiles; only walls collide.
+
+    The atlas is a GradientTexture2D with constant interpolation — one flat
+    colour band per tile — so it needs no image on disk.
+    """
+    colors = ", ".join(f"{v:.4f}" for c in (floor_color, darkened(floor_color, 0.12), WALL_COLOR) for v in c)
+    half = TILE // 2
+    return f'''[gd_resource type="TileSet" load_steps=4 format=3]
+
+[sub_resource type="Gradient" id="bands"]
+interpolation_mode = 1
+offsets = PackedFloat32Array(0, 0.333333, 0.666667)
+colors = PackedColorArray({colors})
+
+[sub_resource type="GradientTexture2D" id="atlas_texture"]
+gradient = SubResource("bands")
+width = {TILE * 3}
+height = {TILE}
+
+[sub_resource type="TileSetAtlasSource" id="atlas"]
+texture = SubResource("atlas_texture")
+texture_region_size = Vector2i({TILE}, {TILE})
+{FLOOR}:0/0 = 0
+{FLOOR_ALT}:0/0 = 0
+{WALL}:0/0 = 0
+{WALL}:0/0/physics_layer_0/polygon_0/points = PackedVector2Array(-{half}, -{half}, {half}, -{half}, {half}, {half}, -{half}, {half})
+
+[resource]
+tile_size = Vector2i({TILE}, {TILE})
+physics_layer_0/collision_layer = 1
+sources/0 = SubResource("atlas")
+'''
+
+
+def _corridor(a: tuple[int, int], b: tuple[int, int], horizontal_first: bool) -> set[tuple[int, int]]:
+    """L-shaped CORRIDOR_WIDTH-wide run of tiles from *a* to *b*."""
+    corner = (b[0], a[1]) if horizontal_first else (a[0], b[1])
+    tiles = set()
+    for (x0, y0), (x1, y1) in ((a, corner), (corner, b)):
+        for x in range(min(x0, x1) - 1, max(x0, x1) + CORRIDOR_WIDTH - 1):
+            for y in range(min(y0, y1) - 1, max(y0, y1) + CORRIDOR_WIDTH - 1):
+                tiles.add((x, y))
+    return tiles
+
+
+def _hops(count: int, edges: list[tuple[int, int]], start: int) -> list[int]:
+    neighbours: list[list[int]] = [[] for _ in range(count)]
+    for a, b in edges:
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+    hops = [-1] * count
+    hops[start] = 0
+    queue = deque([start])
+    while queue:
+        i = queue.popleft()
+        for j in neighbours[i]:
+            if hops[j] < 0:
+                hops[j] = hops[i] + 1
+                queue.append(j)
+    return hops
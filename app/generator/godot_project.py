@@ -3,22 +3,41 @@
 from __future__ import annotations
 
 from pathlib import Path
-from app.models import GameSpec, MultiplayerMode
+from app.models import GameSpec, Genre, MultiplayerMode, Quality
+
+
+# Every autoload a generated project can register, name -> script path
+AUTOLOADS = {
+    "GameManager": "res://scripts/autoload/game_manager.gd",
+    "LevelManager": "res://scripts/autoload/level_manager.gd",
+    "SpriteGenerator": "res://scripts/autoload/sprite_generator.gd",
+    "InputConfig": "res://scripts/autoload/input_config.gd",
+    "ScreenEffects": "res://scripts/autoload/screen_effects.gd",
+    "NetworkManager": "res://scripts/autoload/network_manager.gd",
+    "AIDirector": "res://scripts/autoload/ai_director.gd",
+    "PerfMonitor": "res://scripts/autoload/perf_monitor.gd",
+}
+
+
+def autoload_names(spec: GameSpec) -> list[str]:
+    """Autoloads this spec's templates write a script for."""
+    names = ["GameManager", "LevelManager", "SpriteGenerator", "InputConfig"]
+    if spec.genre == Genre.PLATFORMER:
+        names.append("ScreenEffects")
+    if spec.genre == Genre.TOPDOWN:
+        names.append("AIDirector")
+    if spec.multiplayer != MultiplayerMode.NONE:
+        names.append("NetworkManager")
+    # Only when asked for: a fixed high tier without the overlay is the game as-is
+    if spec.quality != Quality.HIGH or spec.perf_overlay:
+        names.append("PerfMonitor")
+    return names
 
 
 def write_project_file(project_dir: Path, spec: GameSpec) -> None:
     desc = (spec.description or f"A {spec.theme} {spec.genre.value} game").replace('"', '')
 
-    autoloads = [
-        'GameManager="*res://scripts/autoload/game_manager.gd"',
-        'LevelManager="*res://scripts/autoload/level_manager.gd"',
-        'SpriteGenerator="*res://scripts/autoload/sprite_generator.gd"',
-        'InputConfig="*res://scripts/autoload/input_config.gd"',
-        'ScreenEffects="*res://scripts/autoload/screen_effects.gd"',
-    ]
-    if spec.multiplayer != MultiplayerMode.NONE:
-        autoloads.append('NetworkManager="*res://scripts/autoload/network_manager.gd"')
-    autoload_section = "\n".join(autoloads)
+    autoload_section = "\n".join(f'{name}="*{AUTOLOADS[name]}"' for name in autoload_names(spec))
 
     content = f"""; Engine configuration file.
 ; Auto-generated by Godot Game Creator
@@ -31,6 +50,7 @@ config/name="{spec.name}"
 config/description="{desc}"
 run/main_scene="res://scenes/main_menu.tscn"
 config/features=PackedStringArray("4.4")
+config/tags=PackedStringArray("{spec.genre.value}")
 
 [autoload]
 
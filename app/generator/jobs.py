@@ -0,0 +1,87 @@
+"""In-process registry of background build jobs.
+
+generate_game returns as soon as the first playable revision is published;
+the remaining work (validation, AI art, the art revision) runs as an
+asyncio task whose progress is exposed through a BuildJob that the client
+polls via /api/jobs/{job_id}.
+
+Cancelling the task does not stop work it has already handed to a thread
+(art downloads, post-processing, atlas packing), so each job also has a
+cancellation event. Threaded work checks it before writing into the
+project, and the job checks it before publishing a revision.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+from typing import Coroutine, Optional
+
+from app.models import BuildJob, BuildStatus
+
+_jobs: dict[str, BuildJob] = {}  # job id -> job, only the newest per game is kept
+_tasks: dict[str, asyncio.Task] = {}  # game name -> running background task
+_latest: dict[str, BuildJob] = {}  # game name -> newest job
+_cancelled: dict[str, threading.Event] = {}  # job id -> set once superseded
+
+
+def create_job(game_name: str, revision: int) -> BuildJob:
+    """Register a new job for *game_name*, superseding and forgetting its previous one."""
+    cancel_game_jobs(game_name)
+    previous = _latest.get(game_name)
+    if previous is not None:
+        _jobs.pop(previous.job_id, None)
+        _cancelled.pop(previous.job_id, None)
+    job = BuildJob(job_id=uuid.uuid4().hex[:12], game_name=game_name, revision=revision)
+    _jobs[job.job_id] = job
+    _latest[game_name] = job
+    _cancelled[job.job_id] = threading.Event()
+    return job
+
+
+def get_job(job_id: str) -> Optional[BuildJob]:
+    return _jobs.get(job_id)
+
+
+def cancel_event(job: BuildJob) -> threading.Event:
+    """Set once *job* is superseded; safe to check from worker threads."""
+    return _cancelled[job.job_id]
+
+
+def cancel_game_jobs(game_name: str) -> None:
+    """Stop the background pass of an earlier build of the same game."""
+    job = _latest.get(game_name)
+    if job is not None:
+        _cancelled[job.job_id].set()
+    task = _tasks.pop(game_name, None)
+    if task and not task.done():
+        task.cancel()
+
+
+def start_job(job: BuildJob, work: Coroutine) -> None:
+    """Run *work* in the background, recording completion or failure on *job*."""
+    cancelled = cancel_event(job)
+
+    async def _run() -> None:
+        try:
+            await work
+            if cancelled.is_set():
+                job.status = BuildStatus.FAILED
+                job.error = "superseded by a newer build"
+            else:
+                job.status = BuildStatus.COMPLETE
+        except asyncio.CancelledError:
+            job.status = BuildStatus.FAILED
+            job.error = "superseded by a newer build"
+            raise
+        except Exception as e:
+            print(f"[build] Background job {job.job_id} failed: {e}")
+            job.status = BuildStatus.FAILED
+            job.error = str(e)
+        finally:
+            if _tasks.get(job.game_name) is task:
+                del _tasks[job.game_name]
+
+    task = asyncio.create_task(_run())
+    _tasks[job.game_name] = task
@@ -0,0 +1,146 @@
+"""Pure-Python Godot .pck export for generated projects.
+
+A stock Godot 4.4 runtime plays the result directly::
+
+    godot --main-pack MyGame.pck
+
+so a player downloads one file instead of the project tree, and the engine
+starts without scanning the project or importing its assets. The archive
+is laid out like the editor's own export: a header, a directory of res://
+paths with each file's offset, size and MD5, then the file data with every
+file aligned to ALIGNMENT bytes.
+
+Scripts, scenes, .tres, shaders and JSON are packed as they are; Godot
+loads their text forms at runtime. A PNG is packed the way the texture
+importer leaves it for an export: a .ctex CompressedTexture2D wrapping the
+lossless PNG, plus the .import remap that points the original path at it.
+Installers, launchers and editor state are left out.
+
+Packs are built from file contents, not a directory, so a published
+revision's ZIP can be packed without extracting it::
+
+    data = pack_files({"project.godot": ..., "scripts/player.gd": ...})
+
+Run ``python -m app.generator.pck_packer <project_dir>`` to pack a project.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections.abc import Mapping
+from pathlib import Path, PurePosixPath
+
+PACK_MAGIC = b"GDPC"
+PACK_FORMAT_VERSION = 2    # Godot 4.0 to 4.4
+ENGINE_VERSION = (4, 4, 0)  # oldest runtime that accepts the pack
+ALIGNMENT = 16
+PACK_RESERVED_WORDS = 16
+
+TEXTURE_SUFFIXES = (".png",)
+# Launchers, installers and editor state; the runtime never reads them
+SKIPPED_SUFFIXES = (".import", ".uid", ".pck", ".exe", ".bat", ".sh", ".command", ".pyw", ".txt")
+SKIPPED_NAMES = {"setup"}
+SKIPPED_DIRS = (".godot/",)
+
+CTEX_FORMAT_VERSION = 1
+CTEX_DATA_FORMAT_PNG = 1
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def pack_files(files: Mapping[str, bytes]) -> bytes:
+    """A .pck holding *files* (project-relative path -> contents), textures imported."""
+    entries: dict[str, bytes] = {}
+    for rel_path, data in sorted(files.items()):
+        if _skipped(rel_path):
+            continue
+        if rel_path.lower().endswith(TEXTURE_SUFFIXES):
+            entries.update(texture_entries(rel_path, data))
+        else:
+            entries[rel_path] = data
+    return _write_pack(entries)
+
+
+def pack_project(project_dir: Path) -> bytes:
+    """A .pck of the project tree at *project_dir*."""
+    return pack_files({
+        path.relative_to(project_dir).as_posix(): path.read_bytes()
+        for path in project_dir.rglob("*") if path.is_file()
+    })
+
+
+def texture_entries(rel_path: str, png: bytes) -> dict[str, bytes]:
+    """The imported form of the PNG at *rel_path*: its .import remap and .ctex."""
+    width, height = _png_size(png)
+    ctex_path = f".godot/imported/{PurePosixPath(rel_path).name}-{hashlib.md5(rel_path.encode()).hexdigest()}.ctex"
+    # GST2 header: version, size, format flags, mipmap limit (-1: none), 3 reserved
+    ctex = struct.pack("<4sIIIIiIII", b"GST2", CTEX_FORMAT_VERSION, width, height, 0, -1, 0, 0, 0)
+    # One lossless image, no mipmaps. The format field is overridden by the
+    # decoded PNG's own, so RGBA8 (5) stands in for whatever it holds.
+    ctex += struct.pack("<IHHII", CTEX_DATA_FORMAT_PNG, width, height, 0, 5)
+    ctex += struct.pack("<I", len(png)) + png
+    remap = (
+        "[remap]\n\n"
+        'importer="texture"\n'
+        'type="CompressedTexture2D"\n'
+        f'path="res://{ctex_path}"\n'
+    )
+    return {f"{rel_path}.import": remap.encode(), ctex_path: ctex}
+
+
+def _write_pack(entries: dict[str, bytes]) -> bytes:
+    directory = bytearray()
+    offset = 0
+    for rel_path, data in entries.items():
+        name = f"res://{rel_path}".encode()
+        name += b"\0" * _padding(len(name), 4)
+        directory += struct.pack("<I", len(name)) + name
+        directory += struct.pack("<QQ", offset, len(data)) + hashlib.md5(data).digest()
+        directory += struct.pack("<I", 0)  # flags: not encrypted
+        offset += len(data) + _padding(len(data), ALIGNMENT)
+
+    header_size = len(PACK_MAGIC) + 4 * 5 + 8 + 4 * PACK_RESERVED_WORDS + 4
+    file_base = header_size + len(directory)
+    file_base += _padding(file_base, ALIGNMENT)
+    out = bytearray(PACK_MAGIC)
+    out += struct.pack("<IIIII", PACK_FORMAT_VERSION, *ENGINE_VERSION, 0)  # pack flags: file_base is absolute
+    out += struct.pack("<Q", file_base)
+    out += bytes(4 * PACK_RESERVED_WORDS)
+    out += struct.pack("<I", len(entries))
+    out += directory
+    out += bytes(file_base - len(out))
+    for data in entries.values():
+        out += data
+        out += bytes(_padding(len(data), ALIGNMENT))
+    return bytes(out)
+
+
+def _padding(size: int, alignment: int) -> int:
+    return -size % alignment
+
+
+def _skipped(rel_path: str) -> bool:
+    return (
+        rel_path.startswith(SKIPPED_DIRS)
+        or rel_path.endswith(SKIPPED_SUFFIXES)
+        or rel_path in SKIPPED_NAMES
+    )
+
+
+def _png_size(png: bytes) -> tuple[int, int]:
+    if not png.startswith(_PNG_SIGNATURE) or png[12:16] != b"IHDR":
+        raise ValueError("not a PNG file")
+    return struct.unpack(">II", png[16:24])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pack a generated Godot project into a .pck.")
+    parser.add_argument("project", type=Path, help="generated project directory")
+    parser.add_argument("-o", "--output", type=Path, help="default: <project>/<project name>.pck")
+    args = parser.parse_args()
+    output = args.output or args.project / f"{args.project.name}.pck"
+    data = pack_project(args.project)
+    output.write_bytes(data)
+    print(f"{output}: {len(data)} bytes")
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
+import threading
 from pathlib import Path
+from typing import Callable
 
 from app.config import GENERATED_GAMES_DIR
-from app.models import GameSpec, Genre
-from app.generator.godot_project import write_project_file
+from app.models import BuildJob, GameSpec, Genre
+from app.generator.godot_project import AUTOLOADS, write_project_file
 from app.generator.installer_builder import generate_installers
+from app.generator.jobs import cancel_event, cancel_game_jobs, create_job, start_job
+from app.generator.revisions import clear_revisions, publish_revision
+from app.generator.templates.base import BaseTemplate
 from app.generator.templates.platformer import PlatformerTemplate
 from app.generator.templates.topdown import TopdownTemplate
 from app.generator.templates.shooter import ShooterTemplate
@@ -16,6 +22,8 @@ from app.generator.templates.puzzle import PuzzleTemplate
 from app.generator.templates.visual_novel import VisualNovelTemplate
 from app.generator.templates.racing import RacingTemplate
 from app.art.art_generator import GameArtGenerator
+from app.art.atlas import pack_atlases
+from app.mcp.godot_mcp import check_scripts, validate_project
 
 _TEMPLATE_MAP = {
     Genre.PLATFORMER: PlatformerTemplate,
@@ -26,45 +34,121 @@ _TEMPLATE_MAP = {
     Genre.RACING: RacingTemplate,
 }
 
+_build_locks: dict[str, asyncio.Lock] = {}  # game name -> held while its project is rebuilt
+
 
 async def generate_game(spec: GameSpec) -> dict:
+    """Build the project and publish a playable procedural-art revision.
+
+    Templates and installers are rendered straight away against the
+    procedural SpriteGenerator art and frozen as revision 1, which is
+    returned immediately. Validation and the (slow, network bound) AI art
+    pass continue as a background job; once art has arrived it is patched
+    into the project and published as the next revision.
+    """
     safe_name = spec.name.replace(" ", "_")
     project_dir = GENERATED_GAMES_DIR / safe_name
-    if project_dir.exists():
-        shutil.rmtree(project_dir)
-    project_dir.mkdir(parents=True)
+    # A rebuild of the same game waits here instead of deleting the project under us
+    async with _build_locks.setdefault(safe_name, asyncio.Lock()):
+        cancel_game_jobs(safe_name)
+        if project_dir.exists():
+            shutil.rmtree(project_dir)
+        clear_revisions(safe_name)
+        project_dir.mkdir(parents=True)
+
+        for sub in ("scenes", "scripts", "assets", "ui"):
+            (project_dir / sub).mkdir()
+
+        write_project_file(project_dir, spec)
 
-    for sub in ("scenes", "scripts", "assets", "ui"):
-        (project_dir / sub).mkdir()
+        template_cls = _TEMPLATE_MAP.get(spec.genre, PlatformerTemplate)
+        template = template_cls(spec, project_dir)
+        # Level baking takes seconds for big games; keep the event loop serving requests
+        await asyncio.to_thread(template.generate)
+        generate_installers(project_dir, spec)
 
-    write_project_file(project_dir, spec)
+        manifest = await asyncio.to_thread(publish_revision, project_dir)
+        job = create_job(safe_name, revision=manifest["revision"])
+        start_job(job, _finish_build(job, spec, template, cancel_event(job)))
 
-    # Try AI art generation (Pollinations.ai — free, no key)
+    return {
+        "project_dir": str(project_dir),
+        "name": spec.name,
+        "genre": spec.genre.value,
+        "revision": manifest["revision"],
+        "job_id": job.job_id,
+    }
+
+
+async def _finish_build(job: BuildJob, spec: GameSpec, template: BaseTemplate,
+                        cancelled: threading.Event) -> None:
+    """Validate and fetch AI art concurrently, atlas the art, then publish the art revision.
+
+    Once a newer build of the game sets *cancelled*, nothing more is written
+    into the project, not even by art work already running in a thread.
+    """
+    # AI art generation (AI Horde — free, no key)
     art_gen = GameArtGenerator(
-        project_dir / "assets",
+        template.dir / "assets",
         theme=spec.theme,
         art_style=spec.art_style,
         genre=spec.genre.value,
     )
-    art_results = {}
-    try:
-        art_results = await art_gen.generate_all(spec)
-        art_count = sum(1 for v in art_results.values() if v)
-        print(f"[art] Generated {art_count}/{len(art_results)} AI art assets")
-    except Exception as e:
-        print(f"[art] AI art generation failed ({e}), using procedural fallback")
+    job.art_total = len(art_gen.asset_names(spec))
 
-    template_cls = _TEMPLATE_MAP.get(spec.genre, PlatformerTemplate)
-    template = template_cls(spec, project_dir)
-    template.has_ai_art = any(art_results.values())
-    template.art_results = art_results
-    template.generate()
+    def _on_art(name: str, ok: bool) -> None:
+        if cancelled.is_set():
+            return
+        template.patch_art(name, ok)
+        job.art_done += 1
 
-    generate_installers(project_dir, spec)
+    async def _validate() -> None:
+        job.preview_log = await validate_project(str(template.dir))
 
-    return {
-        "project_dir": str(project_dir),
-        "name": spec.name,
-        "genre": spec.genre.value,
-        "ai_art_count": sum(1 for v in art_results.values() if v),
-    }
+    _, art_results = await asyncio.gather(
+        _validate(), _generate_art(art_gen, spec, _on_art, cancelled),
+    )
+
+    job.ai_art_count = sum(1 for v in art_results.values() if v)
+    if job.ai_art_count:
+        sprites = [n for n, ok in art_results.items() if ok and not n.startswith("background")]
+        characters = [n for n in sprites if n.startswith(("player", "enemy"))]
+        regions = await asyncio.to_thread(
+            pack_atlases, template.dir / "assets", sprites, characters, cancelled,
+        )
+        if cancelled.is_set():
+            return
+        if regions:
+            template.patch_atlas(regions)
+        # Validation may have run before the art was patched into the autoload
+        job.preview_log = (job.preview_log or "") + await _recheck_sprite_generator(template.dir)
+        # Under the build lock, a rebuild can't clear the revisions mid-publish
+        async with _build_locks.setdefault(job.game_name, asyncio.Lock()):
+            if cancelled.is_set():
+                return
+            manifest = await asyncio.to_thread(publish_revision, template.dir)
+        job.revision = manifest["revision"]
+        job.changed_files = manifest["changed"]
+
+
+async def _recheck_sprite_generator(project_dir: Path) -> str:
+    """Check the art-patched SpriteGenerator autoload again; returns lines for the log."""
+    rel = AUTOLOADS["SpriteGenerator"].removeprefix("res://")
+    entry = (await check_scripts(project_dir, [rel]))["files"][rel]
+    lines = [f"\nRe-checked {rel} after the AI art pass"]
+    lines.extend(f"{rel}:{d['line']}: {d['severity']}: {d['message']}" for d in entry["diagnostics"])
+    lines.append("✓ Art patch validated" if entry["ok"] else "✗ Art patch has errors")
+    return "\n".join(lines)
+
+
+async def _generate_art(art_gen: GameArtGenerator, spec: GameSpec,
+                        on_result: Callable[[str, bool], None],
+                        cancelled: threading.Event) -> dict[str, bool]:
+    try:
+        art_results = await art_gen.generate_all(spec, on_result=on_result, cancelled=cancelled)
+    except Exception as e:
+        print(f"[art] AI art generation failed ({e}), using procedural fallback")
+        return {}
+    art_count = sum(1 for v in art_results.values() if v)
+    print(f"[art] Generated {art_count}/{len(art_results)} AI art assets")
+    return art_results
@@ -0,0 +1,231 @@
+"""Build-time board generator for puzzle levels.
+
+A random runtime fill can leave a level unwinnable or trivial, so this
+module deals the board while the project is generated. It draws one to
+four thousand seeded candidate boards (fewer as the grid grows), plays
+each one out greedily (always clearing the largest group) in one batch
+with vectorized connected-component labelling, keeps the boards that
+reach the level's score target and picks the one whose move count is
+closest to the median.
+
+Cleared columns refill from per-column colour queues stored with the
+board rather than from randi(), so the greedy playthrough is exactly what
+the game would do and the target is provably reachable. The level's move
+limit is that playthrough plus a difficulty-dependent slack.
+
+Boards depend on nothing but (level_seed, cols, rows, colors, target,
+difficulty)::
+
+    board = bake_board(3042, 10, 10, 6, 400, "normal")
+    board.moves, board.move_limit
+
+Run ``python -m app.generator.puzzle_baker`` to time a full set of levels.
+
+Layout written into the project::
+
+    levels/level_<n>.tres       PuzzleBoard for scenes/level_<n>.tscn
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Candidate boards per level: as many as CANDIDATE_TILES tiles, within these bounds
+CANDIDATE_TILES = 2048 * 100
+MIN_CANDIDATES, MAX_CANDIDATES = 1024, 4096
+REFILL_LENGTH = 64    # colours queued per column; the game cycles through them
+POINTS_PER_TILE = 5   # mirrors puzzle_grid.gd
+MAX_MOVES = 200
+MOVE_SLACK = {"easy": 0.6, "normal": 0.3, "hard": 0.1}
+# Seconds one level's board may take to bake
+BUILD_BUDGET = 2.5
+
+
+@dataclass
+class PuzzleBoard:
+    """A solvable board: starting colours, refill queues and its greedy solution length."""
+
+    cells: np.ndarray     # (rows, cols) uint8 colour index
+    refills: np.ndarray   # (cols, REFILL_LENGTH) uint8 colour index
+    moves: int            # greedy clicks needed to reach the target
+    move_limit: int
+
+
+def label_components(boards: np.ndarray) -> np.ndarray:
+    """Connected same-colour groups of a batch of boards, 4-neighbour.
+
+    *boards* is (n, rows, cols); returns the same shape holding, for each
+    tile, the flat index into the whole batch of the first tile of its
+    group. Union-find over the equal-colour edges, all at once: each round
+    hooks the larger root of every edge that still spans two groups onto
+    the smaller and then compresses paths by pointer jumping, so the number
+    of rounds grows with the log of a group's size rather than its area.
+    """
+    import numpy as np
+
+    idx = np.arange(boards.size, dtype=np.int32).reshape(boards.shape)
+    right = boards[:, :, 1:] == boards[:, :, :-1]
+    down = boards[:, 1:, :] == boards[:, :-1, :]
+    a = np.concatenate([idx[:, :, :-1][right], idx[:, :-1, :][down]])
+    b = np.concatenate([idx[:, :, 1:][right], idx[:, 1:, :][down]])
+    parent = idx.ravel().copy()
+    while len(a):
+        ra, rb = parent.take(a), parent.take(b)
+        split = ra != rb
+        a, b, ra, rb = a[split], b[split], ra[split], rb[split]
+        if not len(a):
+            break
+        np.minimum.at(parent, np.maximum(ra, rb), np.minimum(ra, rb))
+        while True:
+            jumped = parent.take(parent)
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return parent.reshape(boards.shape)
+
+
+def play_greedy(cells: np.ndarray, refills: np.ndarray, target: int,
+                max_moves: int = MAX_MOVES) -> np.ndarray:
+    """Clicks each of a batch of boards needs to reach *target*, clearing the largest group each time.
+
+    *cells* is (n, rows, cols), *refills* (n, cols, REFILL_LENGTH). Boards
+    that get stuck (no group of two) or run past *max_moves* report -1.
+    """
+    import numpy as np
+
+    n, rows, cols = cells.shape
+    size = rows * cols
+    boards = cells.astype(np.int8)
+    queue_pos = np.zeros((n, cols), dtype=np.int64)
+    score = np.zeros(n, dtype=np.int64)
+    result = np.full(n, -1, dtype=np.int64)
+    active = np.arange(n)
+    row_idx = np.arange(rows).reshape(1, rows, 1)
+    for move in range(1, max_moves + 1):
+        labels = label_components(boards)
+        counts = np.bincount(labels.ravel(), minlength=labels.size).reshape(-1, size)
+        root = counts.argmax(axis=1)
+        best = counts[np.arange(len(active)), root]
+
+        cleared = labels == (root + np.arange(len(active)) * size).reshape(-1, 1, 1)
+        valid = best >= 2
+        score[active] += np.where(valid, best * POINTS_PER_TILE, 0)
+        done = valid & (score[active] >= target)
+        result[active[done]] = move
+        keep = valid & ~done
+        boards, cleared, active = boards[keep], cleared[keep], active[keep]
+        if not len(active):
+            break
+
+        # Drop the remaining tiles of each column below the cleared ones,
+        # then refill the top: the lowest empty row takes the next colour
+        order = np.argsort(~cleared, axis=1, kind="stable")
+        boards = np.take_along_axis(boards, order, axis=1)
+        gaps = cleared.sum(axis=1)                         # (n, cols)
+        pos = queue_pos[active].reshape(-1, 1, cols) + gaps.reshape(-1, 1, cols) - 1 - row_idx
+        fill = np.take_along_axis(refills[active], (pos % REFILL_LENGTH).transpose(0, 2, 1), axis=2)
+        boards = np.where(row_idx < gaps.reshape(-1, 1, cols), fill.transpose(0, 2, 1), boards)
+        queue_pos[active] += gaps
+    return result
+
+
+def candidate_count(cols: int, rows: int) -> int:
+    """Boards to try for a grid: fewer as they grow, so each level costs about the same."""
+    return max(MIN_CANDIDATES, min(MAX_CANDIDATES, CANDIDATE_TILES // (cols * rows)))
+
+
+def bake_board(level_seed: int, cols: int, rows: int, colors: int, target: int,
+               difficulty: str, candidates: int = 0) -> PuzzleBoard | None:
+    """The candidate whose greedy solution length is nearest the median, or None if none is solvable."""
+    import numpy as np
+
+    candidates = candidates or candidate_count(cols, rows)
+    rng = np.random.default_rng(level_seed)
+    cells = rng.integers(0, colors, (candidates, rows, cols), dtype=np.uint8)
+    refills = rng.integers(0, colors, (candidates, cols, REFILL_LENGTH), dtype=np.uint8)
+    moves = play_greedy(cells, refills, target)
+    solvable = np.flatnonzero(moves > 1)  # a single click to the target is no puzzle
+    if not len(solvable):
+        return None
+    median = np.median(moves[solvable])
+    pick = solvable[np.argmin(np.abs(moves[solvable] - median))]
+    par = int(moves[pick])
+    limit = math.ceil(par * (1.0 + MOVE_SLACK.get(difficulty, MOVE_SLACK["normal"])))
+    return PuzzleBoard(cells[pick], refills[pick], par, max(limit, par + 1))
+
+
+def bake_board_resource(level_seed: int, cols: int, rows: int, colors: int, target: int,
+                        difficulty: str) -> str | None:
+    """PuzzleBoard .tres text for a level, or None when NumPy is missing or no board works.
+
+    Without one the level scene has no board and puzzle_grid.gd fills the
+    grid at random with no move limit.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("[puzzle] NumPy not installed, boards will be dealt at runtime")
+        return None
+    board = bake_board(level_seed, cols, rows, colors, target, difficulty)
+    if board is None:
+        print(f"[puzzle] no solvable {cols}x{rows} board for target {target}, dealing at runtime")
+        return None
+    return board_resource(board)
+
+
+def board_resource(board: PuzzleBoard) -> str:
+    """PuzzleBoard .tres for *board*."""
+
+    def ints(values) -> str:
+        return ", ".join(str(int(v)) for v in values)
+
+    return f'''[gd_resource type="Resource" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/puzzle_board.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+cells = PackedByteArray({ints(board.cells.ravel())})
+refills = PackedByteArray({ints(board.refills.ravel())})
+par_moves = {board.moves}
+move_limit = {board.move_limit}
+'''
+
+
+def benchmark(levels: int = 10, difficulty: str = "normal", candidates: int = 0) -> list[dict]:
+    """Bake every level of a *levels*-level game and time each against BUILD_BUDGET."""
+    from app.generator.templates.puzzle import level_config
+
+    results = []
+    for level_num in range(1, levels + 1):
+        cols, rows, colors, target = level_config(level_num)
+        count = candidates or candidate_count(cols, rows)
+        start = time.perf_counter()
+        board = bake_board(level_num * 1000 + 42, cols, rows, colors, target, difficulty, count)
+        seconds = time.perf_counter() - start
+        results.append({
+            "level": level_num, "grid": f"{cols}x{rows}", "colors": colors, "target": target,
+            "candidates": count, "seconds": round(seconds, 3), "boards_per_s": round(count / seconds),
+            "moves": board.moves if board else None, "over_budget": seconds > BUILD_BUDGET,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Time puzzle board baking per level.")
+    parser.add_argument("--levels", type=int, default=10)
+    parser.add_argument("--difficulty", default="normal", choices=sorted(MOVE_SLACK))
+    parser.add_argument("--candidates", type=int, default=0, help="boards per level (default: by grid size)")
+    args = parser.parse_args()
+    results = benchmark(args.levels, args.difficulty, args.candidates)
+    print(json.dumps(results, indent=1))
+    raise SystemExit(1 if any(r["over_budget"] for r in results) else 0)
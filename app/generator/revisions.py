@@ -0,0 +1,136 @@
+"""Published revisions of a generated project.
+
+A project is delivered in stages: a playable procedural-art build first,
+then a revision with AI art once the art pass finishes. Each completed
+revision is frozen as a ZIP plus a per-file manifest (sha256 + size), so
+downloads always serve a consistent build while the live project directory
+is still being patched, and a client holding an older revision can download
+just the files that changed as a small delta ZIP.
+A revision's .pck (app.generator.pck_packer) is packed from its ZIP the
+first time it is asked for.
+
+Layout::
+
+    generated_games/.revisions/<game>/r1.zip
+    generated_games/.revisions/<game>/r1.json
+    generated_games/.revisions/<game>/r1.pck
+    generated_games/.revisions/<game>/r2-since-r1.zip
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+from app.config import REVISIONS_DIR
+from app.generator.pck_packer import pack_files
+
+
+def publish_revision(project_dir: Path) -> dict:
+    """Freeze the current project tree as the next revision and return its manifest."""
+    game_dir = REVISIONS_DIR / project_dir.name
+    game_dir.mkdir(parents=True, exist_ok=True)
+
+    previous = latest_manifest(project_dir.name)
+    revision = previous["revision"] + 1 if previous else 1
+
+    files = {}
+    for path in sorted(project_dir.rglob("*")):
+        if path.is_file():
+            data = path.read_bytes()
+            files[path.relative_to(project_dir).as_posix()] = {
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+            }
+
+    archive = shutil.make_archive(str(game_dir / f"r{revision}.tmp"), "zip", str(project_dir))
+    Path(archive).replace(game_dir / f"r{revision}.zip")
+
+    manifest = {
+        "game": project_dir.name,
+        "revision": revision,
+        "files": files,
+        "changed": changed_files(previous, files),
+    }
+    # Manifest is written last: a revision only counts once it exists.
+    (game_dir / f"r{revision}.json").write_text(json.dumps(manifest, indent=1))
+    return manifest
+
+
+def clear_revisions(game_name: str) -> None:
+    """Drop all published revisions, e.g. when a project is regenerated from scratch."""
+    shutil.rmtree(REVISIONS_DIR / game_name, ignore_errors=True)
+
+
+def load_manifest(game_name: str, revision: int) -> Optional[dict]:
+    path = REVISIONS_DIR / game_name / f"r{revision}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def latest_manifest(game_name: str) -> Optional[dict]:
+    game_dir = REVISIONS_DIR / game_name
+    if not game_dir.exists():
+        return None
+    revisions = [int(p.stem[1:]) for p in game_dir.glob("r*.json") if p.stem[1:].isdigit()]
+    if not revisions:
+        return None
+    return load_manifest(game_name, max(revisions))
+
+
+def revision_zip(game_name: str) -> Optional[Path]:
+    """Path of the newest completed revision's ZIP, or None if nothing is published."""
+    manifest = latest_manifest(game_name)
+    if not manifest:
+        return None
+    return REVISIONS_DIR / game_name / f"r{manifest['revision']}.zip"
+
+
+def revision_pck(game_name: str) -> Optional[Path]:
+    """Path of the newest completed revision packed as a .pck, or None if nothing is published."""
+    archive = revision_zip(game_name)
+    if archive is None:
+        return None
+    pck = archive.with_suffix(".pck")
+    if not pck.exists():
+        with zipfile.ZipFile(archive) as zf:
+            files = {name: zf.read(name) for name in zf.namelist() if not name.endswith("/")}
+        tmp = pck.with_suffix(".pck.tmp")
+        tmp.write_bytes(pack_files(files))
+        tmp.replace(pck)
+    return pck
+
+
+def revision_delta_zip(game_name: str, since: int) -> Optional[Path]:
+    """ZIP of the files the newest revision added or changed since revision *since*.
+
+    Unzipped over a project downloaded at *since*, it brings that project up
+    to date. None if either revision is not published.
+    """
+    manifest = latest_manifest(game_name)
+    old = load_manifest(game_name, since)
+    if manifest is None or old is None:
+        return None
+    archive = REVISIONS_DIR / game_name / f"r{manifest['revision']}.zip"
+    delta = archive.with_name(f"r{manifest['revision']}-since-r{since}.zip")
+    if not delta.exists():
+        tmp = delta.with_suffix(".zip.tmp")
+        with zipfile.ZipFile(archive) as src, zipfile.ZipFile(tmp, "w") as dst:
+            for name in changed_files(old, manifest["files"]):
+                dst.writestr(src.getinfo(name), src.read(name))
+        tmp.replace(delta)
+    return delta
+
+
+def changed_files(old: Optional[dict], new_files: dict) -> list[str]:
+    """Paths that were added or modified relative to the *old* manifest."""
+    old_files = old["files"] if old else {}
+    return sorted(
+        path for path, info in new_files.items()
+        if old_files.get(path, {}).get("sha256") != info["sha256"]
+    )
@@ -1,5 +1,6 @@
 """Base template: shared autoloads, menus, HUD, level management, animation,
-input configuration, and multiplayer networking.
+input configuration, multiplayer networking, and the performance overlay
+with its quality tiers.
 
 All genre templates inherit from this and override generate_game_scenes()
 to produce genre-specific multi-level content.
@@ -10,36 +11,69 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from app.art.sprite_baker import Color, bake_character, godot_color
+from app.generator.godot_project import autoload_names
 from app.models import GameSpec, InputMethod, MultiplayerMode
 
 
 class BaseTemplate(ABC):
+    # Show scenes/loading.tscn when a level is needed before its background
+    # load finishes; without it LevelManager waits on the load instead
+    loading_screen: bool = True
+
     def __init__(self, spec: GameSpec, project_dir: Path) -> None:
         self.spec = spec
         self.dir = project_dir
         self.has_ai_art: bool = False
         self.art_results: dict = {}
+        self.art_paths: dict[str, str] = {}  # art key -> res:// path SpriteGenerator loads
+        self.baked_frames: dict[str, list[tuple[str, Color, Color]]] = {}  # art key -> variants
 
     # ── public entry point ──────────────────────────────────────────────
 
     def generate(self) -> None:
         self._write_game_manager()
         self._write_level_manager()
+        self._bake_sprites()
         self._write_sprite_generator()
         self._write_input_config()
         if self.spec.multiplayer != MultiplayerMode.NONE:
             self._write_network_manager()
+        if "PerfMonitor" in autoload_names(self.spec):
+            self._write_perf_monitor()
         self._write_main_menu()
         self._write_hud()
         self._write_game_over()
         self._write_pause_menu()
         self._write_level_complete()
+        if self.loading_screen:
+            self._write_loading_screen()
         self.generate_game_scenes()
 
+    def patch_art(self, name: str, ok: bool) -> None:
+        """Record one finished AI art asset and re-emit the art references.
+
+        Called as each image arrives, so the rest of the project can be
+        generated up front against the procedural placeholders.
+        """
+        self.art_results[name] = ok
+        self.has_ai_art = any(self.art_results.values())
+        if ok:
+            self.art_paths[name.rsplit(".", 1)[0]] = f"res://assets/{name}"
+            self._write_sprite_generator()
+
+    def patch_atlas(self, regions: dict[str, str]) -> None:
+        """Point art references at packed AtlasTexture regions instead of loose PNGs."""
+        self.art_paths.update(regions)
+        self._write_sprite_generator()
+
     def _write(self, rel_path: str, content: str) -> None:
         p = self.dir / rel_path
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content)
+        # Write then rename: validation reads the project while art is patched in
+        tmp = p.with_name(p.name + ".tmp")
+        tmp.write_text(content)
+        tmp.replace(p)
 
     # ── abstract: genre templates implement these ───────────────────────
 
@@ -48,6 +82,15 @@ class BaseTemplate(ABC):
         """Generate all level scenes and genre-specific assets."""
         ...
 
+    def sprite_characters(self) -> list[tuple[str, str, str, Color, Color]]:
+        """Characters whose SpriteGenerator frames are rendered at build time.
+
+        Each entry is (name, art_key, kind, body, detail) where kind is
+        "platformer" or "topdown" and the colours match what the character's
+        script passes to create_*_frames().
+        """
+        return []
+
     # ── game manager (score, health, state) ─────────────────────────────
 
     def _write_game_manager(self) -> None:
@@ -63,7 +106,7 @@ signal game_over
 
 var color_primary := Color("{pc}")
 var color_secondary := Color("{sc}")
-var color_bg := {self._hex_to_godot_color(bg)}
+var color_bg := Color{self._hex_to_godot_color(bg)}
 
 var score: int = 0:
 \tset(value):
@@ -102,21 +145,40 @@ func go_to_scene(path: String) -> void:
 \tget_tree().paused = false
 \tis_paused = false
 \tget_tree().change_scene_to_file(path)
+
+
+func go_to_packed_scene(scene: PackedScene) -> void:
+\tget_tree().paused = false
+\tis_paused = false
+\tget_tree().change_scene_to_packed(scene)
 ''')
 
     # ── level manager (multi-level progression) ─────────────────────────
 
     def _write_level_manager(self) -> None:
         n = self.spec.level_count
+        loading = "res://scenes/loading.tscn" if self.loading_screen else ""
         self._write("scripts/autoload/level_manager.gd", f'''extends Node
 ## Manages multi-level progression and scene transitions.
+##
+## Levels load on a background thread ahead of time: the first while the
+## main menu is up, each next one while the current one is played, so
+## moving on is usually instant. A level that is still loading when it is
+## needed is shown through LOADING_SCENE, or waited on if there is none.
 
 signal level_changed(level_index: int)
 
 const LEVEL_SCENES: Array[String] = {self._level_scene_array(n)}
 const TOTAL_LEVELS: int = {n}
+const LOADING_SCENE: String = "{loading}"
 
 var current_level: int = 0
+## The level scene last entered, kept so restarts don't load it again
+var _loaded := {{}}
+
+
+func _ready() -> void:
+\tpreload_level(0)
 
 
 func reset() -> void:
@@ -138,11 +200,56 @@ func advance_level() -> void:
 
 
 func go_to_current_level() -> void:
-\tGameManager.go_to_scene(get_current_scene())
+\tvar path := get_current_scene()
+\tpreload_level(current_level)
+\tif LOADING_SCENE == "" or is_loaded(path):
+\t\t_enter(path)
+\telse:
+\t\tGameManager.go_to_scene(LOADING_SCENE)
 
 
 func restart_level() -> void:
-\tGameManager.go_to_scene(get_current_scene())
+\tgo_to_current_level()
+
+
+## Start loading level *index* in the background unless it already is.
+func preload_level(index: int) -> void:
+\tif index < 0 or index >= TOTAL_LEVELS:
+\t\treturn
+\tvar path := LEVEL_SCENES[index]
+\tif _loaded.has(path) or ResourceLoader.load_threaded_get_status(path) != ResourceLoader.THREAD_LOAD_INVALID_RESOURCE:
+\t\treturn
+\tResourceLoader.load_threaded_request(path, "PackedScene", true)
+
+
+## Whether the level at *path* can be entered without waiting.
+func is_loaded(path: String) -> bool:
+\treturn _loaded.has(path) or ResourceLoader.load_threaded_get_status(path) != ResourceLoader.THREAD_LOAD_IN_PROGRESS
+
+
+## Fraction of the level at *path* loaded so far.
+func load_progress(path: String) -> float:
+\tif _loaded.has(path):
+\t\treturn 1.0
+\tvar progress := []
+\tif ResourceLoader.load_threaded_get_status(path, progress) != ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+\t\treturn 1.0
+\treturn progress[0]
+
+
+func _enter(path: String) -> void:
+\tif not _loaded.has(path):
+\t\tvar scene: PackedScene = null
+\t\tvar status := ResourceLoader.load_threaded_get_status(path)
+\t\tif status == ResourceLoader.THREAD_LOAD_IN_PROGRESS or status == ResourceLoader.THREAD_LOAD_LOADED:
+\t\t\t# Blocks only when the level is still loading and there is no loading screen
+\t\t\tscene = ResourceLoader.load_threaded_get(path) as PackedScene
+\t\tif scene == null:
+\t\t\tGameManager.go_to_scene(path)
+\t\t\treturn
+\t\t_loaded = {{path: scene}}
+\tGameManager.go_to_packed_scene(_loaded[path])
+\tpreload_level(LEVEL_SCENES.find(path) + 1)
 ''')
 
     def _level_scene_array(self, n: int) -> str:
@@ -151,18 +258,81 @@ func restart_level() -> void:
 
     # ── procedural sprite animation generator ───────────────────────────
 
+    def _bake_sprites(self) -> None:
+        self.baked_frames = {}
+        for name, art_key, kind, body, detail in self.sprite_characters():
+            path = bake_character(self.dir / "assets", name, kind, body, detail)
+            if path:
+                self.baked_frames.setdefault(art_key, []).append((path, body, detail))
+
     def _write_sprite_generator(self) -> None:
-        self._write("scripts/autoload/sprite_generator.gd", '''extends Node
+        header = f'''extends Node
 ## Generates character sprite animations.
-## If AI-generated art exists in assets/, loads those PNGs.
-## Otherwise creates basic colored shape sprites as fallback.
+## If AI-generated art exists in assets/, loads it (atlas regions once packed).
+## Otherwise uses the shape sprites pre-rendered at build time, drawing them
+## here only for colours that were not baked.
 
 const FRAME_SIZE := Vector2i(48, 64)
 const TOPDOWN_SIZE := Vector2i(48, 48)
 
+## AI art that finished generating — patched in as each image arrives.
+## "<key>_left" entries are pre-mirrored copies packed into the atlas.
+const AI_ART := {self._art_table()}
 
-func create_platformer_frames(body_color: Color, detail_color: Color) -> SpriteFrames:
+## Animation action -> AI art pose suffix.
+const ART_POSES := {{
+\t"idle": "idle", "run": "run", "walk": "run",
+\t"jump": "jump", "fall": "jump", "attack": "attack",
+}}
+
+## Procedural frames rendered at build time: art key -> [[SpriteFrames path, body, detail]].
+const BAKED_FRAMES := {self._baked_table()}
+
+## Characters built by warm_up(): [kind, art key, body, detail].
+const WARM_UP := {self._warm_up_table()}
+
+## SpriteFrames per kind / art key / colours — every instance of a character shares one.
+var _frames_cache := {{}}
+## Generated textures (drawn frames, resized or mirrored AI art) by image content.
+var _texture_cache := {{}}
+'''
+        self._write("scripts/autoload/sprite_generator.gd", header + '''
+
+func create_platformer_frames(body_color: Color, detail_color: Color, art_key: String = "") -> SpriteFrames:
+\t"""Return the platformer character animations for these colours, built on first use."""
+\tvar key := _frames_key("platformer", art_key, body_color, detail_color)
+\tif not _frames_cache.has(key):
+\t\t_frames_cache[key] = _build_platformer_frames(body_color, detail_color, art_key)
+\treturn _frames_cache[key]
+
+
+func create_topdown_frames(body_color: Color, detail_color: Color, art_key: String = "") -> SpriteFrames:
+\t"""Return the 4-directional top-down animations for these colours, built on first use."""
+\tvar key := _frames_key("topdown", art_key, body_color, detail_color)
+\tif not _frames_cache.has(key):
+\t\t_frames_cache[key] = _build_topdown_frames(body_color, detail_color, art_key)
+\treturn _frames_cache[key]
+
+
+func warm_up() -> void:
+\t"""Build every known character's frames ahead of play, one per idle frame."""
+\tfor entry: Array in WARM_UP:
+\t\tif entry[0] == "topdown":
+\t\t\tcreate_topdown_frames(entry[2], entry[3], entry[1])
+\t\telse:
+\t\t\tcreate_platformer_frames(entry[2], entry[3], entry[1])
+\t\tawait get_tree().process_frame
+
+
+func _frames_key(kind: String, art_key: String, body: Color, detail: Color) -> String:
+\treturn "%s|%s|%s|%s" % [kind, art_key, body.to_html(), detail.to_html()]
+
+
+func _build_platformer_frames(body_color: Color, detail_color: Color, art_key: String) -> SpriteFrames:
 \t"""Create a full set of platformer character animations."""
+\tvar baked := _load_baked(art_key, body_color, detail_color)
+\tif baked and not _has_art(art_key):
+\t\treturn baked
 \tvar sf := SpriteFrames.new()
 \tsf.remove_animation("default")
 
@@ -186,15 +356,25 @@ func create_platformer_frames(body_color: Color, detail_color: Color) -> SpriteF
 \t\tsf.set_animation_loop(anim_name, info[&"loop"])
 \t\tvar facing_left: bool = anim_name.ends_with("_left")
 \t\tvar base_name: String = anim_name.replace("_left", "_right") if facing_left else anim_name
+\t\tvar art := _load_art(art_key, base_name.get_slice("_", 0), FRAME_SIZE, facing_left)
 \t\tfor i in info[&"frames"]:
+\t\t\tif art:
+\t\t\t\tsf.add_frame(anim_name, art)
+\t\t\t\tcontinue
+\t\t\tif baked:
+\t\t\t\tsf.add_frame(anim_name, baked.get_frame_texture(anim_name, i))
+\t\t\t\tcontinue
 \t\t\tvar img := Image.create(FRAME_SIZE.x, FRAME_SIZE.y, false, Image.FORMAT_RGBA8)
 \t\t\t_draw_platformer_frame(img, body_color, detail_color, base_name, i, facing_left)
-\t\t\tsf.add_frame(anim_name, ImageTexture.create_from_image(img))
+\t\t\tsf.add_frame(anim_name, _texture(img))
 \treturn sf
 
 
-func create_topdown_frames(body_color: Color, detail_color: Color) -> SpriteFrames:
+func _build_topdown_frames(body_color: Color, detail_color: Color, art_key: String) -> SpriteFrames:
 \t"""Create 4-directional animations for top-down characters."""
+\tvar baked := _load_baked(art_key, body_color, detail_color)
+\tif baked and not _has_art(art_key):
+\t\treturn baked
 \tvar sf := SpriteFrames.new()
 \tsf.remove_animation("default")
 
@@ -208,13 +388,81 @@ func create_topdown_frames(body_color: Color, detail_color: Color) -> SpriteFram
 \t\t\tvar speed: float = 5.0 if action == "walk" else (6.0 if action == "attack" else 1.0)
 \t\t\tsf.set_animation_speed(anim_name, speed)
 \t\t\tsf.set_animation_loop(anim_name, action != "attack")
+\t\t\tvar art := _load_art(art_key, action, TOPDOWN_SIZE, dir == "left")
 \t\t\tfor i in frame_count:
+\t\t\t\tif art:
+\t\t\t\t\tsf.add_frame(anim_name, art)
+\t\t\t\t\tcontinue
+\t\t\t\tif baked:
+\t\t\t\t\tsf.add_frame(anim_name, baked.get_frame_texture(anim_name, i))
+\t\t\t\t\tcontinue
 \t\t\t\tvar img := Image.create(TOPDOWN_SIZE.x, TOPDOWN_SIZE.y, false, Image.FORMAT_RGBA8)
 \t\t\t\t_draw_topdown_frame(img, body_color, detail_color, action, dir, i)
-\t\t\t\tsf.add_frame(anim_name, ImageTexture.create_from_image(img))
+\t\t\t\tsf.add_frame(anim_name, _texture(img))
 \treturn sf
 
 
+func get_art(key: String) -> Texture2D:
+\t"""Return the AI art texture for *key*, or null if none was generated."""
+\tvar path: String = AI_ART.get(key, "")
+\tif path.is_empty() or not ResourceLoader.exists(path):
+\t\treturn null
+\treturn load(path)
+
+
+func _has_art(art_key: String) -> bool:
+\tif art_key.is_empty():
+\t\treturn false
+\tfor key: String in AI_ART:
+\t\tif key == art_key or key.begins_with(art_key + "_"):
+\t\t\treturn true
+\treturn false
+
+
+func _load_baked(art_key: String, body: Color, detail: Color) -> SpriteFrames:
+\t"""Return the build-time frames for this character and colours, or null to draw them."""
+\tfor entry: Array in BAKED_FRAMES.get(art_key, []):
+\t\tif _same_color(entry[1], body) and _same_color(entry[2], detail) and ResourceLoader.exists(entry[0]):
+\t\t\treturn load(entry[0])
+\treturn null
+
+
+func _same_color(a: Color, b: Color) -> bool:
+\treturn absf(a.r - b.r) + absf(a.g - b.g) + absf(a.b - b.b) + absf(a.a - b.a) < 0.01
+
+
+func _load_art(art_key: String, action: String, size: Vector2i, flip: bool) -> Texture2D:
+\t"""Return the AI art frame for *art_key* / *action*, or null to draw procedurally."""
+\tif art_key.is_empty():
+\t\treturn null
+\tvar key: String = art_key + "_" + ART_POSES.get(action, action)
+\tif not AI_ART.has(key):
+\t\tkey = art_key
+\tvar tex := get_art(key + "_left") if flip else null
+\tif tex:
+\t\tflip = false
+\telse:
+\t\ttex = get_art(key)
+\tif tex == null:
+\t\treturn null
+\tif not flip and Vector2i(tex.get_size()) == size:
+\t\treturn tex
+\tvar img: Image = tex.get_image()
+\tif img.get_size() != size:
+\t\timg.resize(size.x, size.y)
+\tif flip:
+\t\timg.flip_x()
+\treturn _texture(img)
+
+
+func _texture(img: Image) -> Texture2D:
+\t"""Share one ImageTexture between identical images."""
+\tvar key := hash([img.get_size(), img.get_data()])
+\tif not _texture_cache.has(key):
+\t\t_texture_cache[key] = ImageTexture.create_from_image(img)
+\treturn _texture_cache[key]
+
+
 func _draw_platformer_frame(img: Image, body: Color, detail: Color, anim: String, frame: int, flip: bool) -> void:
 \tvar w := img.get_width()
 \tvar h := img.get_height()
@@ -345,6 +593,112 @@ func _draw_topdown_frame(img: Image, body: Color, detail: Color, action: String,
 \t\t\tvar py := cy + arm_dir.y + (arm_dir.y * i / 3)
 \t\t\tif px >= 0 and px < w and py >= 0 and py < h:
 \t\t\t\timg.set_pixel(px, py, detail)
+''')
+
+    def _baked_table(self) -> str:
+        entries = []
+        for key, variants in sorted(self.baked_frames.items()):
+            rows = ", ".join(
+                f'["{path}", {godot_color(body)}, {godot_color(detail)}]' for path, body, detail in variants
+            )
+            entries.append(f'\t"{key}": [{rows}],')
+        if not entries:
+            return "{}"
+        return "{\n" + "\n".join(entries) + "\n}"
+
+    def _warm_up_table(self) -> str:
+        entries = [
+            f'\t["{kind}", "{art_key}", {godot_color(body)}, {godot_color(detail)}],'
+            for _, art_key, kind, body, detail in self.sprite_characters()
+        ]
+        if not entries:
+            return "[]"
+        return "[\n" + "\n".join(entries) + "\n]"
+
+    def _art_table(self) -> str:
+        entries = [f'\t"{key}": "{path}",' for key, path in sorted(self.art_paths.items())]
+        if not entries:
+            return "{}"
+        return "{\n" + "\n".join(entries) + "\n}"
+
+    # ── object pool (shared by templates that recycle scenes) ───────────
+
+    def _write_object_pool(self) -> None:
+        self._write("scripts/object_pool.gd", '''extends Node2D
+## Pre-instantiated pool of one scene (its root must be a CanvasItem).
+##
+## Instances are children of the pool and move with it: leave it at the
+## origin for free-moving objects, or put it under a scrolling node to
+## carry everything it hands out with one transform.
+##
+## The level scene sets `scene` and `size`; every instance is created up
+## front and parked (hidden, processing and physics disabled). acquire()
+## hands one out; release() parks it again. When all instances are in use
+## acquire() instantiates another and counts it in `misses`, which is also
+## published as the "pools/<node name>_misses" Performance monitor.
+##
+## A pooled scene gets a `pool` property set to this node if it declares
+## one, and is expected to call pool.release(self) instead of queue_free().
+
+@export var scene: PackedScene
+@export var size := 16
+
+var misses := 0
+var _free: Array[CanvasItem] = []
+var _parked := {}  # node -> true while parked or being parked
+var _monitor := ""
+
+
+func _ready() -> void:
+\tfor i in size:
+\t\t_free.append(_create())
+\t_monitor = "pools/%s_misses" % name
+\tif not Performance.has_custom_monitor(_monitor):
+\t\tPerformance.add_custom_monitor(_monitor, func() -> int: return misses)
+
+
+func _exit_tree() -> void:
+\tif Performance.has_custom_monitor(_monitor):
+\t\tPerformance.remove_custom_monitor(_monitor)
+
+
+func acquire() -> CanvasItem:
+\tvar node: CanvasItem
+\tif _free.is_empty():
+\t\tmisses += 1
+\t\tnode = _create()
+\telse:
+\t\tnode = _free.pop_back()
+\t_parked.erase(node)
+\tnode.process_mode = Node.PROCESS_MODE_INHERIT
+\tnode.show()
+\treturn node
+
+
+func release(node: CanvasItem) -> void:
+\tif _parked.has(node):
+\t\treturn
+\t_parked[node] = true
+\tnode.hide()
+\t# Releases usually come from physics callbacks, where collision objects
+\t# can't leave the space yet
+\t_park.call_deferred(node)
+
+
+func _create() -> CanvasItem:
+\tvar node := scene.instantiate() as CanvasItem
+\tif "pool" in node:
+\t\tnode.set("pool", self)
+\t_parked[node] = true
+\tnode.hide()
+\tnode.process_mode = Node.PROCESS_MODE_DISABLED
+\tadd_child(node)
+\treturn node
+
+
+func _park(node: CanvasItem) -> void:
+\tnode.process_mode = Node.PROCESS_MODE_DISABLED
+\t_free.append(node)
 ''')
 
     # ── input configuration ─────────────────────────────────────────────
@@ -409,6 +763,17 @@ func _add_joypad_mappings() -> void:
         mode = self.spec.multiplayer
         self._write("scripts/autoload/network_manager.gd", f'''extends Node
 ## Multiplayer networking using Godot's high-level ENet multiplayer.
+##
+## Besides the lobby, this keeps tracked nodes and shared game state in sync
+## at a fixed tick. The host is authoritative: every tick it sends each
+## client a snapshot holding only what changed since the last snapshot that
+## client acknowledged, within the client's bandwidth budget. Clients send
+## the transforms of the nodes they own to the host and draw everything else
+## INTERP_DELAY behind, interpolated between the snapshots either side.
+##
+##     NetworkManager.track($Player, multiplayer.get_unique_id())
+##     NetworkManager.set_bandwidth_budget(peer_id, 8192)
+##     NetworkManager.get_stats(peer_id)  # {{"bytes_per_s": ..., "latency_ms": ...}}
 
 signal player_connected(peer_id: int)
 signal player_disconnected(peer_id: int)
@@ -419,17 +784,42 @@ const DEFAULT_PORT: int = 28960
 const MAX_PLAYERS: int = 8
 const MODE: String = "{mode.value}"
 
+## Snapshots per second
+const TICK_RATE: int = 20
+## How far behind the newest snapshot remote nodes are drawn, in seconds
+const INTERP_DELAY: float = 0.1
+## Bytes per second a client receives unless set_bandwidth_budget() says otherwise
+const DEFAULT_BUDGET: int = 16384
+## Snapshots kept to delta against; older acknowledgements get a full snapshot
+const HISTORY: int = 32
+const ROTATION_SCALE: float = 32767.0 / PI
+
 var players: Dictionary = {{}}
 var my_info: Dictionary = {{"name": "Player"}}
+## Game state replicated from the host; "score" mirrors GameManager.score
+var shared_state: Dictionary = {{}}
 
 var peer: ENetMultiplayerPeer = null
 
+var _tracked := {{}}     # entity id -> {{"node": Node2D, "owner": peer id}}
+var _samples := {{}}     # entity id -> [[msec received, Vector3(x, y, rotation)], ...] of remote nodes
+var _tick := 0
+var _tick_time := 0.0
+var _history := {{}}     # host: tick -> snapshot {{"entities": {{id: Vector3}}, "state": {{}}}}
+var _sent_at := {{}}     # host: tick -> msec sent
+var _acked := {{}}       # host: peer id -> newest tick it acknowledged
+var _budget := {{}}      # host: peer id -> bytes per second
+var _allowance := {{}}   # host: peer id -> bytes it may still be sent
+var _received := {{}}    # client: tick -> snapshot rebuilt from the deltas
+var _stats := {{}}       # peer id -> traffic and latency, see get_stats()
+
 
 func host_game(port: int = DEFAULT_PORT) -> Error:
 \tpeer = ENetMultiplayerPeer.new()
 \tvar err := peer.create_server(port, MAX_PLAYERS)
 \tif err != OK:
 \t\treturn err
+\tpeer.host.compress(ENetConnection.COMPRESS_RANGE_CODER)
 \tmultiplayer.multiplayer_peer = peer
 \tmultiplayer.peer_connected.connect(_on_peer_connected)
 \tmultiplayer.peer_disconnected.connect(_on_peer_disconnected)
@@ -443,6 +833,7 @@ func join_game(address: String, port: int = DEFAULT_PORT) -> Error:
 \tvar err := peer.create_client(address, port)
 \tif err != OK:
 \t\treturn err
+\tpeer.host.compress(ENetConnection.COMPRESS_RANGE_CODER)
 \tmultiplayer.multiplayer_peer = peer
 \tmultiplayer.peer_connected.connect(_on_peer_connected)
 \tmultiplayer.peer_disconnected.connect(_on_peer_disconnected)
@@ -457,12 +848,270 @@ func disconnect_game() -> void:
 \t\tpeer = null
 \t\tmultiplayer.multiplayer_peer = null
 \tplayers.clear()
+\tfor table in [_tracked, _samples, _history, _sent_at, _acked, _budget, _allowance, _received, _stats, shared_state]:
+\t\ttable.clear()
+\t_tick = 0
 
 
 func is_host() -> bool:
 \treturn multiplayer.is_server() if multiplayer.multiplayer_peer else false
 
 
+## Keep *node*'s global position and rotation in sync; *owner_id* is the
+## peer that moves it, everyone else draws it from snapshots. The node must
+## have the same path on every peer.
+func track(node: Node2D, owner_id: int = 1) -> void:
+\t_tracked[_entity_id(node)] = {{"node": node, "owner": owner_id}}
+
+
+func untrack(node: Node2D) -> void:
+\tvar id := _entity_id(node)
+\t_tracked.erase(id)
+\t_samples.erase(id)
+
+
+## Host only: cap what *peer_id* is sent, in bytes per second. A tick whose
+## snapshot doesn't fit is skipped; the next one still carries every change
+## since the client's last acknowledgement.
+func set_bandwidth_budget(peer_id: int, bytes_per_second: int) -> void:
+\t_budget[peer_id] = bytes_per_second
+
+
+## Snapshot traffic with *peer_id* (the host sees one entry per client, a
+## client sees the host as 1): bytes_per_s sent or received over the last
+## second and, on the host, latency_ms as half the snapshot round trip.
+func get_stats(peer_id: int) -> Dictionary:
+\tvar stats := _peer_stats(peer_id)
+\treturn {{"bytes_per_s": stats["bytes_per_s"], "latency_ms": stats["latency_ms"], "snapshots": stats["snapshots"]}}
+
+
+func _process(_delta: float) -> void:
+\tif _samples.is_empty():
+\t\treturn
+\tvar render_time := Time.get_ticks_msec() - INTERP_DELAY * 1000.0
+\tvar me := multiplayer.get_unique_id()
+\tfor id in _tracked:
+\t\tvar entry: Dictionary = _tracked[id]
+\t\tif entry["owner"] == me or not _samples.has(id) or not is_instance_valid(entry["node"]):
+\t\t\tcontinue
+\t\tvar state := _sample_at(_samples[id], render_time)
+\t\tvar node: Node2D = entry["node"]
+\t\tnode.global_position = Vector2(state.x, state.y)
+\t\tnode.global_rotation = state.z
+
+
+func _physics_process(delta: float) -> void:
+\tif peer == null or peer.get_connection_status() != MultiplayerPeer.CONNECTION_CONNECTED:
+\t\treturn
+\t_tick_time += delta
+\tif _tick_time < 1.0 / TICK_RATE:
+\t\treturn
+\t_tick_time -= 1.0 / TICK_RATE
+\t_tick += 1
+\tif is_host():
+\t\t_send_snapshots()
+\telse:
+\t\tvar owned := _capture(multiplayer.get_unique_id())
+\t\tif not owned.is_empty():
+\t\t\t_receive_owned.rpc_id(1, _encode({{"entities": owned, "state": {{}}}}, {{}}, 0, 0))
+
+
+func _send_snapshots() -> void:
+\tshared_state["score"] = GameManager.score
+\tvar snapshot := {{"entities": _capture(), "state": shared_state.duplicate()}}
+\t_history[_tick] = snapshot
+\t_history.erase(_tick - HISTORY)
+\t_sent_at[_tick] = Time.get_ticks_msec()
+\t_sent_at.erase(_tick - HISTORY)
+\tfor peer_id in multiplayer.get_peers():
+\t\tvar budget: int = _budget.get(peer_id, DEFAULT_BUDGET)
+\t\tvar allowance: float = minf(budget, _allowance.get(peer_id, budget) + float(budget) / TICK_RATE)
+\t\tvar baseline: int = _acked.get(peer_id, 0)
+\t\tif not _history.has(baseline):
+\t\t\tbaseline = 0
+\t\tvar packet := _encode(snapshot, _history.get(baseline, {{}}), baseline, peer_id)
+\t\t# A full bucket always sends, so a snapshot bigger than the budget can't starve a client
+\t\tif packet.size() > allowance and allowance < budget:
+\t\t\t_allowance[peer_id] = allowance
+\t\t\tcontinue
+\t\t_allowance[peer_id] = allowance - packet.size()
+\t\t_count_bytes(peer_id, packet.size())
+\t\t_receive_snapshot.rpc_id(peer_id, packet)
+
+
+## Transforms of the tracked nodes owned by *owner_id*, or of all of them.
+## Remote nodes report the newest state received rather than where they
+## are drawn, so the host forwards client moves without adding delay.
+func _capture(owner_id: int = 0) -> Dictionary:
+\tvar entities := {{}}
+\tvar me := multiplayer.get_unique_id()
+\tfor id in _tracked.keys():
+\t\tvar entry: Dictionary = _tracked[id]
+\t\tif not is_instance_valid(entry["node"]):
+\t\t\t_tracked.erase(id)
+\t\t\tcontinue
+\t\tif owner_id != 0 and entry["owner"] != owner_id:
+\t\t\tcontinue
+\t\tif entry["owner"] != me:
+\t\t\tif _samples.has(id):
+\t\t\t\tentities[id] = _samples[id][-1][1]
+\t\t\tcontinue
+\t\tvar node: Node2D = entry["node"]
+\t\tentities[id] = Vector3(node.global_position.x, node.global_position.y, node.global_rotation)
+\treturn entities
+
+
+## *snapshot* as a delta against *base*, the snapshot of tick *baseline*
+## (0 and an empty base for a full one). Nodes owned by *skip_owner* are
+## left out, since that peer moves them itself.
+func _encode(snapshot: Dictionary, base: Dictionary, baseline: int, skip_owner: int) -> PackedByteArray:
+\tvar buf := StreamPeerBuffer.new()
+\tbuf.put_u32(_tick)
+\tbuf.put_u32(baseline)
+\tvar entities: Dictionary = snapshot["entities"]
+\tvar old: Dictionary = base.get("entities", {{}})
+\tvar changed := []
+\tfor id in entities:
+\t\tif skip_owner != 0 and _tracked.has(id) and _tracked[id]["owner"] == skip_owner:
+\t\t\tcontinue
+\t\tif not old.has(id) or not (old[id] as Vector3).is_equal_approx(entities[id]):
+\t\t\tchanged.append(id)
+\tbuf.put_u16(changed.size())
+\tfor id in changed:
+\t\tvar value: Vector3 = entities[id]
+\t\tbuf.put_u32(id)
+\t\tbuf.put_float(value.x)
+\t\tbuf.put_float(value.y)
+\t\tbuf.put_16(roundi(wrapf(value.z, -PI, PI) * ROTATION_SCALE))
+\tvar removed := []
+\tfor id in old:
+\t\tif not entities.has(id):
+\t\t\tremoved.append(id)
+\tbuf.put_u16(removed.size())
+\tfor id in removed:
+\t\tbuf.put_u32(id)
+\tvar old_state: Dictionary = base.get("state", {{}})
+\tvar state_changes := {{}}
+\tfor key in snapshot["state"]:
+\t\tvar value = snapshot["state"][key]
+\t\tif not old_state.has(key) or typeof(old_state[key]) != typeof(value) or old_state[key] != value:
+\t\t\tstate_changes[key] = value
+\tbuf.put_var(state_changes)
+\treturn buf.data_array
+
+
+## The snapshot *buf* describes, applied on top of *base*.
+func _decode(buf: StreamPeerBuffer, base: Dictionary) -> Dictionary:
+\tvar entities: Dictionary = base.get("entities", {{}}).duplicate()
+\tfor _i in buf.get_u16():
+\t\tvar id := buf.get_u32()
+\t\tvar x := buf.get_float()
+\t\tvar y := buf.get_float()
+\t\tentities[id] = Vector3(x, y, buf.get_16() / ROTATION_SCALE)
+\tfor _i in buf.get_u16():
+\t\tentities.erase(buf.get_u32())
+\tvar state: Dictionary = base.get("state", {{}}).duplicate()
+\tstate.merge(buf.get_var(), true)
+\treturn {{"entities": entities, "state": state}}
+
+
+@rpc("authority", "call_remote", "unreliable_ordered")
+func _receive_snapshot(packet: PackedByteArray) -> void:
+\tvar buf := StreamPeerBuffer.new()
+\tbuf.data_array = packet
+\tvar tick := buf.get_u32()
+\tvar baseline := buf.get_u32()
+\tif baseline != 0 and not _received.has(baseline):
+\t\treturn  # its base is gone; once the host's history passes it, a full snapshot follows
+\t_count_bytes(1, packet.size())
+\tvar snapshot := _decode(buf, _received.get(baseline, {{}}))
+\t_received[tick] = snapshot
+\tfor old_tick in _received.keys():
+\t\tif old_tick < tick - HISTORY * 2:
+\t\t\t_received.erase(old_tick)
+\t_ack.rpc_id(1, tick)
+
+\tfor id in _samples.keys():
+\t\tif not snapshot["entities"].has(id):
+\t\t\t_samples.erase(id)
+\t_push_samples(snapshot["entities"])
+\tshared_state = snapshot["state"].duplicate()
+\tif shared_state.get("score", GameManager.score) != GameManager.score:
+\t\tGameManager.score = shared_state["score"]
+
+
+@rpc("any_peer", "call_remote", "unreliable_ordered")
+func _receive_owned(packet: PackedByteArray) -> void:
+\tvar sender := multiplayer.get_remote_sender_id()
+\tvar buf := StreamPeerBuffer.new()
+\tbuf.data_array = packet
+\tbuf.seek(8)
+\tvar entities := _decode(buf, {{}})["entities"] as Dictionary
+\tfor id in entities.keys():
+\t\tif not _tracked.has(id) or _tracked[id]["owner"] != sender:
+\t\t\tentities.erase(id)
+\t_push_samples(entities)
+
+
+@rpc("any_peer", "call_remote", "unreliable")
+func _ack(tick: int) -> void:
+\tvar sender := multiplayer.get_remote_sender_id()
+\tif tick <= _acked.get(sender, 0):
+\t\treturn
+\t_acked[sender] = tick
+\tif _sent_at.has(tick):
+\t\tvar stats := _peer_stats(sender)
+\t\tvar latency: float = (Time.get_ticks_msec() - _sent_at[tick]) / 2.0
+\t\tstats["latency_ms"] = latency if stats["latency_ms"] < 0.0 else lerpf(stats["latency_ms"], latency, 0.1)
+
+
+func _push_samples(entities: Dictionary) -> void:
+\tvar now := Time.get_ticks_msec()
+\tfor id in entities:
+\t\tif not _samples.has(id):
+\t\t\t_samples[id] = []
+\t\tvar samples: Array = _samples[id]
+\t\tsamples.append([now, entities[id]])
+\t\tif samples.size() > 8:
+\t\t\tsamples.pop_front()
+
+
+## Interpolated state at *time* msec; the newest one once *time* passes it.
+func _sample_at(samples: Array, time: float) -> Vector3:
+\tfor i in range(samples.size() - 1, 0, -1):
+\t\tvar a: Array = samples[i - 1]
+\t\tvar b: Array = samples[i]
+\t\tif time >= b[0]:
+\t\t\treturn b[1]
+\t\tif time >= a[0]:
+\t\t\tvar w: float = (time - a[0]) / float(b[0] - a[0])
+\t\t\tvar from: Vector3 = a[1]
+\t\t\tvar to: Vector3 = b[1]
+\t\t\treturn Vector3(lerpf(from.x, to.x, w), lerpf(from.y, to.y, w), lerp_angle(from.z, to.z, w))
+\treturn samples[0][1]
+
+
+func _entity_id(node: Node) -> int:
+\treturn str(node.get_path()).hash()
+
+
+func _peer_stats(peer_id: int) -> Dictionary:
+\tif not _stats.has(peer_id):
+\t\t_stats[peer_id] = {{"bytes": 0, "since": Time.get_ticks_msec(), "bytes_per_s": 0.0, "latency_ms": -1.0, "snapshots": 0}}
+\treturn _stats[peer_id]
+
+
+func _count_bytes(peer_id: int, size: int) -> void:
+\tvar stats := _peer_stats(peer_id)
+\tstats["bytes"] += size
+\tstats["snapshots"] += 1
+\tvar elapsed: int = Time.get_ticks_msec() - stats["since"]
+\tif elapsed >= 1000:
+\t\tstats["bytes_per_s"] = stats["bytes"] * 1000.0 / elapsed
+\t\tstats["bytes"] = 0
+\t\tstats["since"] += elapsed
+
+
 func _on_peer_connected(id: int) -> void:
 \tplayers[id] = {{"name": "Player " + str(id)}}
 \tplayer_connected.emit(id)
@@ -471,6 +1120,8 @@ func _on_peer_connected(id: int) -> void:
 
 func _on_peer_disconnected(id: int) -> void:
 \tplayers.erase(id)
+\tfor table in [_acked, _budget, _allowance, _stats]:
+\t\ttable.erase(id)
 \tplayer_disconnected.emit(id)
 
 
@@ -481,6 +1132,144 @@ func _on_connected() -> void:
 
 func _on_connection_failed() -> void:
 \tconnection_failed.emit()
+''')
+
+    # ── performance overlay and quality tiers ──────────────────────────
+
+    def _write_perf_monitor(self) -> None:
+        quality = self.spec.quality.value
+        self._write("scripts/autoload/perf_monitor.gd", f'''extends CanvasLayer
+## Performance overlay and quality tiers.
+##
+## F3 toggles an overlay with FPS, frame time, draw calls, node count and
+## memory from the engine's Performance monitors. The quality tier scales
+## what the game spends on looks: particle counts, decoration density and
+## whether ambient particles run on the GPU. It is fixed by the game spec,
+## or with QUALITY "auto" starts high (medium on mobile and web) and steps
+## down when frames keep missing FRAME_BUDGET_MS.
+
+signal tier_changed(tier: int)
+
+enum Tier {{ LOW, MEDIUM, HIGH }}
+
+const QUALITY: String = "{quality}"
+const SHOW_OVERLAY: bool = {str(self.spec.perf_overlay).lower()}
+const TIER_NAMES: Array[String] = ["low", "medium", "high"]
+const PARTICLE_SCALE: Array[float] = [0.25, 0.6, 1.0]
+const DECORATION_DENSITY: Array[float] = [0.35, 0.7, 1.0]
+## Average frame time above which "auto" drops a tier
+const FRAME_BUDGET_MS: float = 20.0
+## Seconds of frames averaged per auto-detect decision
+const SAMPLE_WINDOW: float = 2.0
+
+var tier: int = Tier.HIGH
+
+var _label: Label
+var _window_time := 0.0
+var _window_frames := 0
+var _overlay_time := 0.0
+var _frame_ms := 0.0
+var _scene: Node = null
+
+
+func _ready() -> void:
+\tlayer = 128
+\tprocess_mode = Node.PROCESS_MODE_ALWAYS
+\tif QUALITY == "auto":
+\t\ttier = Tier.MEDIUM if OS.has_feature("mobile") or OS.has_feature("web") else Tier.HIGH
+\telse:
+\t\ttier = maxi(0, TIER_NAMES.find(QUALITY))
+\t_label = Label.new()
+\t_label.position = Vector2(8, 8)
+\t_label.add_theme_font_size_override("font_size", 14)
+\t_label.add_theme_color_override("font_outline_color", Color.BLACK)
+\t_label.add_theme_constant_override("outline_size", 4)
+\tadd_child(_label)
+\tvisible = SHOW_OVERLAY
+
+
+func _unhandled_input(event: InputEvent) -> void:
+\tvar key := event as InputEventKey
+\tif key and key.pressed and not key.echo and key.keycode == KEY_F3:
+\t\tvisible = not visible
+
+
+func _process(delta: float) -> void:
+\t_frame_ms = lerpf(_frame_ms, delta * 1000.0, 0.1)
+\tif QUALITY == "auto" and tier > Tier.LOW:
+\t\tif get_tree().current_scene != _scene:
+\t\t\t# Scene loads stall a few frames; don't count them against the tier
+\t\t\t_scene = get_tree().current_scene
+\t\t\t_window_time = 0.0
+\t\t\t_window_frames = 0
+\t\t_window_time += delta
+\t\t_window_frames += 1
+\t\tif _window_time >= SAMPLE_WINDOW:
+\t\t\tif _window_time * 1000.0 / _window_frames > FRAME_BUDGET_MS:
+\t\t\t\tset_tier(tier - 1)
+\t\t\t_window_time = 0.0
+\t\t\t_window_frames = 0
+\tif visible:
+\t\t_overlay_time += delta
+\t\tif _overlay_time >= 0.25:
+\t\t\t_overlay_time = 0.0
+\t\t\t_update_overlay()
+
+
+func set_tier(value: int) -> void:
+\tvalue = clampi(value, Tier.LOW, Tier.HIGH)
+\tif value == tier:
+\t\treturn
+\ttier = value
+\tfor particles in get_tree().get_nodes_in_group("perf_particles"):
+\t\tparticles.set("amount", particle_amount(particles.get_meta("base_amount")))
+\ttier_changed.emit(tier)
+
+
+## *base* particles scaled for the current tier.
+func particle_amount(base: int) -> int:
+\treturn maxi(1, roundi(base * PARTICLE_SCALE[tier]))
+
+
+## Fraction of decorations to place; chunks built after a tier change use the new one.
+func decoration_density() -> float:
+\treturn DECORATION_DENSITY[tier]
+
+
+## Ambient particles emitting *amount* at high quality with *material*.
+## Under the Compatibility renderer, or on the low tier, they are converted
+## to CPUParticles2D, which cost no GPU transform feedback. The amount
+## follows later tier changes.
+func ambient_particles(material: ParticleProcessMaterial, amount: int, lifetime: float, visibility: Rect2) -> Node2D:
+\tvar gpu := GPUParticles2D.new()
+\tgpu.amount = particle_amount(amount)
+\tgpu.lifetime = lifetime
+\tgpu.visibility_rect = visibility
+\tgpu.process_material = material
+\tvar particles: Node2D = gpu
+\tvar method: String = ProjectSettings.get_setting_with_override("rendering/renderer/rendering_method")
+\tif method == "gl_compatibility" or tier == Tier.LOW:
+\t\tvar cpu := CPUParticles2D.new()
+\t\tcpu.convert_from_particles(gpu)
+\t\tgpu.free()
+\t\tparticles = cpu
+\tparticles.set_meta("base_amount", amount)
+\tparticles.add_to_group("perf_particles")
+\treturn particles
+
+
+func _update_overlay() -> void:
+\t_label.text = "FPS %d  frame %.1f ms (process %.1f, physics %.1f)\\ndraw calls %d  nodes %d  memory %.1f MB  quality %s" % [
+\t\tPerformance.get_monitor(Performance.TIME_FPS),
+\t\t_frame_ms,
+\t\tPerformance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+\t\tPerformance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0,
+\t\tPerformance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME),
+\t\tPerformance.get_monitor(Performance.OBJECT_NODE_COUNT),
+\t\tPerformance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0,
+\t\tTIER_NAMES[tier],
+\t]
+
 ''')
 
     # ── main menu (with multiplayer lobby) ──────────────────────────────
@@ -621,6 +1410,7 @@ func _ready() -> void:
 \t$VBox/QuitButton.pressed.connect(_on_quit)
 \tGameManager.reset()
 \tLevelManager.reset()
+\tSpriteGenerator.warm_up()
 {mp_script}
 
 func _on_play() -> void:
@@ -929,6 +1719,65 @@ func _ready() -> void:
 
 func _on_next() -> void:
 \tLevelManager.go_to_current_level()
+''')
+
+    # ── loading screen ──────────────────────────────────────────────────
+
+    def _write_loading_screen(self) -> None:
+        bg = self._hex_to_godot_color(self.spec.color_bg)
+        self._write("scenes/loading.tscn", f'''[gd_scene load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/loading_screen.gd" id="1"]
+
+[node name="Loading" type="Control"]
+layout_mode = 3
+anchors_preset = 15
+anchor_right = 1.0
+anchor_bottom = 1.0
+script = ExtResource("1")
+
+[node name="BG" type="ColorRect" parent="."]
+layout_mode = 1
+anchors_preset = 15
+anchor_right = 1.0
+anchor_bottom = 1.0
+color = Color{bg}
+
+[node name="VBox" type="VBoxContainer" parent="."]
+layout_mode = 1
+anchors_preset = 8
+anchor_left = 0.5
+anchor_top = 0.5
+anchor_right = 0.5
+anchor_bottom = 0.5
+offset_left = -200.0
+offset_top = -50.0
+offset_right = 200.0
+offset_bottom = 50.0
+theme_override_constants/separation = 20
+
+[node name="Title" type="Label" parent="VBox"]
+layout_mode = 2
+theme_override_font_sizes/font_size = 28
+text = "Loading..."
+horizontal_alignment = 1
+
+[node name="Progress" type="ProgressBar" parent="VBox"]
+layout_mode = 2
+custom_minimum_size = Vector2(0, 24)
+''')
+        self._write("scripts/loading_screen.gd", '''extends Control
+## Shown while LevelManager waits on a level still loading in the background.
+
+@onready var progress_bar: ProgressBar = $VBox/Progress
+
+
+func _process(_delta: float) -> void:
+\tvar path := LevelManager.get_current_scene()
+\tprogress_bar.value = LevelManager.load_progress(path) * 100.0
+\tif LevelManager.is_loaded(path):
+\t\tset_process(false)
+\t\tLevelManager.go_to_current_level()
 ''')
 
     # ── utility ─────────────────────────────────────────────────────────
@@ -1,11 +1,16 @@
 """2D Platformer — procedural world generation, multi-biome, polished game feel.
 
 Architecture:
-  Each level scene contains a WorldGenerator node that builds the entire level
-  at runtime using FastNoiseLite: noise-based terrain, floating platforms,
-  scattered decorations (trees, rocks, grass), parallax backgrounds, enemies,
-  collectibles, and a level exit. This produces large, varied, organic-feeling
-  worlds — not hardcoded rectangles.
+  Each level scene contains a WorldGenerator node that builds the level at
+  runtime using FastNoiseLite: noise-based terrain, floating platforms,
+  scattered decorations (trees, rocks, grass — merged into one mesh per
+  chunk), parallax backgrounds, enemies, collectibles, and a level exit. This produces large, varied, organic-feeling
+  worlds — not hardcoded rectangles. The level is streamed in fixed-width
+  chunks around the camera, each rebuilt deterministically from level_seed,
+  so load time and node count stay flat however wide the level is. The
+  heightmap and entity placements are baked into levels/level_N.tres at
+  generation time (app/generator/world_baker.py), so the runtime only reads
+  them.
 
   Player has wall-jump, dash, coyote time, variable jump height, attack.
   Three enemy types: Walker, Flyer, Charger.  Boss every 5 levels.
@@ -13,7 +18,12 @@ Architecture:
 """
 
 from __future__ import annotations
+
+from pathlib import Path
+
+from app.art.sprite_baker import Color, darkened, lightened, parse_color
 from app.generator.templates.base import BaseTemplate
+from app.generator.world_baker import bake_world_resource
 
 
 class PlatformerTemplate(BaseTemplate):
@@ -35,25 +45,68 @@ func _ready() -> void:
 \tGameManager.game_over.connect(func(): GameManager.go_to_scene("res://scenes/game_over.tscn"))
 ''')
 
+    def sprite_characters(self) -> list[tuple[str, str, str, Color, Color]]:
+        # Colours follow the component scripts (player_platformer.gd, enemy_*.gd)
+        primary = parse_color(self.spec.color_primary)
+        secondary = parse_color(self.spec.color_secondary)
+        charger = darkened(secondary, 0.15)
+        flyer = lightened(secondary, 0.2)
+        return [
+            ("player", "player", "platformer", primary, lightened(primary, 0.4)),
+            ("enemy_walker", "enemy_1", "platformer", secondary, lightened(secondary, 0.3)),
+            ("enemy_charger", "enemy_1", "platformer", charger, lightened(charger, 0.3)),
+            ("enemy_flyer", "enemy_2", "platformer", flyer, lightened(flyer, 0.3)),
+        ]
+
     # ═══════════════════════════════════════════════════════════════════
     #  WORLD GENERATOR — procedural terrain, platforms, decorations
     # ═══════════════════════════════════════════════════════════════════
 
     def _write_world_generator(self) -> None:
         self._write("scripts/world/world_generator.gd", '''extends Node2D
-## Procedural world generator — builds entire level at runtime.
+## Procedural world generator — streams the level in chunks around the camera.
+##
+## The layout (heightmap, decoration kinds, platforms, enemies, coins) is
+## normally baked at generation time into world_data; without it, each chunk
+## is laid out from level_seed and its index. Either way a chunk that is
+## freed and loaded again comes back the same; collected coins and defeated
+## enemies are remembered per chunk. Only the chunks near the camera exist,
+## so load time and live node count do not grow with world_width.
 
 @export var biome: String = "forest"
 @export var difficulty: int = 1
 @export var level_seed: int = 0
 @export var world_width: int = 250
 @export var world_height: int = 50
+@export var world_data: Resource  # WorldData baked by the generator (world_data.gd)
 
 const T := 16  # tile size
+const CHUNK_TILES := 32
+const KEEP_MARGIN := 1  # chunks kept past the load radius so turning back doesn't rebuild them
+
+const WorldData := preload("res://scripts/world/world_data.gd")
+# Indexed by WorldData.ENEMY_*
+const ENEMY_SCENES := [
+\tpreload("res://scenes/enemy_walker.tscn"),
+\tpreload("res://scenes/enemy_flyer.tscn"),
+\tpreload("res://scenes/enemy_charger.tscn"),
+]
+const ENEMY_CYCLE := [WorldData.ENEMY_WALKER, WorldData.ENEMY_WALKER, WorldData.ENEMY_FLYER, WorldData.ENEMY_CHARGER]
+const COIN_SCENE := preload("res://scenes/collectible.tscn")
+const EXIT_SCENE := preload("res://scenes/level_exit.tscn")
+const PLAYER_SCENE := preload("res://scenes/player.tscn")
 
 var _noise := FastNoiseLite.new()
 var _detail_noise := FastNoiseLite.new()
-var _heights: Array[float] = []
+var _plat_noise := FastNoiseLite.new()
+var _heights := PackedFloat32Array()  # baked surface y per tile column, empty when laid out at runtime
+var _chunk_count := 0
+var _chunk_root: Node2D
+var _chunks := {}  # index -> Node2D
+var _spawned := {}  # index -> {spawn id: node} for the loaded chunk's enemies and coins
+var _consumed := {}  # index -> {spawn id: true} once picked up or defeated
+var _player: Node2D
+var _particles: Node2D  # GPUParticles2D, or CPUParticles2D from PerfMonitor
 
 # Biome palettes
 const BIOMES := {
@@ -105,37 +158,170 @@ func _ready() -> void:
 \t_noise.frequency = 0.035
 \t_detail_noise.seed = _noise.seed + 42
 \t_detail_noise.frequency = 0.12
+\t_plat_noise.seed = _noise.seed + 200
+\t_plat_noise.frequency = 0.04
+\tif world_data and world_data.heights.size() == world_width:
+\t\t_heights = world_data.heights
+\telse:
+\t\tworld_data = null
+\t_chunk_count = maxi(1, ceili(float(world_width - 1) / CHUNK_TILES))
 \t_generate()
 
 
 func _generate() -> void:
-\tvar b: Dictionary = BIOMES.get(biome, BIOMES["forest"])
-\t_compute_heights(b)
+\tvar b := _biome()
 \t_build_parallax_background(b)
-\t_build_terrain(b)
-\t_place_platforms(b)
-\t_place_decorations(b)
-\t_place_enemies()
-\t_place_collectibles(b)
-\t_place_exit(b)
+\t_chunk_root = Node2D.new()
+\t_chunk_root.name = "Chunks"
+\tadd_child(_chunk_root)
 \t_spawn_player()
 \t_add_ambient_particles(b)
 \t_add_camera_bounds()
+\t# Chunks around the spawn point are built up front so the player lands on ground
+\tvar centre := _chunk_at(_player.position.x)
+\tvar radius := _load_radius()
+\tfor index in range(centre - radius, centre + radius + 1):
+\t\t_load_missing(index)
+
+
+func _process(_delta: float) -> void:
+\tvar focus := _focus_x()
+\tvar centre := _chunk_at(focus)
+\tvar radius := _load_radius()
+\tfor index in _chunks.keys():
+\t\tif absi(index - centre) > radius + KEEP_MARGIN:
+\t\t\t_unload_chunk(index)
+\t# At most one new chunk per frame, nearest first
+\tfor offset in radius + 1:
+\t\tif _load_missing(centre + offset) or _load_missing(centre - offset):
+\t\t\tbreak
+\t_particles.position.x = focus
+
+
+func _biome() -> Dictionary:
+\treturn BIOMES.get(biome, BIOMES["forest"])
+
+
+# ── chunk streaming ────────────────────────────────────────────────
+func _chunk_at(world_x: float) -> int:
+\treturn clampi(int(world_x / (CHUNK_TILES * T)), 0, _chunk_count - 1)
+
+
+func _focus_x() -> float:
+\tvar cam := get_viewport().get_camera_2d()
+\tif cam:
+\t\treturn cam.get_screen_center_position().x
+\tif is_instance_valid(_player):
+\t\treturn _player.position.x
+\treturn 0.0
+
+
+func _load_radius() -> int:
+\tvar cam := get_viewport().get_camera_2d()
+\tvar zoom: float = cam.zoom.x if cam else 1.0
+\tvar half_view := get_viewport_rect().size.x / zoom / 2.0
+\treturn ceili(half_view / (CHUNK_TILES * T)) + 1
+
+
+func _load_missing(index: int) -> bool:
+\tif index < 0 or index >= _chunk_count or _chunks.has(index):
+\t\treturn false
+\t_load_chunk(index)
+\treturn true
+
+
+func _load_chunk(index: int) -> void:
+\tvar b := _biome()
+\tvar rng := RandomNumberGenerator.new()
+\trng.seed = hash([_noise.seed, index])
+\tvar chunk := Node2D.new()
+\tchunk.name = "Chunk%d" % index
+\t# Chunks share their boundary column so terrain polygons meet without a seam
+\tvar first := index * CHUNK_TILES
+\tvar last := mini(first + CHUNK_TILES, world_width - 1)
+\tvar x0 := float(first * T)
+\tvar x1 := float(last * T)
+\t_spawned[index] = {}
+\t_build_terrain(chunk, b, first, last)
+\t# Decorations draw from their own stream, so thinning them for quality
+\t# leaves the rest of the chunk's layout alone
+\tvar deco_rng := RandomNumberGenerator.new()
+\tdeco_rng.seed = hash([_noise.seed, index, "decorations"])
+\t_place_decorations(chunk, b, deco_rng, first, last)
+\tif world_data:
+\t\t_place_baked(chunk, b, index)
+\telse:
+\t\t_place_platforms(chunk, b, rng, x0, x1)
+\t\t_place_enemies(chunk, rng, index, x0, x1)
+\t\t_place_collectibles(chunk, rng, index, x0, x1)
+\tif index == _chunk_at((world_width - 6) * T):
+\t\t_place_exit(chunk)
+\t_chunks[index] = chunk
+\t_chunk_root.add_child(chunk)
+
+
+func _unload_chunk(index: int) -> void:
+\tvar consumed: Dictionary = _consumed.get_or_add(index, {})
+\tfor id in _spawned[index]:
+\t\tvar node: Node = _spawned[index][id]
+\t\tif not is_instance_valid(node) or node.is_queued_for_deletion():
+\t\t\tconsumed[id] = true
+\t_spawned.erase(index)
+\t_chunks[index].queue_free()
+\t_chunks.erase(index)
+
+
+func _track(chunk: Node2D, index: int, id: String, node: Node2D) -> void:
+\t_spawned[index][id] = node
+\tchunk.add_child(node)
+
+
+func _is_consumed(index: int, id: String) -> bool:
+\treturn _consumed.has(index) and _consumed[index].has(id)
+
+
+func _place_baked(chunk: Node2D, b: Dictionary, index: int) -> void:
+\tvar plats: PackedVector3Array = world_data.platforms
+\tfor i in range(world_data.platform_chunks[index], world_data.platform_chunks[index + 1]):
+\t\t_make_platform(chunk, b, plats[i].x, plats[i].y, plats[i].z)
+\tvar enemies: PackedVector3Array = world_data.enemies
+\tfor i in range(world_data.enemy_chunks[index], world_data.enemy_chunks[index + 1]):
+\t\t_spawn_enemy(chunk, index, "e%d" % i, int(enemies[i].z), Vector2(enemies[i].x, enemies[i].y))
+\tvar coins: PackedVector2Array = world_data.collectibles
+\tfor i in range(world_data.collectible_chunks[index], world_data.collectible_chunks[index + 1]):
+\t\t_spawn_coin(chunk, index, "c%d" % i, coins[i])
+
+
+func _scatter(rng: RandomNumberGenerator, total: int, margin_left: int, margin_right: int,
+\t\tx0: float, x1: float) -> Array[float]:
+\t## x positions for this chunk's share of *total* items spread evenly over the level
+\tvar xs: Array[float] = []
+\tvar lo := maxf(x0, margin_left * T)
+\tvar hi := minf(x1, (world_width - margin_right) * T)
+\tvar span := float(world_width - margin_left - margin_right) * T
+\tif hi <= lo or span <= 0.0:
+\t\treturn xs
+\tvar expected := total * (hi - lo) / span
+\tvar count := int(expected)
+\tif rng.randf() < expected - count:
+\t\tcount += 1
+\tfor i in count:
+\t\txs.append(rng.randf_range(lo, hi))
+\treturn xs
 
 
 # ── heightmap ──────────────────────────────────────────────────────
-func _compute_heights(b: Dictionary) -> void:
-\t_heights.clear()
-\tfor x in world_width:
-\t\tvar base := 0.6 * world_height * T
-\t\tvar hill: float = _noise.get_noise_1d(float(x)) * 5.0 * T
-\t\tvar detail: float = _detail_noise.get_noise_1d(float(x)) * 2.0 * T
-\t\t_heights.append(base + hill + detail)
+func _height_at(x_tile: int) -> float:
+\tif not _heights.is_empty():
+\t\treturn _heights[x_tile]
+\tvar base := 0.6 * world_height * T
+\tvar hill: float = _noise.get_noise_1d(float(x_tile)) * 5.0 * T
+\tvar detail: float = _detail_noise.get_noise_1d(float(x_tile)) * 2.0 * T
+\treturn base + hill + detail
 
 
 func _surface_y(world_x: float) -> float:
-\tvar idx := clampi(int(world_x / T), 0, _heights.size() - 1)
-\treturn _heights[idx]
+\treturn _height_at(clampi(int(world_x / T), 0, world_width - 1))
 
 
 # ── parallax background ───────────────────────────────────────────
@@ -180,17 +366,17 @@ func _build_parallax_background(b: Dictionary) -> void:
 
 
 # ── terrain ────────────────────────────────────────────────────────
-func _build_terrain(b: Dictionary) -> void:
+func _build_terrain(chunk: Node2D, b: Dictionary, first: int, last: int) -> void:
 \tvar body := StaticBody2D.new()
 \tbody.name = "Terrain"
 
 \t# surface polygon
 \tvar pts := PackedVector2Array()
 \tvar bottom_y := world_height * T + 200.0
-\tpts.append(Vector2(0, bottom_y))
-\tfor x in world_width:
-\t\tpts.append(Vector2(x * T, _heights[x]))
-\tpts.append(Vector2((world_width - 1) * T, bottom_y))
+\tpts.append(Vector2(first * T, bottom_y))
+\tfor x in range(first, last + 1):
+\t\tpts.append(Vector2(x * T, _height_at(x)))
+\tpts.append(Vector2(last * T, bottom_y))
 \tvar col := CollisionPolygon2D.new()
 \tcol.polygon = pts
 \tbody.add_child(col)
@@ -205,222 +391,249 @@ func _build_terrain(b: Dictionary) -> void:
 \tvar grass := Line2D.new()
 \tgrass.width = 4.0
 \tgrass.default_color = b["foliage"]
-\tfor x in world_width:
-\t\tgrass.add_point(Vector2(x * T, _heights[x] - 1))
+\tfor x in range(first, last + 1):
+\t\tgrass.add_point(Vector2(x * T, _height_at(x) - 1))
 \tbody.add_child(grass)
 
 \t# deep earth overlay
 \tvar deep_pts := PackedVector2Array()
-\tdeep_pts.append(Vector2(0, bottom_y))
-\tfor x in world_width:
-\t\tdeep_pts.append(Vector2(x * T, _heights[x] + 40))
-\tdeep_pts.append(Vector2((world_width - 1) * T, bottom_y))
+\tdeep_pts.append(Vector2(first * T, bottom_y))
+\tfor x in range(first, last + 1):
+\t\tdeep_pts.append(Vector2(x * T, _height_at(x) + 40))
+\tdeep_pts.append(Vector2(last * T, bottom_y))
 \tvar deep := Polygon2D.new()
 \tdeep.polygon = deep_pts
 \tdeep.color = b["ground_deep"]
 \tbody.add_child(deep)
 
-\tadd_child(body)
+\tchunk.add_child(body)
 
 
 # ── floating platforms ─────────────────────────────────────────────
-func _place_platforms(b: Dictionary) -> void:
-\tvar plat_count := 15 + difficulty * 8
-\tvar plat_noise := FastNoiseLite.new()
-\tplat_noise.seed = _noise.seed + 200
-\tplat_noise.frequency = 0.04
-\tfor i in plat_count:
-\t\tvar px := randf_range(T * 8, (world_width - 8) * T)
+func _place_platforms(chunk: Node2D, b: Dictionary, rng: RandomNumberGenerator, x0: float, x1: float) -> void:
+\tfor px in _scatter(rng, 15 + difficulty * 8, 8, 8, x0, x1):
 \t\tvar sy := _surface_y(px)
-\t\tvar height_above := randf_range(60, 180 + difficulty * 15)
-\t\tvar py := sy - height_above
-\t\tvar pw := randf_range(48, 160 - difficulty * 5)
-
-\t\tvar plat := StaticBody2D.new()
-\t\tplat.position = Vector2(px, py)
-\t\tvar shape := RectangleShape2D.new()
-\t\tshape.size = Vector2(pw, 10)
-\t\tvar cs := CollisionShape2D.new()
-\t\tcs.shape = shape
-\t\tplat.add_child(cs)
-
-\t\t# organic-looking platform visual
-\t\tvar vis := Polygon2D.new()
-\t\tvar vpts := PackedVector2Array()
-\t\tvar half := pw / 2.0
-\t\tvpts.append(Vector2(-half + 4, -5))
-\t\tvpts.append(Vector2(-half, 0))
-\t\tvpts.append(Vector2(-half + 2, 6))
-\t\tfor s in range(8):
-\t\t\tvar sx: float = lerp(-half + 2, half - 2, float(s) / 7.0)
-\t\t\tvar wobble: float = plat_noise.get_noise_1d(px + s * 20) * 3.0
-\t\t\tvpts.append(Vector2(sx, 8 + wobble))
-\t\tvpts.append(Vector2(half - 2, 6))
-\t\tvpts.append(Vector2(half, 0))
-\t\tvpts.append(Vector2(half - 4, -5))
-\t\tvis.polygon = vpts
-\t\tvis.color = b["platform"]
-\t\tplat.add_child(vis)
-
-\t\t# moss/grass detail on top
-\t\tvar moss := Line2D.new()
-\t\tmoss.width = 3.0
-\t\tmoss.default_color = b["foliage"].lerp(b["platform"], 0.4)
-\t\tfor s in range(6):
-\t\t\tmoss.add_point(Vector2(lerp(-half + 6, half - 6, float(s) / 5.0), -5))
-\t\tplat.add_child(moss)
-
-\t\tadd_child(plat)
+\t\tvar height_above := rng.randf_range(60, 180 + difficulty * 15)
+\t\tvar pw := rng.randf_range(48, 160 - difficulty * 5)
+\t\t_make_platform(chunk, b, px, sy - height_above, pw)
+
+
+func _make_platform(chunk: Node2D, b: Dictionary, px: float, py: float, pw: float) -> void:
+\tvar plat := StaticBody2D.new()
+\tplat.position = Vector2(px, py)
+\tvar shape := RectangleShape2D.new()
+\tshape.size = Vector2(pw, 10)
+\tvar cs := CollisionShape2D.new()
+\tcs.shape = shape
+\tplat.add_child(cs)
+
+\t# organic-looking platform visual
+\tvar vis := Polygon2D.new()
+\tvar vpts := PackedVector2Array()
+\tvar half := pw / 2.0
+\tvpts.append(Vector2(-half + 4, -5))
+\tvpts.append(Vector2(-half, 0))
+\tvpts.append(Vector2(-half + 2, 6))
+\tfor s in range(8):
+\t\tvar sx: float = lerp(-half + 2, half - 2, float(s) / 7.0)
+\t\tvar wobble: float = _plat_noise.get_noise_1d(px + s * 20) * 3.0
+\t\tvpts.append(Vector2(sx, 8 + wobble))
+\tvpts.append(Vector2(half - 2, 6))
+\tvpts.append(Vector2(half, 0))
+\tvpts.append(Vector2(half - 4, -5))
+\tvis.polygon = vpts
+\tvis.color = b["platform"]
+\tplat.add_child(vis)
+
+\t# moss/grass detail on top
+\tvar moss := Line2D.new()
+\tmoss.width = 3.0
+\tmoss.default_color = b["foliage"].lerp(b["platform"], 0.4)
+\tfor s in range(6):
+\t\tmoss.add_point(Vector2(lerp(-half + 6, half - 6, float(s) / 5.0), -5))
+\tplat.add_child(moss)
+
+\tchunk.add_child(plat)
 
 
 # ── decorations ────────────────────────────────────────────────────
-func _place_decorations(b: Dictionary) -> void:
-\tvar deco_group := Node2D.new()
-\tdeco_group.name = "Decorations"
-
-\tfor x_tile in range(2, world_width - 2):
-\t\tvar wx := float(x_tile) * T
-\t\tvar sy := _surface_y(wx)
-\t\tvar r: float = _detail_noise.get_noise_2d(float(x_tile), 0.0)
-
-\t\t# Trees
-\t\tif r > 0.25 and x_tile % 3 == 0:
-\t\t\t_make_tree(deco_group, Vector2(wx, sy), b)
-\t\t# Rocks
-\t\telif r < -0.3 and x_tile % 5 == 0:
-\t\t\t_make_rock(deco_group, Vector2(wx, sy), b)
-\t\t# Grass tufts
-\t\telif abs(r) < 0.2:
-\t\t\t_make_grass(deco_group, Vector2(wx, sy), b)
-\t\t# Flowers (forest/sky only)
-\t\telif biome != "cave" and r > 0.15 and x_tile % 4 == 0:
-\t\t\t_make_flower(deco_group, Vector2(wx, sy), b)
-
-\tadd_child(deco_group)
-
-
-func _make_tree(parent: Node2D, pos: Vector2, b: Dictionary) -> void:
-\tvar tree := Node2D.new()
-\ttree.position = pos
-\tvar h := randf_range(50, 100)
-\tvar trunk_w := randf_range(5, 9)
-\tvar trunk := Polygon2D.new()
-\ttrunk.polygon = PackedVector2Array([
+# A chunk's trees, rocks, grass and flowers are merged into one vertex-coloured
+# mesh drawn by a single MeshInstance2D: one canvas item and one draw call per
+# chunk instead of a Polygon2D/Line2D node per leaf and blade.
+class DecoMesh:
+\tvar verts := PackedVector2Array()
+\tvar colors := PackedColorArray()
+
+\t## Convex polygon, fan-triangulated.
+\tfunc add_polygon(points: PackedVector2Array, offset: Vector2, color: Color) -> void:
+\t\tfor i in range(1, points.size() - 1):
+\t\t\tverts.append(points[0] + offset)
+\t\t\tverts.append(points[i] + offset)
+\t\t\tverts.append(points[i + 1] + offset)
+\t\t\tcolors.append(color)
+\t\t\tcolors.append(color)
+\t\t\tcolors.append(color)
+
+\t## Straight line segment as a quad.
+\tfunc add_line(from: Vector2, to: Vector2, width: float, color: Color) -> void:
+\t\tvar n := (to - from).orthogonal().normalized() * width / 2.0
+\t\tadd_polygon(PackedVector2Array([from - n, from + n, to + n, to - n]), Vector2.ZERO, color)
+
+\tfunc build() -> MeshInstance2D:
+\t\tif verts.is_empty():
+\t\t\treturn null
+\t\tvar arrays := []
+\t\tarrays.resize(Mesh.ARRAY_MAX)
+\t\tarrays[Mesh.ARRAY_VERTEX] = verts
+\t\tarrays[Mesh.ARRAY_COLOR] = colors
+\t\tvar mesh := ArrayMesh.new()
+\t\tmesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
+\t\tvar instance := MeshInstance2D.new()
+\t\tinstance.mesh = mesh
+\t\treturn instance
+
+
+func _place_decorations(chunk: Node2D, b: Dictionary, rng: RandomNumberGenerator, first: int, last: int) -> void:
+\tvar mesh := DecoMesh.new()
+\tvar perf := get_node_or_null("/root/PerfMonitor")
+\tvar density: float = perf.decoration_density() if perf else 1.0
+\tfor x_tile in range(maxi(first, 2), mini(last, world_width - 2)):
+\t\tif density < 1.0 and float(hash(x_tile) % 1000) >= density * 1000.0:
+\t\t\tcontinue
+\t\tvar pos := Vector2(float(x_tile) * T, _height_at(x_tile))
+\t\tmatch _decoration_at(x_tile):
+\t\t\tWorldData.DECOR_TREE:
+\t\t\t\t_make_tree(mesh, pos, b, rng)
+\t\t\tWorldData.DECOR_ROCK:
+\t\t\t\t_make_rock(mesh, pos, b, rng)
+\t\t\tWorldData.DECOR_GRASS:
+\t\t\t\t_make_grass(mesh, pos, b, rng)
+\t\t\tWorldData.DECOR_FLOWER:
+\t\t\t\t# forest/sky only
+\t\t\t\tif biome != "cave":
+\t\t\t\t\t_make_flower(mesh, pos, b, rng)
+
+\tvar deco := mesh.build()
+\tif deco:
+\t\tdeco.name = "Decorations"
+\t\tchunk.add_child(deco)
+
+
+func _decoration_at(x_tile: int) -> int:
+\tif world_data:
+\t\treturn world_data.decorations[x_tile]
+\tvar r: float = _detail_noise.get_noise_2d(float(x_tile), 0.0)
+\tif r > 0.25 and x_tile % 3 == 0:
+\t\treturn WorldData.DECOR_TREE
+\tif r < -0.3 and x_tile % 5 == 0:
+\t\treturn WorldData.DECOR_ROCK
+\tif abs(r) < 0.2:
+\t\treturn WorldData.DECOR_GRASS
+\tif r > 0.15 and x_tile % 4 == 0:
+\t\treturn WorldData.DECOR_FLOWER
+\treturn WorldData.DECOR_NONE
+
+
+func _make_tree(mesh: DecoMesh, pos: Vector2, b: Dictionary, rng: RandomNumberGenerator) -> void:
+\tvar h := rng.randf_range(50, 100)
+\tvar trunk_w := rng.randf_range(5, 9)
+\tmesh.add_polygon(PackedVector2Array([
 \t\tVector2(-trunk_w/2, 0), Vector2(trunk_w/2, 0),
 \t\tVector2(trunk_w/2 - 1, -h), Vector2(-trunk_w/2 + 1, -h),
-\t])
-\ttrunk.color = b["trunk"]
-\ttree.add_child(trunk)
+\t]), pos, b["trunk"])
 \t# canopy layers
-\tfor i in range(randi_range(2, 4)):
-\t\tvar canopy := Polygon2D.new()
-\t\tvar cr := randf_range(18, 35)
+\tfor i in range(rng.randi_range(2, 4)):
+\t\tvar cr := rng.randf_range(18, 35)
 \t\tvar cy := -h - i * cr * 0.5
-\t\tcanopy.polygon = _circle_poly(cr, 8)
-\t\tcanopy.position = Vector2(randf_range(-5, 5), cy)
-\t\tcanopy.color = b["foliage"].lerp(b["foliage_alt"], randf())
-\t\ttree.add_child(canopy)
-\tparent.add_child(tree)
-
-
-func _make_rock(parent: Node2D, pos: Vector2, b: Dictionary) -> void:
-\tvar rock := Polygon2D.new()
-\tvar w := randf_range(12, 30)
-\tvar h := randf_range(8, 20)
-\trock.polygon = PackedVector2Array([
+\t\tvar offset := pos + Vector2(rng.randf_range(-5, 5), cy)
+\t\tmesh.add_polygon(_circle_poly(cr, 8), offset, b["foliage"].lerp(b["foliage_alt"], rng.randf()))
+
+
+func _make_rock(mesh: DecoMesh, pos: Vector2, b: Dictionary, rng: RandomNumberGenerator) -> void:
+\tvar w := rng.randf_range(12, 30)
+\tvar h := rng.randf_range(8, 20)
+\tmesh.add_polygon(PackedVector2Array([
 \t\tVector2(-w/2, 0), Vector2(-w/2 + 3, -h * 0.8),
 \t\tVector2(-w/4, -h), Vector2(w/4, -h * 0.9),
 \t\tVector2(w/2 - 2, -h * 0.6), Vector2(w/2, 0),
-\t])
-\trock.position = pos
-\trock.color = b["ground_deep"].lightened(0.1)
-\tparent.add_child(rock)
-
-
-func _make_grass(parent: Node2D, pos: Vector2, b: Dictionary) -> void:
-\tfor i in range(randi_range(2, 5)):
-\t\tvar blade := Line2D.new()
-\t\tblade.width = 1.5
-\t\tvar bx := randf_range(-6, 6)
-\t\tvar bh := randf_range(6, 16)
-\t\tvar sway := randf_range(-4, 4)
-\t\tblade.add_point(pos + Vector2(bx, 0))
-\t\tblade.add_point(pos + Vector2(bx + sway, -bh))
-\t\tblade.default_color = b["foliage"].lerp(b["foliage_alt"], randf())
-\t\tparent.add_child(blade)
-
-
-func _make_flower(parent: Node2D, pos: Vector2, b: Dictionary) -> void:
-\tvar stem := Line2D.new()
-\tstem.width = 1.5
-\tstem.add_point(pos)
-\tstem.add_point(pos + Vector2(randf_range(-2, 2), -randf_range(10, 20)))
-\tstem.default_color = b["foliage"]
-\tparent.add_child(stem)
-\tvar bud := Polygon2D.new()
-\tbud.polygon = _circle_poly(4, 6)
-\tbud.position = stem.points[1]
-\tbud.color = b["accent"].lerp(Color.WHITE, randf_range(0, 0.3))
-\tparent.add_child(bud)
+\t]), pos, b["ground_deep"].lightened(0.1))
+
+
+func _make_grass(mesh: DecoMesh, pos: Vector2, b: Dictionary, rng: RandomNumberGenerator) -> void:
+\tfor i in range(rng.randi_range(2, 5)):
+\t\tvar bx := rng.randf_range(-6, 6)
+\t\tvar bh := rng.randf_range(6, 16)
+\t\tvar sway := rng.randf_range(-4, 4)
+\t\tvar color: Color = b["foliage"].lerp(b["foliage_alt"], rng.randf())
+\t\tmesh.add_line(pos + Vector2(bx, 0), pos + Vector2(bx + sway, -bh), 1.5, color)
+
+
+func _make_flower(mesh: DecoMesh, pos: Vector2, b: Dictionary, rng: RandomNumberGenerator) -> void:
+\tvar top := pos + Vector2(rng.randf_range(-2, 2), -rng.randf_range(10, 20))
+\tmesh.add_line(pos, top, 1.5, b["foliage"])
+\tmesh.add_polygon(_circle_poly(4, 6), top, b["accent"].lerp(Color.WHITE, rng.randf_range(0, 0.3)))
 
 
 # ── enemies ────────────────────────────────────────────────────────
-func _place_enemies() -> void:
-\tvar enemy_count := 8 + difficulty * 5
-\tvar walker_scene := preload("res://scenes/enemy_walker.tscn")
-\tvar flyer_scene := preload("res://scenes/enemy_flyer.tscn")
-\tvar charger_scene := preload("res://scenes/enemy_charger.tscn")
-\tvar scenes := [walker_scene, walker_scene, flyer_scene, charger_scene]
-\tfor i in enemy_count:
-\t\tvar ex := randf_range(T * 15, (world_width - 10) * T)
+func _place_enemies(chunk: Node2D, rng: RandomNumberGenerator, index: int, x0: float, x1: float) -> void:
+\tvar id := 0
+\tfor ex in _scatter(rng, 8 + difficulty * 5, 15, 10, x0, x1):
 \t\tvar sy := _surface_y(ex)
-\t\tvar scene: PackedScene = scenes[i % scenes.size()]
-\t\tif scene == flyer_scene:
-\t\t\tsy -= randf_range(60, 150)
+\t\tvar kind: int = ENEMY_CYCLE[rng.randi() % ENEMY_CYCLE.size()]
+\t\tif kind == WorldData.ENEMY_FLYER:
+\t\t\tsy -= rng.randf_range(60, 150)
 \t\telse:
 \t\t\tsy -= 20
-\t\tvar e := scene.instantiate()
-\t\te.position = Vector2(ex, sy)
-\t\tadd_child(e)
+\t\tid += 1
+\t\t_spawn_enemy(chunk, index, "e%d" % id, kind, Vector2(ex, sy))
+
+
+func _spawn_enemy(chunk: Node2D, index: int, id: String, kind: int, pos: Vector2) -> void:
+\t# Enemies carry a VisibleOnScreenEnabler2D, so off-screen ones stay disabled
+\tif _is_consumed(index, id):
+\t\treturn
+\tvar e: Node2D = ENEMY_SCENES[kind].instantiate()
+\te.position = pos
+\t_track(chunk, index, id, e)
 
 
 # ── collectibles ───────────────────────────────────────────────────
-func _place_collectibles(b: Dictionary) -> void:
-\tvar coin_scene := preload("res://scenes/collectible.tscn")
-\tvar count := 20 + difficulty * 5
-\tfor i in count:
-\t\tvar cx := randf_range(T * 5, (world_width - 5) * T)
-\t\tvar sy := _surface_y(cx)
-\t\tvar cy := sy - randf_range(30, 160)
-\t\tvar c := coin_scene.instantiate()
-\t\tc.position = Vector2(cx, cy)
-\t\tadd_child(c)
+func _place_collectibles(chunk: Node2D, rng: RandomNumberGenerator, index: int, x0: float, x1: float) -> void:
+\tvar id := 0
+\tfor cx in _scatter(rng, 20 + difficulty * 5, 5, 5, x0, x1):
+\t\tvar cy := _surface_y(cx) - rng.randf_range(30, 160)
+\t\tid += 1
+\t\t_spawn_coin(chunk, index, "c%d" % id, Vector2(cx, cy))
+
+
+func _spawn_coin(chunk: Node2D, index: int, id: String, pos: Vector2) -> void:
+\tif _is_consumed(index, id):
+\t\treturn
+\tvar c: Node2D = COIN_SCENE.instantiate()
+\tc.position = pos
+\t_track(chunk, index, id, c)
 
 
 # ── level exit ─────────────────────────────────────────────────────
-func _place_exit(b: Dictionary) -> void:
-\tvar exit := preload("res://scenes/level_exit.tscn").instantiate()
+func _place_exit(chunk: Node2D) -> void:
+\tvar exit := EXIT_SCENE.instantiate()
 \tvar ex := (world_width - 6) * T
 \texit.position = Vector2(ex, _surface_y(ex) - 40)
-\tadd_child(exit)
+\tchunk.add_child(exit)
 
 
 # ── player spawn ───────────────────────────────────────────────────
 func _spawn_player() -> void:
-\tvar player := preload("res://scenes/player.tscn").instantiate()
+\t_player = PLAYER_SCENE.instantiate()
 \t# Spawn well inside the terrain to avoid left-edge gap
 \tvar sx: float = T * 12.0
-\tplayer.position = Vector2(sx, _surface_y(sx) - 40)
-\tadd_child(player)
+\t_player.position = Vector2(sx, _surface_y(sx) - 40)
+\tadd_child(_player)
 
 
 # ── ambient particles ──────────────────────────────────────────────
 func _add_ambient_particles(b: Dictionary) -> void:
-\tvar particles := GPUParticles2D.new()
-\tparticles.amount = 40
-\tparticles.lifetime = 5.0
-\tparticles.visibility_rect = Rect2(-800, -500, 1600, 1000)
-\tparticles.position = Vector2(world_width * T / 2.0, world_height * T / 2.0)
+\t# Follows the camera horizontally (see _process) rather than spanning the level
 \tvar mat := ParticleProcessMaterial.new()
 \tmat.emission_shape = ParticleProcessMaterial.EMISSION_SHAPE_BOX
 \tmat.emission_box_extents = Vector3(800, 400, 0)
@@ -430,8 +643,19 @@ func _add_ambient_particles(b: Dictionary) -> void:
 \tmat.scale_min = 1.0
 \tmat.scale_max = 3.0
 \tmat.color = b["particle"]
-\tparticles.process_material = mat
-\tadd_child(particles)
+\tvar visibility := Rect2(-800, -500, 1600, 1000)
+\tvar perf := get_node_or_null("/root/PerfMonitor")
+\tif perf:
+\t\t_particles = perf.ambient_particles(mat, 40, 5.0, visibility)
+\telse:
+\t\tvar gpu := GPUParticles2D.new()
+\t\tgpu.amount = 40
+\t\tgpu.lifetime = 5.0
+\t\tgpu.visibility_rect = visibility
+\t\tgpu.process_material = mat
+\t\t_particles = gpu
+\t_particles.position = Vector2(_player.position.x, world_height * T / 2.0)
+\tadd_child(_particles)
 
 
 # ── camera bounds ──────────────────────────────────────────────────
@@ -465,6 +689,38 @@ func _circle_poly(radius: float, segments: int) -> PackedVector2Array:
 \treturn pts
 ''')
 
+        self._write("scripts/world/world_data.gd", '''extends Resource
+## A platformer level's layout, baked while the project is generated
+## (app/generator/world_baker.py) and read by world_generator.gd.
+##
+## Entity arrays are sorted by x. <kind>_chunks[i] is the index of the first
+## entity in chunk i and <kind>_chunks[i + 1] one past its last.
+
+enum { DECOR_NONE, DECOR_TREE, DECOR_ROCK, DECOR_GRASS, DECOR_FLOWER }
+enum { ENEMY_WALKER, ENEMY_FLYER, ENEMY_CHARGER }
+
+@export var heights := PackedFloat32Array()  # surface y per tile column
+@export var decorations := PackedByteArray()  # DECOR_* per tile column
+@export var platforms := PackedVector3Array()  # x, y, width
+@export var platform_chunks := PackedInt32Array()
+@export var enemies := PackedVector3Array()  # x, y, ENEMY_*
+@export var enemy_chunks := PackedInt32Array()
+@export var collectibles := PackedVector2Array()
+@export var collectible_chunks := PackedInt32Array()
+''')
+
+    # ═══════════════════════════════════════════════════════════════════
+    #  PLAYER — wall-jump, dash, coyote time, attack
+    # ═══════════════════════════════════════════════════════════════════
+
+    def _write_player(self) -> None:
+        component_dir = Path(__file__).parent.parent / "components"
+        script_code = (component_dir / "player_platformer.gd").read_text()
+        self._write("scripts/player.gd", script_code)
+        self._write("scenes/player.tscn", '''[gd_scene load_steps=3 format=3]
+
+[ext_resource type="Script" path="res://scripts/player.gd" id="1"]
+
 [sub_resource type="RectangleShape2D" id="pcol"]
 size = Vector2(16, 38)
 
@@ -532,6 +788,14 @@ var _base_y := 0.0
 func _ready() -> void:
 \t_base_y = position.y
 \tbody_entered.connect(_on_pickup)
+\tvar art := SpriteGenerator.get_art("collectible")
+\tif art:
+\t\t$Visual.visible = false
+\t\t$Shine.visible = false
+\t\tvar sprite := Sprite2D.new()
+\t\tsprite.texture = art
+\t\tsprite.scale = Vector2(0.5, 0.5)
+\t\tadd_child(sprite)
 \t# golden glow
 \tvar glow := PointLight2D.new()
 \tglow.color = Color(1, 0.85, 0.2, 0.6)
@@ -551,7 +815,7 @@ func _on_pickup(body: Node2D) -> void:
 \t\tGameManager.add_score(SCORE)
 \t\tqueue_free()
 ''')
-        self._write("scenes/collectible.tscn", '''[gd_scene load_steps=2 format=3]
+        self._write("scenes/collectible.tscn", '''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/collectible.gd" id="1"]
 
@@ -604,7 +868,7 @@ func _on_enter(body: Node2D) -> void:
 \t\tGameManager.add_score(100)
 \t\tLevelManager.advance_level()
 ''')
-        self._write("scenes/level_exit.tscn", '''[gd_scene load_steps=2 format=3]
+        self._write("scenes/level_exit.tscn", '''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/level_exit.gd" id="1"]
 
@@ -676,13 +940,22 @@ func flash(color: Color, duration: float) -> void:
         biome = biomes[min(level_num - 1, len(biomes) - 1)]
         width = 180 + level_num * 30
         seed_val = level_num * 1000 + 42
+        height = 50
 
-        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps=4 format=3]
+        # Bake the layout now so the level only has to read it
+        world = bake_world_resource(seed_val, width, height, level_num)
+        world_ext, world_prop = "", ""
+        if world:
+            self._write(f"levels/level_{level_num}.tres", world)
+            world_ext = f'[ext_resource type="Resource" path="res://levels/level_{level_num}.tres" id="world"]\n'
+            world_prop = 'world_data = ExtResource("world")\n'
+
+        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps={5 if world else 4} format=3]
 
 [ext_resource type="Script" path="res://scripts/world/world_generator.gd" id="1"]
 [ext_resource type="PackedScene" path="res://scenes/hud.tscn" id="hud"]
 [ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]
-
+{world_ext}
 [node name="Level{level_num}" type="Node2D"]
 
 [node name="WorldGenerator" type="Node2D" parent="."]
@@ -691,7 +964,8 @@ biome = "{biome}"
 difficulty = {level_num}
 level_seed = {seed_val}
 world_width = {width}
-
+world_height = {height}
+{world_prop}
 [node name="HUD" parent="." instance=ExtResource("hud")]
 
 [node name="PauseMenu" parent="." instance=ExtResource("pause")]
@@ -3,18 +3,30 @@
 Each level has a different grid configuration with increasing difficulty:
 - Level 1: Small grid, few colors, low score target
 - Level 2: Medium grid, more colors, higher score target
-- Level 3+: Large grid, many colors, demanding score target
+- Level 3+: Large grid (up to 20x20), many colors, demanding score target
 """
 
 from __future__ import annotations
 
+from app.generator.puzzle_baker import REFILL_LENGTH, bake_board_resource
 from app.generator.templates.base import BaseTemplate
 
+MAX_GRID = 20
+# Side of the square the grid is fitted into, in pixels
+GRID_AREA = 560
+
+
+def level_config(level_num: int) -> tuple[int, int, int, int]:
+    """(cols, rows, colors, score target) for a level."""
+    size = min(MAX_GRID, 4 + level_num * 2)
+    return size, size, min(3 + level_num, 6), 100 + level_num * 100
+
 
 class PuzzleTemplate(BaseTemplate):
 
     def generate_game_scenes(self) -> None:
         self._write_grid_logic()
+        self._write_board_data()
         for i in range(self.spec.level_count):
             self._write_level(i + 1)
 
@@ -26,13 +38,21 @@ class PuzzleTemplate(BaseTemplate):
         accent = self._hex_to_godot_color(self.spec.color_accent)
         self._write("scripts/puzzle_grid.gd", f'''extends Control
 ## Puzzle grid — click tiles to clear matching groups. Reach score target to advance.
+## Tiles live in one row-major PackedInt32Array; a click flood-fills it
+## iteratively, collapses only the columns it cleared and restyles only the
+## buttons whose colour changed, from one shared set of StyleBoxes per colour.
+## A board baked by the generator fixes the starting tiles, the colours that
+## refill each column and the move limit; without one the fill is random.
 
-var grid_cols: int = 6
-var grid_rows: int = 6
-var color_count: int = 4
-var score_target: int = 200
+@export var grid_cols: int = 6
+@export var grid_rows: int = 6
+@export var color_count: int = 4
+@export var score_target: int = 200
+@export var tile_size: int = 60
+@export var board: Resource  # PuzzleBoard baked by the generator (puzzle_board.gd)
+
+const PuzzleBoard := preload("res://scripts/puzzle_board.gd")
 
-const TILE_SIZE := 60
 const BASE_COLORS: Array[Color] = [
 \tColor{primary},
 \tColor{secondary},
@@ -42,15 +62,23 @@ const BASE_COLORS: Array[Color] = [
 \tColor(0.95, 0.5, 0.15, 1),
 ]
 
-var grid: Array = []
+var cells := PackedInt32Array()  # colour index per tile, row-major
 var moves: int = 0
-var _buttons: Array = []
+var move_limit: int = 0  # 0 = unlimited
+var _buttons: Array[Button] = []
+var _shown := PackedInt32Array()  # colour each button is currently styled with
+var _dirty := PackedInt32Array()  # tiles that may have changed since the last redraw
+var _styles: Array[StyleBoxFlat] = []  # normal, hover, pressed for each colour
 var _level_score: int = 0
+var _refills := PackedByteArray()  # PuzzleBoard.refills, empty for random refills
+var _refill_pos := PackedInt32Array()  # next queued colour per column
 
 
 func _ready() -> void:
 \tGameManager.game_over.connect(_on_game_over)
+\t_build_styles()
 \t_build_grid()
+\t_update_moves_label()
 \t_update_target_label()
 
 
@@ -61,28 +89,37 @@ func setup(cols: int, rows: int, colors: int, target: int) -> void:
 \tscore_target = target
 
 
+func _build_styles() -> void:
+\t_styles.clear()
+\tfor color in BASE_COLORS:
+\t\t_styles.append(_make_style(color))
+\t\t_styles.append(_make_style(color.lightened(0.2)))
+\t\t_styles.append(_make_style(color.darkened(0.2)))
+
+
 func _build_grid() -> void:
 \tfor child in $GridContainer.get_children():
 \t\tchild.queue_free()
-\tgrid.clear()
 \t_buttons.clear()
 \t$GridContainer.columns = grid_cols
-\tfor row in grid_rows:
-\t\tvar grid_row: Array[int] = []
-\t\tvar btn_row: Array = []
-\t\tfor col in grid_cols:
-\t\t\tvar color_idx := randi() % color_count
-\t\t\tgrid_row.append(color_idx)
-\t\t\tvar btn := Button.new()
-\t\t\tbtn.custom_minimum_size = Vector2(TILE_SIZE, TILE_SIZE)
-\t\t\tbtn.add_theme_stylebox_override("normal", _make_style(BASE_COLORS[color_idx]))
-\t\t\tbtn.add_theme_stylebox_override("hover", _make_style(BASE_COLORS[color_idx].lightened(0.2)))
-\t\t\tbtn.add_theme_stylebox_override("pressed", _make_style(BASE_COLORS[color_idx].darkened(0.2)))
-\t\t\tbtn.pressed.connect(_on_tile_pressed.bind(row, col))
-\t\t\t$GridContainer.add_child(btn)
-\t\t\tbtn_row.append(btn)
-\t\tgrid.append(grid_row)
-\t\t_buttons.append(btn_row)
+\tcells.resize(grid_cols * grid_rows)
+\t_shown.resize(cells.size())
+\t_shown.fill(-1)
+\tvar baked: PackedByteArray = board.cells if board else PackedByteArray()
+\tif baked.size() == cells.size():
+\t\t_refills = board.refills
+\t\tmove_limit = board.move_limit
+\t_refill_pos.resize(grid_cols)
+\t_refill_pos.fill(0)
+\tfor i in cells.size():
+\t\tcells[i] = baked[i] if baked.size() == cells.size() else randi() % color_count
+\t\tvar btn := Button.new()
+\t\tbtn.custom_minimum_size = Vector2(tile_size, tile_size)
+\t\tbtn.pressed.connect(_on_tile_pressed.bind(i))
+\t\t$GridContainer.add_child(btn)
+\t\t_buttons.append(btn)
+\t\t_dirty.append(i)
+\t_refresh_visuals()
 
 
 func _make_style(color: Color) -> StyleBoxFlat:
@@ -95,76 +132,129 @@ func _make_style(color: Color) -> StyleBoxFlat:
 \treturn sb
 
 
-func _on_tile_pressed(row: int, col: int) -> void:
-\tvar target_color: int = grid[row][col]
-\tvar matched: Array = []
-\t_flood_fill(row, col, target_color, matched)
+func _on_tile_pressed(index: int) -> void:
+\tvar matched := _flood_fill(index)
 \tif matched.size() < 2:
 \t\treturn
 \tmoves += 1
-\t$MovesLabel.text = "Moves: " + str(moves)
+\t_update_moves_label()
 \tvar pts := matched.size() * 5
 \tGameManager.add_score(pts)
 \t_level_score += pts
-\tfor coord in matched:
-\t\tgrid[coord.x][coord.y] = -1
-\t_collapse_columns()
-\t_refill()
+\t_collapse_columns(matched)
 \t_refresh_visuals()
 \t_update_target_label()
 \tif _level_score >= score_target:
 \t\tLevelManager.advance_level()
-
-
-func _flood_fill(row: int, col: int, target: int, result: Array) -> void:
-\tif row < 0 or row >= grid_rows or col < 0 or col >= grid_cols:
-\t\treturn
-\tif grid[row][col] != target:
-\t\treturn
-\tvar coord := Vector2i(row, col)
-\tif coord in result:
-\t\treturn
-\tresult.append(coord)
-\t_flood_fill(row - 1, col, target, result)
-\t_flood_fill(row + 1, col, target, result)
-\t_flood_fill(row, col - 1, target, result)
-\t_flood_fill(row, col + 1, target, result)
-
-
-func _collapse_columns() -> void:
+\telif move_limit > 0 and moves >= move_limit:
+\t\t# A failed attempt's points don't count, or retrying would farm score
+\t\tGameManager.score -= _level_score
+\t\tLevelManager.restart_level()
+
+
+## Indices of the group of same-coloured tiles connected to *start*.
+func _flood_fill(start: int) -> PackedInt32Array:
+\tvar target := cells[start]
+\tvar matched := PackedInt32Array()
+\tvar seen := PackedByteArray()
+\tseen.resize(cells.size())
+\tseen[start] = 1
+\tvar stack := PackedInt32Array([start])
+\twhile not stack.is_empty():
+\t\tvar i := stack[stack.size() - 1]
+\t\tstack.resize(stack.size() - 1)
+\t\tmatched.append(i)
+\t\tvar col := i % grid_cols
+\t\tvar neighbours := PackedInt32Array([
+\t\t\ti - grid_cols,
+\t\t\ti + grid_cols,
+\t\t\ti - 1 if col > 0 else -1,
+\t\t\ti + 1 if col < grid_cols - 1 else -1,
+\t\t])
+\t\tfor n in neighbours:
+\t\t\tif n >= 0 and n < cells.size() and seen[n] == 0 and cells[n] == target:
+\t\t\t\tseen[n] = 1
+\t\t\t\tstack.append(n)
+\treturn matched
+
+
+## Clears *matched*, drops the tiles above them and refills each cleared
+## column from the top. Columns without a cleared tile are left alone.
+func _collapse_columns(matched: PackedInt32Array) -> void:
+\tvar lowest := PackedInt32Array()  # lowest cleared row per column, -1 if none
+\tlowest.resize(grid_cols)
+\tlowest.fill(-1)
+\tfor i in matched:
+\t\tcells[i] = -1
+\t\tlowest[i % grid_cols] = maxi(lowest[i % grid_cols], floori(float(i) / grid_cols))
 \tfor col in grid_cols:
-\t\tvar write_row := grid_rows - 1
-\t\tfor row in range(grid_rows - 1, -1, -1):
-\t\t\tif grid[row][col] != -1:
-\t\t\t\tgrid[write_row][col] = grid[row][col]
-\t\t\t\tif write_row != row:
-\t\t\t\t\tgrid[row][col] = -1
+\t\tif lowest[col] < 0:
+\t\t\tcontinue
+\t\tvar write_row := lowest[col]
+\t\tfor row in range(lowest[col], -1, -1):
+\t\t\tvar value := cells[row * grid_cols + col]
+\t\t\tif value != -1:
+\t\t\t\tcells[write_row * grid_cols + col] = value
 \t\t\t\twrite_row -= 1
+\t\tfor row in range(write_row, -1, -1):
+\t\t\tcells[row * grid_cols + col] = _next_color(col)
+\t\tfor row in lowest[col] + 1:
+\t\t\t_dirty.append(row * grid_cols + col)
 
 
-func _refill() -> void:
-\tfor row in grid_rows:
-\t\tfor col in grid_cols:
-\t\t\tif grid[row][col] == -1:
-\t\t\t\tgrid[row][col] = randi() % color_count
+## The next colour to drop into *col*: from the board's queue for that
+## column when there is one, so the game refills as the generator's
+## playthrough did.
+func _next_color(col: int) -> int:
+\tif _refills.is_empty():
+\t\treturn randi() % color_count
+\tvar color := _refills[col * PuzzleBoard.REFILL_LENGTH + _refill_pos[col] % PuzzleBoard.REFILL_LENGTH]
+\t_refill_pos[col] += 1
+\treturn color
 
 
 func _refresh_visuals() -> void:
-\tfor row in grid_rows:
-\t\tfor col in grid_cols:
-\t\t\tvar color_idx: int = grid[row][col]
-\t\t\tvar btn: Button = _buttons[row][col]
-\t\t\tbtn.add_theme_stylebox_override("normal", _make_style(BASE_COLORS[color_idx]))
-\t\t\tbtn.add_theme_stylebox_override("hover", _make_style(BASE_COLORS[color_idx].lightened(0.2)))
+\tfor i in _dirty:
+\t\tvar color_idx := cells[i]
+\t\tif _shown[i] == color_idx:
+\t\t\tcontinue
+\t\t_shown[i] = color_idx
+\t\tvar btn := _buttons[i]
+\t\tbtn.add_theme_stylebox_override("normal", _styles[color_idx * 3])
+\t\tbtn.add_theme_stylebox_override("hover", _styles[color_idx * 3 + 1])
+\t\tbtn.add_theme_stylebox_override("pressed", _styles[color_idx * 3 + 2])
+\t_dirty.clear()
+
+
+func _update_moves_label() -> void:
+\t$MovesLabel.text = "Moves: " + str(moves)
+\tif move_limit > 0:
+\t\t$MovesLabel.text += " / " + str(move_limit)
 
 
 func _update_target_label() -> void:
-\tvar remaining := max(0, score_target - _level_score)
+\tvar remaining := maxi(0, score_target - _level_score)
 \t$TargetLabel.text = "Target: " + str(remaining) + " pts"
 
 
 func _on_game_over() -> void:
 \tGameManager.go_to_scene("res://scenes/game_over.tscn")
+''')
+
+    def _write_board_data(self) -> None:
+        self._write("scripts/puzzle_board.gd", f'''extends Resource
+## A puzzle level's board, dealt while the project is generated
+## (app/generator/puzzle_baker.py) and read by puzzle_grid.gd.
+##
+## refills holds REFILL_LENGTH colours per column, column-major; cleared
+## columns take them in order and wrap around.
+
+const REFILL_LENGTH := {REFILL_LENGTH}
+
+@export var cells := PackedByteArray()  # colour index per tile, row-major
+@export var refills := PackedByteArray()
+@export var par_moves := 0  # clicks the generator's greedy playthrough needed
+@export var move_limit := 0
 ''')
 
     # ── level generation ─────────────────────────────────────────────────
@@ -173,17 +263,26 @@ func _on_game_over() -> void:
         bg = self._hex_to_godot_color(self.spec.color_bg)
         ground = self._hex_to_godot_color(self.spec.color_ground)
 
-        cols = 5 + level_num
-        rows = 5 + level_num
-        color_count = min(3 + level_num, 6)
-        score_target = 100 + level_num * 100
+        cols, rows, color_count, score_target = level_config(level_num)
+        # Shrink tiles so the grid (4 px gaps) fits in GRID_AREA pixels
+        tile_size = min(60, (GRID_AREA + 4) // cols - 4)
+        half = (cols * (tile_size + 4) - 4) // 2
+
+        # Deal a solvable board now so the level doesn't depend on luck
+        board = bake_board_resource(level_num * 1000 + 42, cols, rows, color_count, score_target,
+                                    self.spec.difficulty)
+        board_ext, board_prop = "", ""
+        if board:
+            self._write(f"levels/level_{level_num}.tres", board)
+            board_ext = f'[ext_resource type="Resource" path="res://levels/level_{level_num}.tres" id="board"]\n'
+            board_prop = 'board = ExtResource("board")\n'
 
-        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps=4 format=3]
+        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps={5 if board else 4} format=3]
 
 [ext_resource type="Script" path="res://scripts/puzzle_grid.gd" id="1"]
 [ext_resource type="PackedScene" path="res://scenes/hud.tscn" id="hud"]
 [ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]
-
+{board_ext}
 [node name="Game" type="Control"]
 layout_mode = 3
 anchors_preset = 15
@@ -194,7 +293,8 @@ grid_cols = {cols}
 grid_rows = {rows}
 color_count = {color_count}
 score_target = {score_target}
-
+tile_size = {tile_size}
+{board_prop}
 [node name="BG" type="ColorRect" parent="."]
 layout_mode = 1
 anchors_preset = 15
@@ -209,10 +309,10 @@ anchor_left = 0.5
 anchor_top = 0.5
 anchor_right = 0.5
 anchor_bottom = 0.5
-offset_left = -200.0
-offset_top = -200.0
-offset_right = 200.0
-offset_bottom = 200.0
+offset_left = -{half}.0
+offset_top = -{half}.0
+offset_right = {half}.0
+offset_bottom = {half}.0
 columns = {cols}
 theme_override_constants/h_separation = 4
 theme_override_constants/v_separation = 4
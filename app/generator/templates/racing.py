@@ -4,18 +4,32 @@ Each level is a different track with increasing difficulty:
 - Level 1: Wide road, few obstacles, generous timer
 - Level 2: Narrower road, more obstacles, tighter timer
 - Level 3+: Tight road, dense obstacles, fast scrolling
+
+Lane markings are drawn and scrolled by one road shader, and the track is
+streamed in seeded segments whose obstacles come from a pre-sized pool
+under a single scrolling node.
 """
 
 from __future__ import annotations
 
+import math
+
 from app.generator.templates.base import BaseTemplate
 
+# Mirror game_level.gd
+SEGMENT_LENGTH = 800
+LOOKAHEAD = 100
+DESPAWN_Y = 800
+
 
 class RacingTemplate(BaseTemplate):
 
     def generate_game_scenes(self) -> None:
+        self._write_object_pool()
         self._write_player()
         self._write_obstacle()
+        self._write_road_shader()
+        self._write_game_level()
         for i in range(self.spec.level_count):
             self._write_level(i + 1)
 
@@ -61,7 +75,7 @@ func _check_off_road() -> void:
 \t\tposition.y = clamp(position.y, 0, 720)
 \t\tspeed *= 0.5
 ''')
-        self._write("scenes/player.tscn", f'''[gd_scene load_steps=2 format=3]
+        self._write("scenes/player.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/player.gd" id="1"]
 
@@ -84,17 +98,11 @@ shape = SubResource("pcol")
     def _write_obstacle(self) -> None:
         secondary = self._hex_to_godot_color(self.spec.color_secondary)
         self._write("scripts/obstacle.gd", '''extends StaticBody2D
-
-var scroll_speed := 200.0
-
-
-func _process(delta: float) -> void:
-\tposition.y += scroll_speed * delta
-\tif position.y > 800:
-\t\tposition.y = -60
-\t\tposition.x = randf_range(80, 1200)
+## Track obstacle. It doesn't move itself: game_level.gd places it in the
+## ObstaclePool under the scrolling Track node and releases it once it has
+## scrolled past.
 ''')
-        self._write("scenes/obstacle.tscn", f'''[gd_scene load_steps=2 format=3]
+        self._write("scenes/obstacle.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/obstacle.gd" id="1"]
 
@@ -113,41 +121,160 @@ color = Color{secondary}
 
 [node name="CollisionShape2D" type="CollisionShape2D" parent="."]
 shape = SubResource("ocol")
+''')
+
+    # ── road shader ─────────────────────────────────────────────────────
+
+    def _write_road_shader(self) -> None:
+        self._write("shaders/road.gdshader", '''shader_type canvas_item;
+// Scrolling road for the racing levels: base colour, a faint centre line
+// and dashed lane edges. game_level.gd advances `scroll` (pixels driven)
+// each frame; nothing else on the road moves.
+
+uniform vec4 road_color : source_color = vec4(0.18, 0.35, 0.15, 1.0);
+uniform vec4 dash_color : source_color = vec4(1.0, 1.0, 0.6, 0.4);
+uniform vec4 center_color : source_color = vec4(1.0, 1.0, 1.0, 0.3);
+uniform vec2 size = vec2(880.0, 720.0);
+uniform float scroll = 0.0;
+uniform float dash_length = 30.0;
+uniform float dash_period = 80.0;
+uniform float edge_inset = 22.0;
+
+void fragment() {
+\tvec2 px = UV * size;
+\tvec4 color = road_color;
+\tif (abs(px.x - size.x * 0.5) < 4.0) {
+\t\tcolor.rgb = mix(color.rgb, center_color.rgb, center_color.a);
+\t}
+\tbool dash = mod(px.y - scroll, dash_period) < dash_length;
+\tbool edge = abs(px.x - edge_inset) < 2.0 || abs(px.x - (size.x - edge_inset)) < 2.0;
+\tif (dash && edge) {
+\t\tcolor.rgb = mix(color.rgb, dash_color.rgb, dash_color.a);
+\t}
+\tCOLOR = color;
+}
 ''')
 
     # ── level generation ─────────────────────────────────────────────────
 
+    def _write_game_level(self) -> None:
+        self._write("scripts/game_level.gd", '''extends Node2D
+## Racing level. The road is one ColorRect whose shader draws the lane
+## markings and scrolls them by a uniform; obstacles come from a pre-sized
+## ObjectPool under the Track node, which scrolls them all with a single
+## transform. The track is streamed a segment at a time from level_seed,
+## so a level's length and density don't add nodes or per-frame work.
+
+const SEGMENT_LENGTH := 800.0
+const LOOKAHEAD := 100.0  # a segment is laid out when its first row is this far above the screen
+const SAFE_START := 300.0  # track distance kept clear at the start
+const DESPAWN_Y := 800.0
+const EDGE_MARGIN := 40.0
+
+const ObjectPool := preload("res://scripts/object_pool.gd")
+
+@export var scroll_speed := 200.0
+@export var track_length := 6000.0
+@export var obstacles_per_segment := 4
+@export var level_seed := 0
+
+var distance := 0.0
+var _next_segment := 0
+var _active: Array[Node2D] = []  # obstacles on the track, in track order
+var _finished := false
+var _road_left := 0.0
+var _road_right := 0.0
+var _road_material: ShaderMaterial
+
+@onready var _track: Node2D = $Track
+@onready var _obstacles: ObjectPool = $Track/ObstaclePool
+
+
+func _ready() -> void:
+\tGameManager.game_over.connect(_on_game_over)
+\t$ScoreTimer.timeout.connect(_on_score_tick)
+\t_road_left = $Road.offset_left
+\t_road_right = $Road.offset_right
+\t_road_material = $Road.material as ShaderMaterial
+\t_stream_track()
+
+
+func _on_score_tick() -> void:
+\tGameManager.add_score(1)
+
+
+func _process(delta: float) -> void:
+\tdistance += scroll_speed * delta
+\t_track.position.y = distance
+\t_road_material.set_shader_parameter("scroll", distance)
+\t_stream_track()
+\tif not _finished and distance >= track_length:
+\t\t_finished = true
+\t\tLevelManager.advance_level()
+
+
+## Lays out the segments coming into view and returns the obstacles that
+## have scrolled off the bottom to the pool.
+func _stream_track() -> void:
+\twhile not _active.is_empty() and distance + _active[0].position.y > DESPAWN_Y:
+\t\t_obstacles.release(_active.pop_front())
+\twhile distance >= _next_segment * SEGMENT_LENGTH - LOOKAHEAD and _next_segment * SEGMENT_LENGTH < track_length:
+\t\t_lay_segment(_next_segment)
+\t\t_next_segment += 1
+
+
+## One obstacle per evenly spaced row, in a lane picked by the segment's
+## own RNG, so every row can be driven around and replays are identical.
+func _lay_segment(index: int) -> void:
+\tvar rng := RandomNumberGenerator.new()
+\trng.seed = hash([level_seed, index])
+\tvar spacing := SEGMENT_LENGTH / obstacles_per_segment
+\tfor row in obstacles_per_segment:
+\t\tvar at := index * SEGMENT_LENGTH + (row + 0.5) * spacing
+\t\tif at < SAFE_START or at > track_length:
+\t\t\tcontinue
+\t\tvar obstacle := _obstacles.acquire() as Node2D
+\t\tobstacle.position = Vector2(rng.randf_range(_road_left + EDGE_MARGIN, _road_right - EDGE_MARGIN), -at)
+\t\t_active.append(obstacle)
+
+
+func _on_game_over() -> void:
+\tGameManager.go_to_scene("res://scenes/game_over.tscn")
+''')
+
     def _write_level(self, level_num: int) -> None:
         bg = self._hex_to_godot_color(self.spec.color_bg)
         ground = self._hex_to_godot_color(self.spec.color_ground)
-        accent = self._hex_to_godot_color(self.spec.color_accent)
 
-        obstacle_count = 3 + level_num * 2
+        per_segment = 3 + level_num * 2
         scroll_speed = 150 + level_num * 50
-        goal_score = 20 + level_num * 15
+        track_length = scroll_speed * (20 + level_num * 15)
         road_left = max(150, 250 - level_num * 30)
         road_right = min(1130, 1030 + level_num * 30)
-        road_width = road_right - road_left
+        # Obstacles exist from LOOKAHEAD plus a segment above the screen down to DESPAWN_Y
+        pool_size = math.ceil((DESPAWN_Y + LOOKAHEAD + SEGMENT_LENGTH) / SEGMENT_LENGTH * per_segment) + 2
 
-        obstacles = ""
-        for i in range(obstacle_count):
-            ox = road_left + 50 + (i * (road_width - 100)) // max(1, obstacle_count - 1)
-            oy = -100 - i * 200
-            obstacles += f'''
-[node name="Obstacle{i+1}" parent="." instance=ExtResource("obstacle")]
-position = Vector2({ox}, {oy})
-'''
-
-        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps=6 format=3]
+        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps=9 format=3]
 
 [ext_resource type="Script" path="res://scripts/game_level.gd" id="1"]
 [ext_resource type="PackedScene" path="res://scenes/player.tscn" id="player"]
 [ext_resource type="PackedScene" path="res://scenes/obstacle.tscn" id="obstacle"]
+[ext_resource type="Script" path="res://scripts/object_pool.gd" id="pool"]
+[ext_resource type="Shader" path="res://shaders/road.gdshader" id="road"]
 [ext_resource type="PackedScene" path="res://scenes/hud.tscn" id="hud"]
 [ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]
 
+[sub_resource type="ShaderMaterial" id="road_material"]
+shader = ExtResource("road")
+shader_parameter/road_color = Color{ground}
+shader_parameter/size = Vector2({road_right - road_left}, 720)
+
 [node name="Game" type="Node2D"]
 script = ExtResource("1")
+scroll_speed = {scroll_speed}.0
+track_length = {track_length}.0
+obstacles_per_segment = {per_segment}
+level_seed = {level_num * 1000 + 42}
 
 [node name="BG" type="ColorRect" parent="."]
 offset_right = 1280.0
@@ -155,89 +282,26 @@ offset_bottom = 720.0
 color = Color{bg}
 
 [node name="Road" type="ColorRect" parent="."]
+material = SubResource("road_material")
 offset_left = {road_left}.0
 offset_right = {road_right}.0
 offset_bottom = 720.0
-color = Color{ground}
 
-[node name="CenterLine" type="ColorRect" parent="."]
-offset_left = {(road_left + road_right) // 2 - 4}.0
-offset_right = {(road_left + road_right) // 2 + 4}.0
-offset_bottom = 720.0
-color = Color(1, 1, 1, 0.3)
+[node name="Track" type="Node2D" parent="."]
+
+[node name="ObstaclePool" type="Node2D" parent="Track"]
+script = ExtResource("pool")
+scene = ExtResource("obstacle")
+size = {pool_size}
 
 [node name="Player" parent="." instance=ExtResource("player")]
 position = Vector2({(road_left + road_right) // 2}, 550)
-{obstacles}
+
 [node name="ScoreTimer" type="Timer" parent="."]
 wait_time = 0.5
 autostart = true
 
-[node name="LevelGoalTimer" type="Timer" parent="."]
-wait_time = {goal_score}
-one_shot = true
-autostart = true
-
 [node name="HUD" parent="." instance=ExtResource("hud")]
 
 [node name="PauseMenu" parent="." instance=ExtResource("pause")]
-''')
-
-        self._write("scripts/game_level.gd", f'''extends Node2D
-
-var _road_lines: Array = []
-const SCROLL_SPEED: float = {scroll_speed}.0
-const OBSTACLE_SPEED: float = {scroll_speed}.0
-
-
-func _ready() -> void:
-\tGameManager.game_over.connect(_on_game_over)
-\t$ScoreTimer.timeout.connect(_on_score_tick)
-\t$LevelGoalTimer.timeout.connect(_on_level_goal)
-\t_create_road_lines()
-\t_set_obstacle_speeds()
-
-
-func _on_score_tick() -> void:
-\tGameManager.add_score(1)
-
-
-func _on_level_goal() -> void:
-\tLevelManager.advance_level()
-
-
-func _process(delta: float) -> void:
-\tfor line in _road_lines:
-\t\tline.position.y += SCROLL_SPEED * delta
-\t\tif line.position.y > 740:
-\t\t\tline.position.y -= 800
-
-
-func _create_road_lines() -> void:
-\tvar road := $Road
-\tvar road_left := road.offset_left
-\tvar road_right := road.offset_right
-\tfor i in 10:
-\t\tvar dash := ColorRect.new()
-\t\tdash.size = Vector2(4, 30)
-\t\tdash.color = Color(1, 1, 0.6, 0.4)
-\t\tdash.position = Vector2(road_left + 20, i * 80.0)
-\t\tadd_child(dash)
-\t\t_road_lines.append(dash)
-\t\tvar dash2 := ColorRect.new()
-\t\tdash2.size = Vector2(4, 30)
-\t\tdash2.color = Color(1, 1, 0.6, 0.4)
-\t\tdash2.position = Vector2(road_right - 24, i * 80.0)
-\t\tadd_child(dash2)
-\t\t_road_lines.append(dash2)
-
-
-func _set_obstacle_speeds() -> void:
-\tfor child in get_children():
-\t\tif child.has_method("_process") and child.name.begins_with("Obstacle"):
-\t\t\tchild.scroll_speed = OBSTACLE_SPEED
-
-
-func _on_game_over() -> void:
-\tGameManager.go_to_scene("res://scenes/game_over.tscn")
 ''')
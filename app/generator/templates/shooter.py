@@ -4,20 +4,36 @@ Each level is a wave with increasing enemy density:
 - Level 1: Few slow enemies, gentle introduction
 - Level 2: More enemies, faster sine-wave patterns
 - Level 3+: Dense waves, faster descent, tighter dodging
+
+Bullets, enemy ships and explosions are recycled through per-level object
+pools (scripts/object_pool.gd) sized from the level's spawn rate, so a dense
+wave doesn't instantiate and free scenes every frame.
 """
 
 from __future__ import annotations
 
+import math
+
 from app.generator.templates.base import BaseTemplate
 
+# Mirror player.gd / bullet.gd / explosion.tscn
+FIRE_RATE = 0.18
+BULLET_SPEED = 700.0
+EXPLOSION_LIFETIME = 0.6
+# Pool headroom over the expected peak, per spec.difficulty
+POOL_HEADROOM = {"easy": 1.0, "normal": 1.25, "hard": 1.5}
+
 
 class ShooterTemplate(BaseTemplate):
 
     def generate_game_scenes(self) -> None:
+        self._write_object_pool()
         self._write_player()
         self._write_bullet()
         if self.spec.has_enemies:
             self._write_enemy()
+            self._write_explosion()
+        self._write_game_level()
         for i in range(self.spec.level_count):
             self._write_level(i + 1)
 
@@ -31,8 +47,10 @@ class ShooterTemplate(BaseTemplate):
 const SPEED := 400.0
 const FIRE_RATE := 0.18
 
+const ObjectPool := preload("res://scripts/object_pool.gd")
+
 var _fire_timer := 0.0
-var bullet_scene: PackedScene = preload("res://scenes/bullet.tscn")
+@onready var _bullets: ObjectPool = get_parent().get_node("BulletPool")
 
 
 func _ready() -> void:
@@ -55,17 +73,14 @@ func _process(delta: float) -> void:
 
 
 func _shoot() -> void:
-\tvar b := bullet_scene.instantiate()
-\tb.position = global_position + Vector2(0, -30)
-\tget_parent().add_child(b)
+\t_bullets.acquire().fire(global_position + Vector2(0, -30))
 
 
 func _on_area_entered(other: Area2D) -> void:
-\tif other.is_in_group("enemies"):
+\tif other.is_in_group("enemies") and other.destroy():
 \t\tGameManager.take_damage(20)
-\t\tother.queue_free()
 ''')
-        self._write("scenes/player.tscn", f'''[gd_scene load_steps=2 format=3]
+        self._write("scenes/player.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/player.gd" id="1"]
 
@@ -88,27 +103,42 @@ shape = SubResource("pcol")
     def _write_bullet(self) -> None:
         accent = self._hex_to_godot_color(self.spec.color_accent)
         self._write("scripts/bullet.gd", '''extends Area2D
+## Player bullet, handed out by the level's BulletPool.
 
+const ObjectPool := preload("res://scripts/object_pool.gd")
 const SPEED := 700.0
 
+var pool: ObjectPool
+var _live := false
+
 
 func _ready() -> void:
 \tarea_entered.connect(_on_hit)
 
 
+func fire(pos: Vector2) -> void:
+\tposition = pos
+\t_live = true
+
+
 func _process(delta: float) -> void:
 \tposition.y -= SPEED * delta
 \tif position.y < -20:
-\t\tqueue_free()
+\t\tdespawn()
 
 
 func _on_hit(other: Area2D) -> void:
-\tif other.is_in_group("enemies"):
+\tif _live and other.is_in_group("enemies") and other.destroy():
 \t\tGameManager.add_score(10)
-\t\tother.queue_free()
-\t\tqueue_free()
+\t\tdespawn()
+
+
+func despawn() -> void:
+\tif _live:
+\t\t_live = false
+\t\tpool.release(self)
 ''')
-        self._write("scenes/bullet.tscn", f'''[gd_scene load_steps=2 format=3]
+        self._write("scenes/bullet.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/bullet.gd" id="1"]
 
@@ -132,31 +162,60 @@ shape = SubResource("bcol")
         secondary = self._hex_to_godot_color(self.spec.color_secondary)
         self._write("scripts/enemy.gd", '''extends Area2D
 ## Descending enemy ship — sine-wave pattern, damages player on contact.
+## Handed out by the level's EnemyPool. killed tells the spawner it was shot
+## down or rammed; flying off the bottom of the screen doesn't count.
+
+signal killed
+
+const ObjectPool := preload("res://scripts/object_pool.gd")
 
 var speed := 120.0
 var wave_amplitude := 1.5
+var pool: ObjectPool
+var explosions: ObjectPool  # death effects; set by the spawner
 var _wave_offset := 0.0
+var _live := false
 
 
-func _ready() -> void:
-\tadd_to_group("enemies")
+func spawn(pos: Vector2, ship_speed: float, amplitude: float) -> void:
+\tposition = pos
+\tspeed = ship_speed
+\twave_amplitude = amplitude
 \t_wave_offset = randf() * TAU
+\t_live = true
 
 
 func _process(delta: float) -> void:
 \tposition.y += speed * delta
 \tposition.x += sin(Time.get_ticks_msec() / 1000.0 * 2.0 + _wave_offset) * wave_amplitude
 \tif position.y > 760:
-\t\tqueue_free()
+\t\tdespawn()
+
+
+## Blown up by a bullet or by ramming the player; false if it was already gone.
+func destroy() -> bool:
+\tif not _live:
+\t\treturn false
+\tif explosions:
+\t\texplosions.acquire().play(global_position)
+\tdespawn()
+\tkilled.emit()
+\treturn true
+
+
+func despawn() -> void:
+\tif _live:
+\t\t_live = false
+\t\tpool.release(self)
 ''')
-        self._write("scenes/enemy.tscn", f'''[gd_scene load_steps=2 format=3]
+        self._write("scenes/enemy.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/enemy.gd" id="1"]
 
 [sub_resource type="RectangleShape2D" id="ecol"]
 size = Vector2(28, 28)
 
-[node name="Enemy" type="Area2D"]
+[node name="Enemy" type="Area2D" groups=["enemies"]]
 script = ExtResource("1")
 
 [node name="Body" type="Polygon2D" parent="."]
@@ -165,6 +224,49 @@ color = Color{secondary}
 
 [node name="CollisionShape2D" type="CollisionShape2D" parent="."]
 shape = SubResource("ecol")
+''')
+
+    # ── explosion effect (pooled one-shot particles) ─────────────────────
+
+    def _write_explosion(self) -> None:
+        secondary = self._hex_to_godot_color(self.spec.color_secondary)
+        self._write("scripts/explosion.gd", '''extends CPUParticles2D
+## Enemy death burst, handed out by the level's ExplosionPool.
+
+const ObjectPool := preload("res://scripts/object_pool.gd")
+
+var pool: ObjectPool
+
+
+func _ready() -> void:
+\tvar perf := get_node_or_null("/root/PerfMonitor")
+\tif perf:
+\t\tamount = perf.particle_amount(amount)
+\tfinished.connect(func() -> void: pool.release(self))
+
+
+func play(pos: Vector2) -> void:
+\tposition = pos
+\trestart()
+''')
+        self._write("scenes/explosion.tscn", f'''[gd_scene load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/explosion.gd" id="1"]
+
+[node name="Explosion" type="CPUParticles2D"]
+emitting = false
+amount = 16
+lifetime = {EXPLOSION_LIFETIME}
+one_shot = true
+explosiveness = 1.0
+spread = 180.0
+gravity = Vector2(0, 0)
+initial_velocity_min = 80.0
+initial_velocity_max = 180.0
+scale_amount_min = 2.0
+scale_amount_max = 4.0
+color = Color{secondary}
+script = ExtResource("1")
 ''')
 
     # ── level generation ─────────────────────────────────────────────────
@@ -179,18 +281,47 @@ shape = SubResource("ecol")
         enemy_speed = 100 + level_num * 30
         wave_amp = 1.0 + level_num * 0.5
 
+        # Pools hold the most instances alive at once — screen crossing time
+        # over spawn interval — plus headroom, so misses stay rare.
+        headroom = POOL_HEADROOM.get(self.spec.difficulty, 1.25)
+        bullet_pool = math.ceil(760 / BULLET_SPEED / FIRE_RATE * headroom) + 2
+        enemy_pool = math.ceil(800 / enemy_speed / spawn_interval * headroom) + 2
+        explosion_pool = math.ceil(EXPLOSION_LIFETIME / FIRE_RATE * headroom) + 2
+
         ext_res = '''[ext_resource type="Script" path="res://scripts/game_level.gd" id="1"]
 [ext_resource type="PackedScene" path="res://scenes/player.tscn" id="player"]
 [ext_resource type="PackedScene" path="res://scenes/hud.tscn" id="hud"]
-[ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]'''
-        load_steps = 4
+[ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]
+[ext_resource type="Script" path="res://scripts/object_pool.gd" id="pool"]
+[ext_resource type="PackedScene" path="res://scenes/bullet.tscn" id="bullet"]'''
+        load_steps = 6
 
         if self.spec.has_enemies:
             ext_res += '\n[ext_resource type="PackedScene" path="res://scenes/enemy.tscn" id="enemy"]'
-            load_steps += 1
-
+            ext_res += '\n[ext_resource type="PackedScene" path="res://scenes/explosion.tscn" id="explosion"]'
+            load_steps += 2
+
+        pools = f'''
+[node name="BulletPool" type="Node2D" parent="."]
+script = ExtResource("pool")
+scene = ExtResource("bullet")
+size = {bullet_pool}
+'''
         enemy_spawner = ""
+        wave = ""
         if self.spec.has_enemies:
+            wave = f"\nkills_to_clear = {kills_to_clear}\nenemy_speed = {enemy_speed}.0\nwave_amp = {wave_amp}"
+            pools += f'''
+[node name="EnemyPool" type="Node2D" parent="."]
+script = ExtResource("pool")
+scene = ExtResource("enemy")
+size = {enemy_pool}
+
+[node name="ExplosionPool" type="Node2D" parent="."]
+script = ExtResource("pool")
+scene = ExtResource("explosion")
+size = {explosion_pool}
+'''
             enemy_spawner = f'''
 [node name="EnemySpawner" type="Timer" parent="."]
 wait_time = {spawn_interval}
@@ -202,7 +333,7 @@ autostart = true
 {ext_res}
 
 [node name="Game" type="Node2D"]
-script = ExtResource("1")
+script = ExtResource("1"){wave}
 
 [node name="BG" type="ColorRect" parent="."]
 offset_right = 1280.0
@@ -210,7 +341,7 @@ offset_bottom = 720.0
 color = Color{bg}
 
 [node name="Stars" type="Node2D" parent="."]
-
+{pools}
 [node name="Player" parent="." instance=ExtResource("player")]
 position = Vector2(640, 600)
 
@@ -219,19 +350,40 @@ position = Vector2(640, 600)
 [node name="PauseMenu" parent="." instance=ExtResource("pause")]
 {enemy_spawner}''')
 
+    def _write_game_level(self) -> None:
+        """The script every level scene shares; each scene sets its own wave exports."""
         enemy_spawn_code = ""
         spawner_connect = ""
         if self.spec.has_enemies:
-            enemy_spawn_code = f'''
-var _enemy_scene: PackedScene = preload("res://scenes/enemy.tscn")
+            enemy_spawn_code = '''
+## Set per level in scenes/level_N.tscn, whose pools are sized for them
+@export var kills_to_clear: int = 10
+@export var enemy_speed: float = 130.0
+@export var wave_amp: float = 1.5
+
 var _kills: int = 0
-const KILLS_TO_CLEAR: int = {kills_to_clear}
-const ENEMY_SPEED: float = {enemy_speed}.0
-const WAVE_AMP: float = {wave_amp}
 '''
             spawner_connect = '''\tif has_node("EnemySpawner"):
 \t\t$EnemySpawner.timeout.connect(_spawn_enemy)'''
 
+        enemy_funcs = ""
+        if self.spec.has_enemies:
+            enemy_funcs = '''
+func _spawn_enemy() -> void:
+\tvar e: Node = $EnemyPool.acquire()
+\te.explosions = $ExplosionPool
+\t# Pooled ships come back here many times; connect each one once
+\tif not e.killed.is_connected(_on_enemy_killed):
+\t\te.killed.connect(_on_enemy_killed)
+\te.spawn(Vector2(randf_range(60, 1220), -40), enemy_speed, wave_amp)
+
+
+func _on_enemy_killed() -> void:
+\t_kills += 1
+\tif _kills >= kills_to_clear:
+\t\tLevelManager.advance_level()
+'''
+
         self._write("scripts/game_level.gd", f'''extends Node2D
 {enemy_spawn_code}
 
@@ -239,7 +391,6 @@ func _ready() -> void:
 \tGameManager.game_over.connect(_on_game_over)
 {spawner_connect}
 \t_create_stars()
-\tget_tree().node_added.connect(_on_node_added)
 
 
 func _on_game_over() -> void:
@@ -254,22 +405,4 @@ func _create_stars() -> void:
 \t\tstar.position = Vector2(randf_range(0, 1280), randf_range(0, 720))
 \t\t$Stars.add_child(star)
 
-{"" if not self.spec.has_enemies else """
-func _spawn_enemy() -> void:
-\tvar e := _enemy_scene.instantiate()
-\te.position = Vector2(randf_range(60, 1220), -40)
-\te.speed = ENEMY_SPEED
-\te.wave_amplitude = WAVE_AMP
-\tadd_child(e)
-
-
-func _on_node_added(node: Node) -> void:
-\tif node.is_in_group("enemies"):
-\t\tnode.tree_exiting.connect(_on_enemy_killed)
-
-
-func _on_enemy_killed() -> void:
-\t_kills += 1
-\tif _kills >= KILLS_TO_CLEAR:
-\t\tLevelManager.advance_level()
-"""}''')
+{enemy_funcs}''')
@@ -1,13 +1,23 @@
 """Top-Down Adventure — multi-room dungeon, 4-directional animated player, enemies, items.
 
-Levels are distinct dungeon rooms with increasing complexity:
-- Level 1: Small room with a few enemies and items
-- Level 2: Larger room with more enemies and obstacles
-- Level 3: Boss room with a stronger enemy
+Levels are dungeons of rooms and corridors with increasing complexity,
+laid out at build time by dungeon_builder and stored as one TileMapLayer:
+- Level 1: Three rooms with a few enemies and items
+- Level 2: Five rooms with more enemies
+- Level 3+: Two more rooms a level; the goal sits in the largest room,
+  the one farthest from the start
+
+Enemies don't look for the player themselves: the AIDirector autoload
+caches it, buckets enemies in a spatial hash and steps the ones near the
+player every physics tick and the rest at a reduced rate.
 """
 
 from __future__ import annotations
 
+import random
+
+from app.art.sprite_baker import Color, lightened, parse_color
+from app.generator.dungeon_builder import build_dungeon, tileset_resource
 from app.generator.templates.base import BaseTemplate
 
 
@@ -15,14 +25,24 @@ class TopdownTemplate(BaseTemplate):
 
     def generate_game_scenes(self) -> None:
         self._write_player()
+        self._write_ai_director()
         if self.spec.has_enemies:
             self._write_enemy()
         if self.spec.has_collectibles:
             self._write_collectible()
         self._write_level_goal()
+        self._write("levels/dungeon_tiles.tres", tileset_resource(parse_color(self.spec.color_ground)))
         for i in range(self.spec.level_count):
             self._write_level(i + 1)
 
+    def sprite_characters(self) -> list[tuple[str, str, str, Color, Color]]:
+        primary = parse_color(self.spec.color_primary)
+        secondary = parse_color(self.spec.color_secondary)
+        chars = [("player", "player", "topdown", primary, lightened(primary, 0.5))]
+        if self.spec.has_enemies:
+            chars.append(("enemy", "enemy_1", "topdown", secondary, lightened(secondary, 0.3)))
+        return chars
+
     def _write_player(self) -> None:
         self._write("scripts/player.gd", f'''extends CharacterBody2D
 ## {self.spec.player_name} — 4-directional top-down character with animated attacks.
@@ -43,7 +63,7 @@ var _attack_timer := 0.0
 
 func _ready() -> void:
 \tvar color := Color("{self.spec.color_primary}")
-\tanim_sprite.sprite_frames = SpriteGenerator.create_topdown_frames(color, color.lightened(0.5))
+\tanim_sprite.sprite_frames = SpriteGenerator.create_topdown_frames(color, color.lightened(0.5), "player")
 \tanim_sprite.play("idle_down")
 
 
@@ -108,14 +128,14 @@ func _do_attack() -> void:
 \tif result and result.collider.has_method("take_hit"):
 \t\tresult.collider.take_hit(ATTACK_DAMAGE)
 ''')
-        self._write("scenes/player.tscn", f'''[gd_scene load_steps=2 format=3]
+        self._write("scenes/player.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/player.gd" id="1"]
 
 [sub_resource type="CircleShape2D" id="pcol"]
 radius = 12.0
 
-[node name="Player" type="CharacterBody2D"]
+[node name="Player" type="CharacterBody2D" groups=["player"]]
 script = ExtResource("1")
 
 [node name="AnimatedSprite2D" type="AnimatedSprite2D" parent="."]
@@ -131,7 +151,8 @@ position_smoothing_enabled = true
 
     def _write_enemy(self) -> None:
         self._write("scripts/enemy.gd", f'''extends CharacterBody2D
-## Patrol enemy that chases when player is nearby.
+## Patrol enemy that chases when player is nearby. Driven by the AIDirector
+## autoload through think() rather than its own _physics_process.
 
 const SPEED := 55.0
 const CHASE_SPEED := 90.0
@@ -151,13 +172,19 @@ var _hp := 3
 func _ready() -> void:
 \t_origin = global_position
 \tvar color := Color("{self.spec.color_secondary}")
-\tanim_sprite.sprite_frames = SpriteGenerator.create_topdown_frames(color, color.lightened(0.3))
+\tanim_sprite.sprite_frames = SpriteGenerator.create_topdown_frames(color, color.lightened(0.3), "enemy_1")
 \tanim_sprite.play("walk_right")
+\tAIDirector.register(self)
 
 
-func _physics_process(delta: float) -> void:
+func _exit_tree() -> void:
+\tAIDirector.unregister(self)
+
+
+## One AI step covering *delta* seconds — a single physics tick near the
+## player, several when the director ticks this enemy at the reduced rate.
+func think(delta: float, player: Node2D) -> void:
 \t_cd = max(0.0, _cd - delta)
-\tvar player := _find_player()
 \tif player and global_position.distance_to(player.global_position) < CHASE_RANGE:
 \t\tvar dir := global_position.direction_to(player.global_position)
 \t\tvelocity = dir * CHASE_SPEED
@@ -169,7 +196,11 @@ func _physics_process(delta: float) -> void:
 \t\tif global_position.distance_to(_origin) > _patrol_range:
 \t\t\t_direction = (_origin - global_position).normalized()
 \t_update_anim()
+\t# move_and_slide() always advances one physics tick
+\tvar steps := delta / get_physics_process_delta_time()
+\tvelocity *= steps
 \tmove_and_slide()
+\tvelocity /= steps
 
 
 func _update_anim() -> void:
@@ -183,13 +214,6 @@ func _update_anim() -> void:
 \t\tanim_sprite.play(anim_name)
 
 
-func _find_player() -> CharacterBody2D:
-\tfor child in get_parent().get_children():
-\t\tif child.name == "Player":
-\t\t\treturn child as CharacterBody2D
-\treturn null
-
-
 func take_hit(damage: int) -> void:
 \t_hp -= damage
 \tif _hp <= 0:
@@ -200,7 +224,7 @@ func take_hit(damage: int) -> void:
 \t\tawait get_tree().create_timer(0.15).timeout
 \t\tmodulate = Color.WHITE
 ''')
-        self._write("scenes/enemy.tscn", '''[gd_scene load_steps=2 format=3]
+        self._write("scenes/enemy.tscn", '''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/enemy.gd" id="1"]
 
@@ -215,6 +239,110 @@ scale = Vector2(1.5, 1.5)
 
 [node name="CollisionShape2D" type="CollisionShape2D" parent="."]
 shape = SubResource("ecol")
+''')
+
+    def _write_ai_director(self) -> None:
+        self._write("scripts/autoload/ai_director.gd", '''extends Node
+## AI director — caches the player and keeps top-down enemies in a uniform
+## spatial hash grid. Each physics tick it runs chase logic for the enemies
+## in the cells around the player; the rest patrol on a staggered schedule,
+## one of FAR_TICK_INTERVAL buckets per tick, so the per-tick cost follows
+## the crowd near the player rather than the size of the level.
+
+## At least the enemies' CHASE_RANGE, so the 3x3 block of cells around the
+## player holds every enemy that could be chasing.
+const CELL_SIZE := 160.0
+const FAR_TICK_INTERVAL := 6
+
+var _player: Node2D
+var _cells := {}  # Vector2i -> Array[Node2D]
+var _cell_of := {}  # enemy -> Vector2i
+var _buckets: Array[Array] = []
+var _bucket_of := {}  # enemy -> bucket index
+var _next_bucket := 0
+var _tick := 0
+
+
+func _ready() -> void:
+\tprocess_physics_priority = -1
+\tfor _i in FAR_TICK_INTERVAL:
+\t\t_buckets.append([])
+
+
+## The player, looked up through the "player" group once and cached.
+func get_player() -> Node2D:
+\tif not is_instance_valid(_player) or not _player.is_inside_tree():
+\t\t_player = get_tree().get_first_node_in_group("player") as Node2D
+\treturn _player
+
+
+func register(enemy: Node2D) -> void:
+\tif _cell_of.has(enemy):
+\t\treturn
+\tenemy.set_physics_process(false)
+\tvar cell := _cell(enemy.global_position)
+\t_cell_of[enemy] = cell
+\t_cells.get_or_add(cell, []).append(enemy)
+\t_bucket_of[enemy] = _next_bucket
+\t_buckets[_next_bucket].append(enemy)
+\t_next_bucket = (_next_bucket + 1) % FAR_TICK_INTERVAL
+
+
+func unregister(enemy: Node2D) -> void:
+\tif not _cell_of.has(enemy):
+\t\treturn
+\t_remove_from_cell(enemy, _cell_of[enemy])
+\t_cell_of.erase(enemy)
+\t_buckets[_bucket_of[enemy]].erase(enemy)
+\t_bucket_of.erase(enemy)
+
+
+## Enemies whose cell is within *radius* cells of *pos*.
+func enemies_near(pos: Vector2, radius := 1) -> Array[Node2D]:
+\tvar found: Array[Node2D] = []
+\tvar center := _cell(pos)
+\tfor y in range(center.y - radius, center.y + radius + 1):
+\t\tfor x in range(center.x - radius, center.x + radius + 1):
+\t\t\tfound.append_array(_cells.get(Vector2i(x, y), []))
+\treturn found
+
+
+func _physics_process(delta: float) -> void:
+\tif _cell_of.is_empty():
+\t\treturn
+\t_tick += 1
+\tvar player := get_player()
+\tvar awake := {}
+\tif player:
+\t\tfor enemy in enemies_near(player.global_position):
+\t\t\tawake[enemy] = true
+\t\t\t_think(enemy, delta, player)
+\tvar far_delta := delta * FAR_TICK_INTERVAL
+\tfor enemy in _buckets[_tick % FAR_TICK_INTERVAL].duplicate():
+\t\tif not awake.has(enemy):
+\t\t\t_think(enemy, far_delta, player)
+
+
+func _think(enemy: Node2D, delta: float, player: Node2D) -> void:
+\tif not is_instance_valid(enemy) or not _cell_of.has(enemy):
+\t\treturn
+\tenemy.think(delta, player)
+\tvar cell := _cell(enemy.global_position)
+\tif cell != _cell_of[enemy]:
+\t\t_remove_from_cell(enemy, _cell_of[enemy])
+\t\t_cell_of[enemy] = cell
+\t\t_cells.get_or_add(cell, []).append(enemy)
+
+
+func _remove_from_cell(enemy: Node2D, cell: Vector2i) -> void:
+\tvar members: Array = _cells[cell]
+\tmembers.erase(enemy)
+\tif members.is_empty():
+\t\t_cells.erase(cell)
+
+
+func _cell(pos: Vector2) -> Vector2i:
+\treturn Vector2i(floori(pos.x / CELL_SIZE), floori(pos.y / CELL_SIZE))
 ''')
 
     def _write_collectible(self) -> None:
@@ -227,6 +355,11 @@ var _base_scale := 1.0
 
 func _ready() -> void:
 \tbody_entered.connect(_on_body_entered)
+\tvar art := SpriteGenerator.get_art("collectible")
+\tif art:
+\t\t$Sprite.texture = art
+\t\t$Sprite.modulate = Color.WHITE
+\t\t$Sprite.scale = Vector2(0.5, 0.5)
 
 
 func _process(_delta: float) -> void:
@@ -239,7 +372,7 @@ func _on_body_entered(body: Node2D) -> void:
 \t\tGameManager.add_score(SCORE_VALUE)
 \t\tqueue_free()
 ''')
-        self._write("scenes/collectible.tscn", '''[gd_scene load_steps=2 format=3]
+        self._write("scenes/collectible.tscn", '''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/collectible.gd" id="1"]
 
@@ -270,7 +403,7 @@ func _on_body_entered(body: Node2D) -> void:
 \t\tGameManager.add_score(50)
 \t\tLevelManager.advance_level()
 ''')
-        self._write("scenes/level_goal.tscn", '''[gd_scene load_steps=2 format=3]
+        self._write("scenes/level_goal.tscn", '''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/level_goal.gd" id="1"]
 
@@ -293,17 +426,18 @@ shape = SubResource("gcol")
 
     def _write_level(self, level_num: int) -> None:
         bg = self._hex_to_godot_color(self.spec.color_bg)
-        ground = self._hex_to_godot_color(self.spec.color_ground)
-        room_size = 200 + level_num * 80
+        dungeon = build_dungeon(level_num * 1000 + 42, level_num)
+        rng = random.Random(level_num)
         enemy_count = level_num * 2 if self.spec.has_enemies else 0
-        coin_count = max(2, 5 - level_num) if self.spec.has_collectibles else 0
+        coin_count = max(2, 5 - level_num) * len(dungeon.rooms) // 3 if self.spec.has_collectibles else 0
 
         ext_res = '''[ext_resource type="Script" path="res://scripts/game_level.gd" id="1"]
 [ext_resource type="PackedScene" path="res://scenes/player.tscn" id="player"]
 [ext_resource type="PackedScene" path="res://scenes/hud.tscn" id="hud"]
 [ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]
-[ext_resource type="PackedScene" path="res://scenes/level_goal.tscn" id="goal"]'''
-        loads = 5
+[ext_resource type="PackedScene" path="res://scenes/level_goal.tscn" id="goal"]
+[ext_resource type="TileSet" path="res://levels/dungeon_tiles.tres" id="tiles"]'''
+        loads = 6
         if self.spec.has_enemies:
             ext_res += '\n[ext_resource type="PackedScene" path="res://scenes/enemy.tscn" id="enemy"]'
             loads += 1
@@ -312,81 +446,50 @@ shape = SubResource("gcol")
             loads += 1
 
         enemies = ""
-        for i in range(enemy_count):
-            angle = i * (6.28 / max(1, enemy_count))
-            ex = int(room_size * 0.5 * __import__('math').cos(angle))
-            ey = int(room_size * 0.5 * __import__('math').sin(angle))
+        for i, tile in enumerate(dungeon.entity_tiles(rng, enemy_count)):
+            ex, ey = dungeon.pixel(tile)
             enemies += f'''
 [node name="Enemy{i+1}" parent="World" instance=ExtResource("enemy")]
 position = Vector2({ex}, {ey})
 '''
 
         coins = ""
-        for i in range(coin_count):
-            cx = -room_size // 3 + i * (room_size * 2 // 3 // max(1, coin_count))
-            cy = -room_size // 3 + (i % 2) * (room_size // 2)
+        for i, tile in enumerate(dungeon.entity_tiles(rng, coin_count, skip_start=False)):
+            cx, cy = dungeon.pixel(tile)
             coins += f'''
 [node name="Coin{i+1}" parent="World" instance=ExtResource("coin")]
 position = Vector2({cx}, {cy})
 '''
 
+        px, py = dungeon.pixel(dungeon.rooms[dungeon.start].center)
+        gx, gy = dungeon.pixel(dungeon.rooms[dungeon.goal].center)
         self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps={loads + 1} format=3]
 
 {ext_res}
 
-[sub_resource type="RectangleShape2D" id="wall_h"]
-size = Vector2({room_size * 2 + 40}, 16)
-
 [node name="Game" type="Node2D"]
 script = ExtResource("1")
 
-[node name="BG" type="ColorRect" parent="."]
-offset_left = -640.0
-offset_top = -360.0
-offset_right = 640.0
-offset_bottom = 360.0
+[node name="Background" type="CanvasLayer" parent="."]
+layer = -1
+
+[node name="BG" type="ColorRect" parent="Background"]
+anchors_preset = 15
+anchor_right = 1.0
+anchor_bottom = 1.0
 color = Color{bg}
 
 [node name="World" type="Node2D" parent="."]
 
-[node name="Floor" type="ColorRect" parent="World"]
-offset_left = -{room_size}.0
-offset_top = -{room_size}.0
-offset_right = {room_size}.0
-offset_bottom = {room_size}.0
-color = Color{ground}
-
-[node name="WallTop" type="StaticBody2D" parent="World"]
-position = Vector2(0, -{room_size})
-
-[node name="WTCol" type="CollisionShape2D" parent="World/WallTop"]
-shape = SubResource("wall_h")
-
-[node name="WTSprite" type="ColorRect" parent="World/WallTop"]
-offset_left = -{room_size + 20}.0
-offset_top = -8.0
-offset_right = {room_size + 20}.0
-offset_bottom = 8.0
-color = Color(0.3, 0.22, 0.18, 1)
-
-[node name="WallBottom" type="StaticBody2D" parent="World"]
-position = Vector2(0, {room_size})
-
-[node name="WBCol" type="CollisionShape2D" parent="World/WallBottom"]
-shape = SubResource("wall_h")
-
-[node name="WBSprite" type="ColorRect" parent="World/WallBottom"]
-offset_left = -{room_size + 20}.0
-offset_top = -8.0
-offset_right = {room_size + 20}.0
-offset_bottom = 8.0
-color = Color(0.3, 0.22, 0.18, 1)
+[node name="Dungeon" type="TileMapLayer" parent="World"]
+tile_map_data = PackedByteArray("{dungeon.tile_map_data()}")
+tile_set = ExtResource("tiles")
 
 [node name="Player" parent="World" instance=ExtResource("player")]
-position = Vector2(0, {room_size - 40})
+position = Vector2({px}, {py})
 {enemies}{coins}
 [node name="Goal" parent="World" instance=ExtResource("goal")]
-position = Vector2(0, -{room_size - 40})
+position = Vector2({gx}, {gy})
 
 [node name="HUD" parent="." instance=ExtResource("hud")]
 
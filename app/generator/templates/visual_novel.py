@@ -4,14 +4,22 @@ Each level is a distinct story chapter:
 - Level 1: Introduction — meet the world and characters
 - Level 2: Rising action — conflict and choices
 - Level 3+: Climax and resolution — deeper branching, higher stakes
+
+Chapters are data, not code: each one is a compact JSON node graph in
+story/ that dialogue_system.gd loads when the chapter opens, requesting
+the next one on a background thread meanwhile.
 """
 
 from __future__ import annotations
 
+import json
+
 from app.generator.templates.base import BaseTemplate
 
 
 class VisualNovelTemplate(BaseTemplate):
+    # Chapter scenes are a handful of controls; they never outlast a loading screen
+    loading_screen = False
 
     def generate_game_scenes(self) -> None:
         self._write_dialogue_script()
@@ -23,21 +31,64 @@ class VisualNovelTemplate(BaseTemplate):
     def _write_dialogue_script(self) -> None:
         self._write("scripts/dialogue_system.gd", '''extends Control
 ## Visual novel dialogue system with branching choices.
-
-var story: Array[Dictionary] = []
+##
+## A chapter is a node graph in story/chapter_<n>.json, loaded when its
+## scene opens. While it plays, the next chapter's file is requested on a
+## background thread, so moving on doesn't wait on disk and only the
+## chapters actually reached are ever parsed.
+##
+## Graph format: {"start": i, "speakers": {name: {"color": "#rrggbb" or null}},
+## "nodes": [...]} where a node is a line {"speaker", "emotion", "text",
+## "next", optional "score"}, a branch {"choices": [{"text", "next"}]} or
+## {"end": true}.
+
+const EMOTION_TINT := {
+\t"neutral": Color(1, 1, 1),
+\t"happy": Color(1.15, 1.1, 0.85),
+\t"worried": Color(0.8, 0.85, 1.05),
+\t"determined": Color(1.15, 0.9, 0.85),
+\t"awed": Color(1.1, 1.05, 1.2),
+}
+
+@export_file("*.json") var chapter_path := ""
+@export_file("*.json") var next_chapter_path := ""
+
+var story: Array = []
+var speakers := {}
 var current_index: int = 0
 
 @onready var speaker_label: Label = $DialogueBox/VBox/SpeakerLabel
 @onready var text_label: RichTextLabel = $DialogueBox/VBox/TextLabel
 @onready var choices_box: VBoxContainer = $DialogueBox/VBox/ChoicesBox
 @onready var continue_hint: Label = $DialogueBox/VBox/ContinueHint
+@onready var character_sprite: ColorRect = $CharacterSprite
 
 
 func _ready() -> void:
 \tGameManager.game_over.connect(_on_game_over)
+\tvar chapter := _load_chapter(chapter_path)
+\tstory = chapter.get("nodes", [])
+\tspeakers = chapter.get("speakers", {})
+\tcurrent_index = int(chapter.get("start", 0))
+\tif next_chapter_path != "":
+\t\tResourceLoader.load_threaded_request(next_chapter_path)
 \t_show_current()
 
 
+## The chapter graph at *path*: taken from the background request the
+## previous chapter made when there is one, loaded here otherwise.
+func _load_chapter(path: String) -> Dictionary:
+\tif path == "":
+\t\treturn {}
+\tvar res: Resource
+\tif ResourceLoader.load_threaded_get_status(path) != ResourceLoader.THREAD_LOAD_INVALID_RESOURCE:
+\t\tres = ResourceLoader.load_threaded_get(path)
+\telse:
+\t\tres = load(path)
+\tvar json := res as JSON
+\treturn json.data if json and json.data is Dictionary else {}
+
+
 func _input(event: InputEvent) -> void:
 \tif event.is_action_pressed("action") and choices_box.get_child_count() == 0:
 \t\t_advance()
@@ -49,14 +100,12 @@ func _show_current() -> void:
 \t\treturn
 
 \tvar entry: Dictionary = story[current_index]
-\tvar speaker: String = entry.get("speaker", "")
-
-\tif speaker == "END":
+\tif entry.get("end", false):
 \t\tLevelManager.advance_level()
 \t\treturn
 
 \tif entry.has("score"):
-\t\tGameManager.add_score(entry["score"])
+\t\tGameManager.add_score(int(entry["score"]))
 
 \t_clear_choices()
 
@@ -68,20 +117,27 @@ func _show_current() -> void:
 \t\t\tvar btn := Button.new()
 \t\t\tbtn.text = choice["text"]
 \t\t\tbtn.custom_minimum_size = Vector2(0, 40)
-\t\t\tbtn.pressed.connect(_on_choice.bind(choice["next"]))
+\t\t\tbtn.pressed.connect(_on_choice.bind(int(choice["next"])))
 \t\t\tchoices_box.add_child(btn)
 \telse:
+\t\tvar speaker: String = entry.get("speaker", "")
 \t\tspeaker_label.text = speaker
 \t\ttext_label.text = entry.get("text", "")
 \t\tcontinue_hint.visible = true
+\t\t_show_speaker(speaker, entry.get("emotion", "neutral"))
+
+
+func _show_speaker(speaker: String, emotion: String) -> void:
+\tvar color = speakers.get(speaker, {}).get("color")
+\tcharacter_sprite.visible = color != null
+\tif color != null:
+\t\tcharacter_sprite.color = Color(color)
+\t\tcharacter_sprite.modulate = EMOTION_TINT.get(emotion, Color.WHITE)
 
 
 func _advance() -> void:
 \tvar entry: Dictionary = story[current_index]
-\tif entry.has("next"):
-\t\tcurrent_index = entry["next"]
-\telse:
-\t\tcurrent_index += 1
+\tcurrent_index = int(entry.get("next", current_index + 1))
 \t_show_current()
 
 
@@ -110,12 +166,12 @@ func _on_game_over() -> void:
         theme = self.spec.theme.title()
         player = self.spec.player_name
 
-        story_data = self._build_chapter_story(level_num, theme, player)
+        self._write(f"story/chapter_{level_num}.json", self._chapter_json(level_num, theme, player))
+        next_chapter = f"res://story/chapter_{level_num + 1}.json" if level_num < self.spec.level_count else ""
 
-        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps=4 format=3]
+        self._write(f"scenes/level_{level_num}.tscn", f'''[gd_scene load_steps=3 format=3]
 
 [ext_resource type="Script" path="res://scripts/dialogue_system.gd" id="1"]
-[ext_resource type="Script" path="res://scripts/chapter_{level_num}_data.gd" id="data"]
 [ext_resource type="PackedScene" path="res://scenes/pause_menu.tscn" id="pause"]
 
 [node name="Game" type="Control"]
@@ -123,7 +179,9 @@ layout_mode = 3
 anchors_preset = 15
 anchor_right = 1.0
 anchor_bottom = 1.0
-script = ExtResource("data")
+script = ExtResource("1")
+chapter_path = "res://story/chapter_{level_num}.json"
+next_chapter_path = "{next_chapter}"
 
 [node name="BG" type="ColorRect" parent="."]
 layout_mode = 1
@@ -198,15 +256,6 @@ horizontal_alignment = 2
 modulate = Color(0.6, 0.6, 0.6, 1)
 
 [node name="PauseMenu" parent="." instance=ExtResource("pause")]
-''')
-
-        self._write(f"scripts/chapter_{level_num}_data.gd", f'''extends "res://scripts/dialogue_system.gd"
-## Chapter {level_num} story data for the {theme.lower()} visual novel.
-
-
-func _ready() -> void:
-\tstory = {story_data}
-\tsuper._ready()
 ''')
 
         self._write("scripts/game_level.gd", '''extends Node2D
@@ -220,72 +269,80 @@ func _on_game_over() -> void:
 \tGameManager.go_to_scene("res://scenes/game_over.tscn")
 ''')
 
-    def _build_chapter_story(self, level_num: int, theme: str, player: str) -> str:
+    def _chapter_json(self, level_num: int, theme: str, player: str) -> str:
+        """A chapter's story as the compact node graph dialogue_system.gd reads."""
+        nodes = self._build_chapter_story(level_num, theme, player)
+        for i, node in enumerate(nodes):
+            if "speaker" in node:
+                node.setdefault("next", i + 1)
+        chapter = {
+            "start": 0,
+            "speakers": {
+                "Narrator": {"color": None},
+                player: {"color": self.spec.color_primary},
+                "Guide": {"color": self.spec.color_secondary},
+            },
+            "nodes": nodes,
+        }
+        return json.dumps(chapter, ensure_ascii=False, separators=(",", ":"))
+
+    def _build_chapter_story(self, level_num: int, theme: str, player: str) -> list[dict]:
+        def say(speaker: str, text: str, emotion: str = "neutral", **extra) -> dict:
+            return {"speaker": speaker, "emotion": emotion, "text": text, **extra}
+
+        def choose(*options: tuple[str, int]) -> dict:
+            return {"choices": [{"text": text, "next": target} for text, target in options]}
+
+        end = {"end": True}
         if level_num == 1:
-            return f'''[
-\t{{"speaker": "Narrator", "text": "In a world of {theme.lower()}, a new adventure begins..."}},
-\t{{"speaker": "Narrator", "text": "You are {player}, and today your journey starts."}},
-\t{{"speaker": "{player}", "text": "Where am I? This place looks... incredible."}},
-\t{{"speaker": "Narrator", "text": "A mysterious figure appears before you."}},
-\t{{"speaker": "Guide", "text": "Welcome, {player}. I have been waiting for you."}},
-\t{{"speaker": "Narrator", "text": "The guide offers two paths. Which will you choose?"}},
-\t{{
-\t\t"speaker": "Choice",
-\t\t"choices": [
-\t\t\t{{"text": "Take the bright path", "next": 7}},
-\t\t\t{{"text": "Take the shadowed path", "next": 10}},
-\t\t],
-\t}},
-\t{{"speaker": "{player}", "text": "The bright path feels warm and welcoming."}},
-\t{{"speaker": "Guide", "text": "A wise choice. The light will guide you well."}},
-\t{{"speaker": "Narrator", "text": "Chapter 1 complete. Score +50!", "score": 50, "next": 13}},
-\t{{"speaker": "{player}", "text": "The shadowed path is eerie, but I feel drawn to it."}},
-\t{{"speaker": "Guide", "text": "Bold indeed. Not many dare walk the shadows."}},
-\t{{"speaker": "Narrator", "text": "You found a hidden treasure! Score +100!", "score": 100, "next": 13}},
-\t{{"speaker": "Narrator", "text": "And so, {player}'s first chapter comes to a close."}},
-\t{{"speaker": "END", "text": ""}},
-]'''
+            return [
+                say("Narrator", f"In a world of {theme.lower()}, a new adventure begins..."),
+                say("Narrator", f"You are {player}, and today your journey starts."),
+                say(player, "Where am I? This place looks... incredible.", "awed"),
+                say("Narrator", "A mysterious figure appears before you."),
+                say("Guide", f"Welcome, {player}. I have been waiting for you."),
+                say("Narrator", "The guide offers two paths. Which will you choose?"),
+                choose(("Take the bright path", 7), ("Take the shadowed path", 10)),
+                say(player, "The bright path feels warm and welcoming.", "happy"),
+                say("Guide", "A wise choice. The light will guide you well.", "happy"),
+                say("Narrator", "Chapter 1 complete. Score +50!", score=50, next=13),
+                say(player, "The shadowed path is eerie, but I feel drawn to it.", "worried"),
+                say("Guide", "Bold indeed. Not many dare walk the shadows."),
+                say("Narrator", "You found a hidden treasure! Score +100!", score=100, next=13),
+                say("Narrator", f"And so, {player}'s first chapter comes to a close."),
+                end,
+            ]
         elif level_num == 2:
-            return f'''[
-\t{{"speaker": "Narrator", "text": "Chapter 2 — The {theme.lower()} world grows darker..."}},
-\t{{"speaker": "{player}", "text": "Something has changed. The air feels heavy."}},
-\t{{"speaker": "Guide", "text": "{player}, a great challenge lies ahead."}},
-\t{{"speaker": "Narrator", "text": "A fork in the road presents itself once more."}},
-\t{{
-\t\t"speaker": "Choice",
-\t\t"choices": [
-\t\t\t{{"text": "Stand and fight", "next": 5}},
-\t\t\t{{"text": "Seek allies first", "next": 8}},
-\t\t],
-\t}},
-\t{{"speaker": "{player}", "text": "I will face whatever comes!"}},
-\t{{"speaker": "Narrator", "text": "Your bravery inspires those around you. Score +75!", "score": 75}},
-\t{{"speaker": "Narrator", "text": "The battle is won, but at a cost.", "next": 11}},
-\t{{"speaker": "{player}", "text": "Let me find companions for this journey."}},
-\t{{"speaker": "Narrator", "text": "You gather a loyal party. Score +60!", "score": 60}},
-\t{{"speaker": "Guide", "text": "Together you are stronger. Well done.", "next": 11}},
-\t{{"speaker": "Narrator", "text": "{player}'s second chapter draws to a close."}},
-\t{{"speaker": "END", "text": ""}},
-]'''
+            return [
+                say("Narrator", f"Chapter 2 — The {theme.lower()} world grows darker..."),
+                say(player, "Something has changed. The air feels heavy.", "worried"),
+                say("Guide", f"{player}, a great challenge lies ahead.", "worried"),
+                say("Narrator", "A fork in the road presents itself once more."),
+                choose(("Stand and fight", 5), ("Seek allies first", 8)),
+                say(player, "I will face whatever comes!", "determined"),
+                say("Narrator", "Your bravery inspires those around you. Score +75!", score=75),
+                say("Narrator", "The battle is won, but at a cost.", next=11),
+                say(player, "Let me find companions for this journey.", "determined"),
+                say("Narrator", "You gather a loyal party. Score +60!", score=60),
+                say("Guide", "Together you are stronger. Well done.", "happy", next=11),
+                say("Narrator", f"{player}'s second chapter draws to a close."),
+                end,
+            ]
         else:
-            return f'''[
-\t{{"speaker": "Narrator", "text": "Chapter {level_num} — The {theme.lower()} saga continues..."}},
-\t{{"speaker": "{player}", "text": "I have come so far. What awaits me now?"}},
-\t{{"speaker": "Guide", "text": "The final trial of this chapter awaits, {player}."}},
-\t{{"speaker": "Narrator", "text": "Before you stands a great door with two symbols."}},
-\t{{
-\t\t"speaker": "Choice",
-\t\t"choices": [
-\t\t\t{{"text": "Touch the sun symbol", "next": 5}},
-\t\t\t{{"text": "Touch the moon symbol", "next": 8}},
-\t\t],
-\t}},
-\t{{"speaker": "Narrator", "text": "Warmth floods through you as golden light fills the room."}},
-\t{{"speaker": "{player}", "text": "The power of the sun... it is incredible!"}},
-\t{{"speaker": "Narrator", "text": "You gained the Sun's Blessing! Score +{50 * level_num}!", "score": {50 * level_num}, "next": 11}},
-\t{{"speaker": "Narrator", "text": "Silver moonlight bathes the chamber in calm."}},
-\t{{"speaker": "{player}", "text": "The moon grants clarity and wisdom."}},
-\t{{"speaker": "Narrator", "text": "You gained the Moon's Insight! Score +{40 * level_num}!", "score": {40 * level_num}, "next": 11}},
-\t{{"speaker": "Narrator", "text": "Chapter {level_num} is complete. Your story grows ever deeper."}},
-\t{{"speaker": "END", "text": ""}},
-]'''
+            return [
+                say("Narrator", f"Chapter {level_num} — The {theme.lower()} saga continues..."),
+                say(player, "I have come so far. What awaits me now?", "determined"),
+                say("Guide", f"The final trial of this chapter awaits, {player}."),
+                say("Narrator", "Before you stands a great door with two symbols."),
+                choose(("Touch the sun symbol", 5), ("Touch the moon symbol", 8)),
+                say("Narrator", "Warmth floods through you as golden light fills the room."),
+                say(player, "The power of the sun... it is incredible!", "awed"),
+                say("Narrator", f"You gained the Sun's Blessing! Score +{50 * level_num}!",
+                    score=50 * level_num, next=11),
+                say("Narrator", "Silver moonlight bathes the chamber in calm."),
+                say(player, "The moon grants clarity and wisdom.", "awed"),
+                say("Narrator", f"You gained the Moon's Insight! Score +{40 * level_num}!",
+                    score=40 * level_num, next=11),
+                say("Narrator", f"Chapter {level_num} is complete. Your story grows ever deeper."),
+                end,
+            ]
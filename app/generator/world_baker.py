@@ -0,0 +1,183 @@
+"""Build-time layout baker for platformer levels.
+
+world_generator.gd can lay a level out at runtime from FastNoiseLite and
+the RNG, but that repeats the same work on every level load. This module
+computes the heightmap, decoration kinds and entity placements with
+vectorized NumPy noise while the project is generated and writes them as a
+WorldData resource of packed arrays, which the level scene references and
+the generator only has to read.
+
+Layouts depend on nothing but (level_seed, world_width, world_height,
+difficulty), so they are reproducible and can be inspected from Python::
+
+    layout = bake_world(1042, 210, 50, 1)
+    layout.heights.shape, len(layout.enemies)
+
+Layout written into the project::
+
+    levels/level_<n>.tres       WorldData for scenes/level_<n>.tscn
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Mirror world_generator.gd
+T = 16
+CHUNK_TILES = 32
+
+# Decoration kinds, as stored per tile column (world_data.gd DECOR_*)
+DECOR_NONE, DECOR_TREE, DECOR_ROCK, DECOR_GRASS, DECOR_FLOWER = range(5)
+# Enemy kinds (world_data.gd ENEMY_*); the runtime spawns two walkers per flyer and charger
+ENEMY_WALKER, ENEMY_FLYER, ENEMY_CHARGER = range(3)
+_ENEMY_CYCLE = [ENEMY_WALKER, ENEMY_WALKER, ENEMY_FLYER, ENEMY_CHARGER]
+
+_LATTICE = 256
+
+
+@dataclass
+class WorldLayout:
+    """One level's baked layout; entity arrays are sorted by x."""
+
+    heights: np.ndarray        # (world_width,) float32 surface y per tile column
+    decorations: np.ndarray    # (world_width,) uint8 DECOR_* per tile column
+    platforms: np.ndarray      # (n, 3) float32 x, y, width
+    enemies: np.ndarray        # (n, 3) float32 x, y, ENEMY_*
+    collectibles: np.ndarray   # (n, 2) float32 x, y
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-(len(self.heights) - 1) // CHUNK_TILES))
+
+    def chunk_offsets(self, entities: np.ndarray) -> np.ndarray:
+        """Index of the first entity in each chunk, plus the total: (chunk_count + 1,) int32."""
+        import numpy as np
+
+        chunk = np.clip((entities[:, 0] // (CHUNK_TILES * T)).astype(np.int64), 0, self.chunk_count - 1)
+        counts = np.bincount(chunk, minlength=self.chunk_count)
+        return np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+
+
+def gradient_noise(xs: np.ndarray, seed: int, frequency: float, octaves: int = 5,
+                   lacunarity: float = 2.0, gain: float = 0.5) -> np.ndarray:
+    """Fractal 1D gradient noise in [-1, 1] sampled at *xs*, like FastNoiseLite's FBM defaults."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    total = np.zeros(len(xs), dtype=np.float64)
+    amplitude, norm, freq = 1.0, 0.0, frequency
+    for _ in range(octaves):
+        gradients = rng.uniform(-1.0, 1.0, _LATTICE)
+        p = np.asarray(xs, dtype=np.float64) * freq + rng.uniform(0, _LATTICE)
+        cell = np.floor(p).astype(np.int64)
+        t = p - cell
+        n0 = gradients[cell % _LATTICE] * t
+        n1 = gradients[(cell + 1) % _LATTICE] * (t - 1.0)
+        fade = t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+        total += amplitude * 2.0 * (n0 + fade * (n1 - n0))
+        norm += amplitude
+        amplitude *= gain
+        freq *= lacunarity
+    return np.clip(total / norm, -1.0, 1.0)
+
+
+def bake_world(level_seed: int, world_width: int, world_height: int, difficulty: int) -> WorldLayout:
+    """Lay out a level by the same rules as world_generator.gd's runtime fallback, vectorized.
+
+    Flowers are baked for every biome; the runtime skips them in caves.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(level_seed)
+    tiles = np.arange(world_width)
+
+    base = 0.6 * world_height * T
+    hill = gradient_noise(tiles, level_seed, 0.035) * 5.0 * T
+    detail = gradient_noise(tiles, level_seed + 42, 0.12) * 2.0 * T
+    heights = (base + hill + detail).astype(np.float32)
+
+    r = gradient_noise(tiles, level_seed + 43, 0.12)
+    decorations = np.select(
+        [
+            (r > 0.25) & (tiles % 3 == 0),
+            (r < -0.3) & (tiles % 5 == 0),
+            np.abs(r) < 0.2,
+            (r > 0.15) & (tiles % 4 == 0),
+        ],
+        [DECOR_TREE, DECOR_ROCK, DECOR_GRASS, DECOR_FLOWER],
+        DECOR_NONE,
+    ).astype(np.uint8)
+    decorations[:2] = DECOR_NONE
+    decorations[world_width - 2:] = DECOR_NONE
+
+    def surface(xs: np.ndarray) -> np.ndarray:
+        return heights[np.clip((xs // T).astype(np.int64), 0, world_width - 1)]
+
+    def scatter(count: int, margin_left: int, margin_right: int) -> np.ndarray:
+        return rng.uniform(margin_left * T, (world_width - margin_right) * T, count)
+
+    count = 15 + difficulty * 8
+    px = scatter(count, 8, 8)
+    py = surface(px) - rng.uniform(60, 180 + difficulty * 15, count)
+    pw = rng.uniform(48, 160 - difficulty * 5, count)
+    platforms = np.stack([px, py, pw], axis=1)
+
+    count = 8 + difficulty * 5
+    ex = scatter(count, 15, 10)
+    kinds = np.resize(_ENEMY_CYCLE, count)
+    lift = np.where(kinds == ENEMY_FLYER, rng.uniform(60, 150, count), 20.0)
+    enemies = np.stack([ex, surface(ex) - lift, kinds], axis=1)
+
+    count = 20 + difficulty * 5
+    cx = scatter(count, 5, 5)
+    collectibles = np.stack([cx, surface(cx) - rng.uniform(30, 160, count)], axis=1)
+
+    def by_x(a: np.ndarray) -> np.ndarray:
+        return a[np.argsort(a[:, 0], kind="stable")].astype(np.float32)
+
+    return WorldLayout(heights, decorations, by_x(platforms), by_x(enemies), by_x(collectibles))
+
+
+def bake_world_resource(level_seed: int, world_width: int, world_height: int,
+                        difficulty: int) -> str | None:
+    """WorldData .tres text for a level, or None when NumPy is missing.
+
+    Without it the level scene has no world_data and the generator lays the
+    level out at runtime instead.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("[world] NumPy not installed, levels will be laid out at runtime")
+        return None
+    return world_resource(bake_world(level_seed, world_width, world_height, difficulty))
+
+
+def world_resource(layout: WorldLayout) -> str:
+    """WorldData .tres for *layout*."""
+
+    def floats(values) -> str:
+        return ", ".join(f"{v:.6g}" for v in values)
+
+    def ints(values) -> str:
+        return ", ".join(str(int(v)) for v in values)
+
+    return f'''[gd_resource type="Resource" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/world/world_data.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+heights = PackedFloat32Array({floats(layout.heights)})
+decorations = PackedByteArray({ints(layout.decorations)})
+platforms = PackedVector3Array({floats(layout.platforms.ravel())})
+platform_chunks = PackedInt32Array({ints(layout.chunk_offsets(layout.platforms))})
+enemies = PackedVector3Array({floats(layout.enemies.ravel())})
+enemy_chunks = PackedInt32Array({ints(layout.chunk_offsets(layout.enemies))})
+collectibles = PackedVector2Array({floats(layout.collectibles.ravel())})
+collectible_chunks = PackedInt32Array({ints(layout.chunk_offsets(layout.collectibles))})
+'''
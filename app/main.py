@@ -5,8 +5,10 @@ Serves the chat UI and handles game-creation conversations + project generation.
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
@@ -14,11 +16,21 @@ from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import GENERATED_GAMES_DIR, STATIC_DIR
-from app.models import ChatRequest, ChatResponse, UndoRequest
+from app.models import BuildJob, ChatRequest, ChatResponse, UndoRequest
 from app.ai.engine import process_message, process_undo, get_or_create_session
 from app.ai.suggestions import get_help_text
+from app.generator.jobs import get_job
+from app.generator.revisions import revision_delta_zip, revision_pck, revision_zip
+from app.mcp.worker_pool import close_pool
 
-app = FastAPI(title="Godot Game Creator", version="2.0.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    await close_pool()  # stop the headless Godot validation workers
+
+
+app = FastAPI(title="Godot Game Creator", version="2.0.0", lifespan=lifespan)
 
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
@@ -45,7 +57,29 @@ async def help_text(session_id: str):
 
 
 @app.get("/api/download/{game_name}")
-async def download_game(game_name: str):
+async def download_game(game_name: str, since: int = 0):
+    """Serve the newest completed revision of a game.
+
+    With *since*, only the files changed after that revision are served.
+    """
+    if since:
+        delta = await asyncio.to_thread(revision_delta_zip, game_name, since)
+        if delta is None:
+            raise HTTPException(status_code=404, detail="Revision not found")
+        return FileResponse(
+            path=str(delta),
+            media_type="application/zip",
+            filename=f"{game_name}_{delta.stem}.zip",
+        )
+
+    archive = revision_zip(game_name)
+    if archive is not None:
+        return FileResponse(
+            path=str(archive),
+            media_type="application/zip",
+            filename=f"{game_name}.zip",
+        )
+
     game_dir = GENERATED_GAMES_DIR / game_name
     if not game_dir.exists():
         raise HTTPException(status_code=404, detail="Game not found")
@@ -59,6 +93,27 @@ async def download_game(game_name: str):
     )
 
 
+@app.get("/api/download/{game_name}/pck")
+async def download_game_pck(game_name: str):
+    """Serve the newest completed revision as one .pck for `godot --main-pack`."""
+    pck = await asyncio.to_thread(revision_pck, game_name)
+    if pck is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return FileResponse(
+        path=str(pck),
+        media_type="application/octet-stream",
+        filename=f"{game_name}.pck",
+    )
+
+
+@app.get("/api/jobs/{job_id}", response_model=BuildJob)
+async def build_job(job_id: str):
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 @app.get("/api/games")
 async def list_games():
     if not GENERATED_GAMES_DIR.exists():
@@ -0,0 +1,39 @@
+extends Node
+## Injected as an autoload into a scratch copy of a game by
+## godot_mcp.benchmark_project. Samples the engine's performance monitors
+## every frame until the level has run a fixed number of physics frames,
+## prints them as one "@@BENCH <json>" line and quits.
+
+var _frames := 600
+var _physics_frames := 0
+var _last_usec := 0
+var _samples := {
+	"frame_ms": [], "process_ms": [], "physics_ms": [],
+	"nodes": [], "objects": [], "memory_mb": [],
+}
+
+
+func _ready() -> void:
+	process_mode = Node.PROCESS_MODE_ALWAYS
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--bench-frames="):
+			_frames = int(arg.get_slice("=", 1))
+	_last_usec = Time.get_ticks_usec()
+
+
+func _process(_delta: float) -> void:
+	var now := Time.get_ticks_usec()
+	_samples["frame_ms"].append((now - _last_usec) / 1000.0)
+	_last_usec = now
+	_samples["process_ms"].append(Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0)
+	_samples["physics_ms"].append(Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0)
+	_samples["nodes"].append(Performance.get_monitor(Performance.OBJECT_NODE_COUNT))
+	_samples["objects"].append(Performance.get_monitor(Performance.OBJECT_COUNT))
+	_samples["memory_mb"].append(Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0)
+
+
+func _physics_process(_delta: float) -> void:
+	_physics_frames += 1
+	if _physics_frames == _frames:
+		print("@@BENCH " + JSON.stringify({"physics_frames": _physics_frames, "samples": _samples}))
+		get_tree().quit()
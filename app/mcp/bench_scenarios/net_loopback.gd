@@ -0,0 +1,93 @@
+extends Node
+## Loopback network benchmark, injected into a scratch copy of a multiplayer
+## game by godot_mcp.benchmark_network() and started twice, with
+## --net-role=host and --net-role=client on --net-port.
+##
+## Each side tracks a puppet per peer and moves its own in a circle while
+## NetworkManager syncs them and the host's score for --net-seconds. Then
+## it prints its snapshot traffic and latency as one "@@NET <json>" line
+## and quits. --net-budget=N caps the host's bytes per second per client.
+
+var _role := "host"
+var _port := 28960
+var _seconds := 10.0
+var _budget := 0
+var _elapsed := -1.0
+var _owned: Node2D = null
+var _net: Node = null
+
+
+func _ready() -> void:
+	process_mode = Node.PROCESS_MODE_ALWAYS
+	for arg in OS.get_cmdline_user_args():
+		var value := arg.get_slice("=", 1)
+		if arg.begins_with("--net-role="):
+			_role = value
+		elif arg.begins_with("--net-port="):
+			_port = int(value)
+		elif arg.begins_with("--net-seconds="):
+			_seconds = float(value)
+		elif arg.begins_with("--net-budget="):
+			_budget = int(value)
+	_net = get_node_or_null("/root/NetworkManager")
+	if _net == null:
+		_finish({"error": "project has no NetworkManager"})
+		return
+	if _role == "host":
+		_net.player_connected.connect(_on_player_connected)
+		if _net.host_game(_port) != OK:
+			_finish({"error": "could not host on port %d" % _port})
+			return
+		_owned = _add_puppet(1)
+	else:
+		_net.connection_succeeded.connect(_on_connected)
+		_net.connection_failed.connect(_finish.bind({"error": "connection failed"}))
+		_net.join_game("127.0.0.1", _port)
+
+
+func _physics_process(delta: float) -> void:
+	if _elapsed < 0.0 or _owned == null:
+		return
+	_elapsed += delta
+	_owned.position = Vector2(cos(_elapsed), sin(_elapsed)) * 200.0
+	_owned.rotation = _elapsed
+	if _role == "host" and Engine.get_physics_frames() % 60 == 0:
+		GameManager.add_score(10)
+	# The client stops first, so the host measures a connected client throughout
+	if _elapsed >= (_seconds if _role == "host" else _seconds - 0.5):
+		_report()
+
+
+func _on_player_connected(peer_id: int) -> void:
+	if _budget > 0:
+		_net.set_bandwidth_budget(peer_id, _budget)
+	_add_puppet(peer_id)
+	_elapsed = 0.0
+
+
+func _on_connected() -> void:
+	_add_puppet(1)
+	_owned = _add_puppet(multiplayer.get_unique_id())
+	_elapsed = 0.0
+
+
+func _add_puppet(owner_id: int) -> Node2D:
+	var puppet := Node2D.new()
+	puppet.name = "Puppet%d" % owner_id
+	add_child(puppet)
+	_net.track(puppet, owner_id)
+	return puppet
+
+
+func _report() -> void:
+	set_physics_process(false)
+	var peers := {}
+	for peer_id in multiplayer.get_peers():
+		peers[str(peer_id)] = _net.get_stats(peer_id)
+	_finish({"seconds": _elapsed, "score": GameManager.score, "peers": peers})
+
+
+func _finish(result: Dictionary) -> void:
+	result["role"] = _role
+	print("@@NET " + JSON.stringify(result))
+	get_tree().quit()
@@ -0,0 +1,32 @@
+extends Node
+## Benchmark scenario for shooter levels, injected next to BenchProfiler by
+## godot_mcp.benchmark_project(scenario="shooter_bullets").
+##
+## Fires --bench-bullets=N (default 8) bullets a physics frame from across
+## the bottom of the screen — several hundred alive at once — and spawns
+## enemies ten times a second, while keeping the level from ending: the
+## player can't die and kills never clear the level.
+
+var _per_frame := 8
+
+
+func _ready() -> void:
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--bench-bullets="):
+			_per_frame = int(arg.get_slice("=", 1))
+
+
+func _physics_process(_delta: float) -> void:
+	var level = get_tree().current_scene
+	if level == null or not level.has_node("BulletPool"):
+		return
+	if GameManager.health < 100:
+		GameManager.health = 100
+	if "_kills" in level:
+		level._kills = 0
+	var spawner = level.get_node_or_null("EnemySpawner")
+	if spawner and spawner.wait_time > 0.1:
+		spawner.start(0.1)
+	var bullets = level.get_node("BulletPool")
+	for i in _per_frame:
+		bullets.acquire().fire(Vector2(randf_range(40, 1240), 700))
@@ -0,0 +1,32 @@
+extends Node
+## Benchmark scenario for top-down levels, injected next to BenchProfiler by
+## godot_mcp.benchmark_project(scenario="topdown_horde").
+##
+## Fills the level with --bench-enemies=N (default 200) extra enemies on a
+## grid around the player, so frame time can be compared across enemy
+## counts; it should stay flat, since only enemies near the player chase
+## every tick. The player can't die.
+
+var _count := 200
+var _spawned := false
+
+
+func _ready() -> void:
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--bench-enemies="):
+			_count = int(arg.get_slice("=", 1))
+
+
+func _physics_process(_delta: float) -> void:
+	if GameManager.health < 100:
+		GameManager.health = 100
+	var player := get_tree().get_first_node_in_group("player") as Node2D
+	if _spawned or player == null or not ResourceLoader.exists("res://scenes/enemy.tscn"):
+		return
+	_spawned = true
+	var enemy_scene: PackedScene = load("res://scenes/enemy.tscn")
+	var side := ceili(sqrt(_count))
+	for i in _count:
+		var enemy := enemy_scene.instantiate() as Node2D
+		enemy.position = player.position + (Vector2(i % side, floori(float(i) / side)) - Vector2.ONE * side / 2.0) * 48.0
+		player.get_parent().add_child(enemy)
@@ -0,0 +1,108 @@
+"""Stand-in for the Godot binary, for the tests and for running without an engine.
+
+    GODOT_BIN="python -m app.mcp.fake_godot" uvicorn app.main:app
+
+Understands a plain `--headless --quit` or `--import` run, the worker
+protocol spoken by validator_worker.gd, a benchmark run of a scene with
+`-- --bench-frames=N` (prints synthetic bench_profiler.gd samples) and a
+`--net-role=` loopback run (prints a synthetic net_loopback.gd report).
+
+"Loading" a resource just reads the file and reports a script error if it
+is missing or empty. A file containing CRASH_MARKER makes the worker exit
+mid-job and one containing HANG_MARKER makes it stop answering, so crash
+and timeout recovery can be exercised. FAKE_GODOT_DELAY (seconds per file)
+simulates load cost and FAKE_GODOT_STARTUP the engine boot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+BANNER = "Godot Engine v4.4.1.stable.fake - https://godotengine.org"
+CRASH_MARKER = "@@FAKE_GODOT_CRASH"
+HANG_MARKER = "@@FAKE_GODOT_HANG"
+
+
+def main(argv: list[str]) -> int:
+    args, user_args = argv, []
+    if "--" in argv:
+        split = argv.index("--")
+        args, user_args = argv[:split], argv[split + 1:]
+
+    time.sleep(float(os.environ.get("FAKE_GODOT_STARTUP", "0")))
+    print(BANNER, flush=True)
+    if "--script" not in args:
+        if any(a.startswith("--bench-frames=") for a in user_args):
+            _bench(args, user_args)
+        elif any(a.startswith("--net-role=") for a in user_args):
+            _net_bench(user_args)
+        return 0
+
+    root = Path(args[args.index("--path") + 1]) if "--path" in args else Path.cwd()
+    options = dict(a[2:].split("=", 1) for a in user_args if a.startswith("--") and "=" in a)
+    delay = float(os.environ.get("FAKE_GODOT_DELAY", "0"))
+
+    with socket.create_connection(("127.0.0.1", int(options["port"]))) as sock:
+        sock.sendall(f"worker {options.get('worker', 0)}\n".encode())
+        for line in sock.makefile(encoding="utf-8"):
+            job = json.loads(line)
+            if job.get("op") == "quit":
+                break
+            failed, times = [], {}
+            print(f"@@BEGIN {job['id']}", file=sys.stderr, flush=True)
+            for res_path in job.get("files", []):
+                print(f"@@FILE {res_path}", file=sys.stderr)
+                started = time.perf_counter()
+                time.sleep(delay)
+                path = root / res_path.removeprefix("res://")
+                text = path.read_text(errors="replace") if path.is_file() else ""
+                if CRASH_MARKER in text:
+                    sys.stderr.flush()
+                    os._exit(1)
+                if HANG_MARKER in text:
+                    time.sleep(3600)
+                if not text:
+                    print(f"SCRIPT ERROR: Failed loading resource: {res_path}", file=sys.stderr)
+                    failed.append(res_path)
+                times[res_path] = int((time.perf_counter() - started) * 1e6)
+            summary = json.dumps({"checked": len(job.get("files", [])), "failed": failed, "times": times})
+            print(f"@@END {job['id']} {summary}", file=sys.stderr, flush=True)
+    return 0
+
+
+def _bench(args: list[str], user_args: list[str]) -> None:
+    frames = int(next(a for a in user_args if a.startswith("--bench-frames=")).split("=", 1)[1])
+    scene = next((a for a in args if a.startswith("res://")), "")
+    root = Path(args[args.index("--path") + 1]) if "--path" in args else Path.cwd()
+    size = (root / scene.removeprefix("res://")).stat().st_size if scene else 0
+    # Frame cost grows with the scene file so bigger levels look heavier
+    nodes = 40 + size // 200
+    samples = {
+        "frame_ms": [16.6 + (i % 7) * 0.1 for i in range(frames)],
+        "process_ms": [0.5 + nodes * 0.002 for _ in range(frames)],
+        "physics_ms": [0.3 + nodes * 0.001 + (i % 11) * 0.01 for i in range(frames)],
+        "nodes": [nodes] * frames,
+        "objects": [nodes * 3] * frames,
+        "memory_mb": [30.0 + size / 1e5] * frames,
+    }
+    print("@@BENCH " + json.dumps({"physics_frames": frames, "samples": samples}), flush=True)
+
+
+def _net_bench(user_args: list[str]) -> None:
+    options = dict(a[2:].split("=", 1) for a in user_args if a.startswith("--") and "=" in a)
+    seconds = float(options.get("net-seconds", "10"))
+    budget = int(options.get("net-budget", "0")) or 16384
+    # Two puppets at 20 snapshots/s, one entity in each delta plus headers
+    stats = {"bytes_per_s": min(budget, 20 * 40.0), "latency_ms": 0.5, "snapshots": int(seconds * 20)}
+    peer = "2" if options["net-role"] == "host" else "1"
+    result = {"seconds": seconds, "score": int(seconds) * 10, "peers": {peer: stats}, "role": options["net-role"]}
+    print("@@NET " + json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
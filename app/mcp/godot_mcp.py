@@ -3,20 +3,67 @@
 This module uses Godot's --headless mode to perform static validation of
 generated projects (script syntax, scene integrity) without requiring a
 display server. It follows the MCP pattern of tool-based interaction with
-the engine.
+the engine. The engine processes are long-lived workers from
+app.mcp.worker_pool, so a build pays for loading its files rather than for
+engine start-up.
+
+A pure-Python static pass (app.mcp.static_validator) runs first; when it
+finds errors the engine pass is skipped, and it is all the checking there
+is when no Godot binary is installed.
+
+Scripts are checked one by one (static checks, then a load in a Godot
+worker, spread over the pool) and the per-file result is cached on disk by
+content hash. Most of a game's scripts — the shared autoloads, menus, HUD —
+are byte-identical between builds, so they are checked once per generator
+version rather than once per game.
+
+benchmark_project() is the performance counterpart: it plays each level
+headless under an injected profiling autoload and compares the frame-time,
+physics, node-count and memory percentiles with a stored per-genre
+baseline (`python -m app.mcp.godot_mcp <project_dir>...`). A scenario
+from bench_scenarios/ can load the level first — `--scenario
+shooter_bullets` floods a shooter level with bullets — and comparing a
+build against the baseline of an older one reports improvements as well
+as regressions.
+
+benchmark_network() starts a host and a client of a multiplayer game over
+loopback (`--network`) and reports the snapshot traffic NetworkManager
+sends each second and the latency it measures.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import os
+import re
+import shutil
+import socket
+import tempfile
+import time
 from pathlib import Path
+from typing import Optional
+
+from app.config import BENCH_BASELINE_PATH, CHECK_CACHE_DIR, GODOT_BIN
+from app.models import Genre
+from app.mcp.static_validator import (
+    check_gdscript,
+    check_project,
+    project_autoloads,
+    referenced_paths,
+    res_exists,
+)
+from app.mcp.worker_pool import GodotWorkerPool, get_pool
+
+CHECKER_VERSION = 2  # bump when static checks or the worker protocol change
 
-from app.config import GODOT_BIN
+_GODOT_LOCATION_RE = re.compile(r"\(res://[^()]*?:(\d+)\)")
+_memory_cache: dict[str, dict] = {}
 
 
 async def validate_project(project_dir: str) -> str:
-    """Run Godot in headless mode to validate the project and return log output."""
+    """Statically check the project, then load it in a headless Godot worker; return log output."""
     pdir = Path(project_dir)
     if not (pdir / "project.godot").exists():
         return "ERROR: project.godot not found"
@@ -31,44 +78,502 @@ async def validate_project(project_dir: str) -> str:
     tscn_files = list(pdir.rglob("*.tscn"))
     log_lines.append(f"Found {len(tscn_files)} scene file(s)")
 
+    report = await check_scripts(pdir)
+    summary = report["summary"]
+    log_lines.append(
+        f"Checked {summary['files']} script(s) ({summary['cached']} cached, "
+        f"{'static + Godot' if report['engine'] else 'static only'}) in {summary['ms']:.0f} ms"
+    )
+    diagnostics = [
+        f"{rel}:{d['line']}: {d['severity']}: {d['message']}"
+        for rel, entry in report["files"].items() for d in entry["diagnostics"]
+    ]
+    resource_diagnostics = await asyncio.to_thread(check_project, pdir, False)
+    diagnostics.extend(str(d) for d in resource_diagnostics)
+    errors = summary["errors"] + sum(1 for d in resource_diagnostics if d.severity == "error")
+    if diagnostics:
+        log_lines.append("\nDiagnostics:")
+        log_lines.extend(diagnostics)
+    if errors:
+        log_lines.append(f"\n✗ Found {errors} error(s)")
+        return "\n".join(log_lines)
+
+    # Scripts are done; the engine pass only has scenes left to load.
+    scenes = ["res://" + p.relative_to(pdir).as_posix() for p in sorted(tscn_files)]
     try:
-        proc = await asyncio.create_subprocess_exec(
-            GODOT_BIN, "--headless", "--quit",
-            cwd=str(pdir),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
-            env={**os.environ, "HOME": os.environ.get("HOME", "/tmp")},
-        )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
-        output = stdout.decode(errors="replace").strip()
-        if output:
+        result = await get_pool().check(pdir, scenes)
+        if result.output:
             log_lines.append("\nGodot output:")
-            log_lines.append(output)
+            log_lines.append(result.output)
 
-        if proc.returncode == 0:
-            log_lines.append("\n✓ Project validated successfully")
+        if result.error:
+            log_lines.append(f"\n⚠ {result.error}")
+        elif result.failed:
+            log_lines.append(f"\n✗ {len(result.failed)} file(s) failed to load:")
+            log_lines.extend(f"  {path}" for path in result.failed)
         else:
-            log_lines.append(f"\n✗ Godot exited with code {proc.returncode}")
-    except asyncio.TimeoutError:
-        log_lines.append("\n⚠ Validation timed out (30s)")
+            log_lines.append("\n✓ Project validated successfully")
     except FileNotFoundError:
         log_lines.append(f"\n⚠ Godot binary not found at: {GODOT_BIN}")
-        log_lines.append("  Project files were generated — open manually in Godot.")
+        log_lines.append("  Static checks passed; open the project in Godot for a full check.")
 
     return "\n".join(log_lines)
 
 
+async def check_scripts(project_dir: Path, scripts: Optional[list[str]] = None) -> dict:
+    """Check GDScript files (project-relative paths; default all) and return a JSON-able report.
+
+    {"project", "engine", "files": {path: {"sha256", "ok", "cached", "ms",
+    "diagnostics": [{"line", "severity", "message", "source"}]}},
+    "summary": {"files", "cached", "errors", "ms"}}
+    """
+    started = time.perf_counter()
+    pdir = Path(project_dir)
+    pool = get_pool()
+    engine = pool.available
+    if scripts is None:
+        scripts = sorted(
+            p.relative_to(pdir).as_posix() for p in pdir.rglob("*.gd")
+            if p.relative_to(pdir).parts[0] != ".godot"
+        )
+
+    autoloads = project_autoloads(pdir)
+    exists = res_exists(pdir)
+    texts = {rel: (pdir / rel).read_text(errors="replace") for rel in scripts}
+    engine_id = " ".join(pool.command) if engine else "static"
+    keys = {rel: _cache_key(texts[rel], autoloads, exists, engine_id) for rel in scripts}
+
+    files: dict[str, dict] = {}
+    misses = []
+    for rel in scripts:
+        cached = _cache_get(keys[rel])
+        if cached is not None:
+            files[rel] = {**cached, "cached": True, "ms": 0.0}
+        else:
+            misses.append(rel)
+
+    if misses:
+        static = await asyncio.to_thread(_static_pass, misses, texts, autoloads, exists)
+        clean = [rel for rel in misses if not any(d["severity"] == "error" for d in static[rel][0])]
+        engine_results = await _engine_pass(pool, pdir, clean) if engine and clean else {}
+        for rel in misses:
+            diagnostics, ms = static[rel]
+            engine_diagnostics, engine_ms, definitive = engine_results.get(rel, ([], 0.0, True))
+            diagnostics = diagnostics + engine_diagnostics
+            entry = {
+                "sha256": hashlib.sha256(texts[rel].encode()).hexdigest(),
+                "ok": not any(d["severity"] == "error" for d in diagnostics),
+                "diagnostics": diagnostics,
+            }
+            if definitive:
+                _cache_put(keys[rel], entry)
+            files[rel] = {**entry, "cached": False, "ms": round(ms + engine_ms, 2)}
+
+    return {
+        "project": pdir.name,
+        "engine": engine,
+        "files": files,
+        "summary": {
+            "files": len(files),
+            "cached": sum(1 for f in files.values() if f["cached"]),
+            "errors": sum(1 for f in files.values() for d in f["diagnostics"] if d["severity"] == "error"),
+            "ms": round((time.perf_counter() - started) * 1000, 2),
+        },
+    }
+
+
 async def run_script_check(project_dir: str, script_path: str) -> str:
-    """Check a single GDScript file for errors."""
+    """Check a single GDScript file for errors; returns its JSON diagnostics."""
+    path = Path(script_path.removeprefix("res://"))
+    if path.is_absolute():
+        path = path.relative_to(project_dir)
     try:
-        proc = await asyncio.create_subprocess_exec(
-            GODOT_BIN, "--headless", "--check-only",
-            "--script", script_path,
-            cwd=project_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
-        )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
-        return stdout.decode(errors="replace").strip()
+        report = await check_scripts(Path(project_dir), [path.as_posix()])
+        return json.dumps(report["files"][path.as_posix()], indent=1)
     except Exception as exc:
         return f"Error checking script: {exc}"
+
+
+def _static_pass(scripts: list[str], texts: dict[str, str], autoloads: dict[str, str],
+                 exists) -> dict[str, tuple[list[dict], float]]:
+    results = {}
+    for rel in scripts:
+        started = time.perf_counter()
+        diagnostics = [
+            {"line": d.line, "severity": d.severity, "message": d.message, "source": "static"}
+            for d in check_gdscript(texts[rel], rel, autoloads, exists)
+        ]
+        results[rel] = (diagnostics, (time.perf_counter() - started) * 1000)
+    return results
+
+
+async def _engine_pass(pool: GodotWorkerPool, pdir: Path,
+                       scripts: list[str]) -> dict[str, tuple[list[dict], float, bool]]:
+    """Load *scripts* across the worker pool; returns path -> (diagnostics, ms, cacheable)."""
+    chunks = [scripts[i::pool.size] for i in range(pool.size) if scripts[i::pool.size]]
+    try:
+        results = await asyncio.gather(
+            *(pool.check(pdir, ["res://" + rel for rel in chunk]) for chunk in chunks)
+        )
+    except FileNotFoundError:
+        return {}
+
+    out = {}
+    for chunk, result in zip(chunks, results):
+        for rel in chunk:
+            res_path = "res://" + rel
+            if result.error and res_path not in result.times:
+                # Timed out or crashed before reaching this file: report, don't cache
+                out[rel] = ([{"line": 0, "severity": "error", "message": result.error,
+                              "source": "godot"}], 0.0, False)
+                continue
+            diagnostics = _engine_diagnostics(result.per_file.get(res_path, []))
+            if res_path in result.failed and not any(d["severity"] == "error" for d in diagnostics):
+                diagnostics.append({"line": 0, "severity": "error", "message": "failed to load",
+                                    "source": "godot"})
+            out[rel] = (diagnostics, result.times.get(res_path, 0.0), True)
+    return out
+
+
+def _engine_diagnostics(lines: list[str]) -> list[dict]:
+    """Turn Godot's "ERROR: ... / at: ... (res://x.gd:12)" output into diagnostics."""
+    diagnostics: list[dict] = []
+    for line in lines:
+        text = line.strip()
+        if text.startswith("at:"):
+            match = _GODOT_LOCATION_RE.search(text)
+            if match and diagnostics:
+                diagnostics[-1]["line"] = int(match.group(1))
+        elif "ERROR" in text or text.startswith("WARNING"):
+            severity = "warning" if text.startswith("WARNING") else "error"
+            diagnostics.append({"line": 0, "severity": severity, "message": text, "source": "godot"})
+    return diagnostics
+
+
+def _cache_key(text: str, autoloads: dict[str, str], exists, engine_id: str) -> str:
+    """Hash of everything a script's result depends on: its source, the autoloads
+    it can see, which of its preload/extends targets exist, and the checker."""
+    deps = [f"{path}={exists(path)}" for path in referenced_paths(text)]
+    parts = [str(CHECKER_VERSION), engine_id, ",".join(sorted(autoloads)), ",".join(deps), text]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[dict]:
+    if key in _memory_cache:
+        return _memory_cache[key]
+    path = CHECK_CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    _memory_cache[key] = entry
+    return entry
+
+
+def _cache_put(key: str, entry: dict) -> None:
+    _memory_cache[key] = entry
+    CHECK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CHECK_CACHE_DIR / f"{key}.tmp"
+    tmp.write_text(json.dumps(entry))
+    tmp.replace(CHECK_CACHE_DIR / f"{key}.json")
+
+
+# ── gameplay benchmark ──────────────────────────────────────────────────
+
+BENCH_FRAMES = 600  # physics frames per level (10 s of game time at 60 Hz)
+BENCH_TIMEOUT = 120.0
+BENCH_PROFILER = Path(__file__).parent / "bench_profiler.gd"
+# Optional load generators run alongside the profiler, e.g. "shooter_bullets"
+BENCH_SCENARIOS_DIR = Path(__file__).parent / "bench_scenarios"
+NET_BENCH_SCRIPT = BENCH_SCENARIOS_DIR / "net_loopback.gd"
+NET_BENCH_SECONDS = 10.0
+_LEVEL_RE = re.compile(r"level_(\d+)\.tscn")
+_TAGS_RE = re.compile(r'^config/tags=PackedStringArray\((.*)\)\s*$', re.MULTILINE)
+REGRESSION_TOLERANCE = 0.2  # flag metrics more than 20% worse than the baseline
+# metric -> statistic compared against the baseline
+_REGRESSION_METRICS = {"frame_ms": "p95", "physics_ms": "p95", "nodes": "max", "memory_mb": "max"}
+
+
+async def benchmark_project(project_dir: str, genre: str = "", frames: int = BENCH_FRAMES,
+                            update_baseline: bool = False, scenario: str = "") -> dict:
+    """Run every scenes/level_N.tscn headless for *frames* physics frames and profile it.
+
+    Works on a scratch copy with the profiling autoload injected, so the
+    game itself is untouched. *scenario* names a script in bench_scenarios/
+    injected as a second autoload to put the level under load. Returns
+    per-level percentiles, a per-genre summary and any regressions (and
+    improvements) against the stored baseline for *genre* and *scenario*.
+    *genre* defaults to the genre tag the generator writes to project.godot.
+    """
+    pdir = Path(project_dir)
+    if not (pdir / "project.godot").exists():
+        return {"project": pdir.name, "genre": genre, "error": "project.godot not found"}
+    genre = genre or project_genre(pdir)
+    if not genre:
+        return {"project": pdir.name, "genre": "",
+                "error": "cannot tell the project's genre (no genre in project.godot config/tags); pass a genre"}
+    scenario_script = BENCH_SCENARIOS_DIR / f"{scenario}.gd" if scenario else None
+    if scenario_script and not scenario_script.exists():
+        return {"project": pdir.name, "genre": genre, "error": f"unknown benchmark scenario: {scenario}"}
+    levels = sorted(
+        (p for p in (pdir / "scenes").glob("level_*.tscn") if _LEVEL_RE.fullmatch(p.name)),
+        key=lambda p: int(_LEVEL_RE.fullmatch(p.name).group(1)),
+    )
+    command = get_pool().command
+    report: dict = {"project": pdir.name, "genre": genre, "scenario": scenario, "frames": frames, "levels": {}}
+
+    with tempfile.TemporaryDirectory(prefix="godot-bench-") as tmp:
+        work = Path(tmp) / pdir.name
+        await asyncio.to_thread(shutil.copytree, pdir, work, ignore=shutil.ignore_patterns(".godot"))
+        _inject_profiler(work, scenario_script)
+        try:
+            # Import assets once so levels don't fail on missing .import data
+            await _run_godot(command, work, ["--import"], BENCH_TIMEOUT)
+            samples_by_level = {}
+            for level in levels:
+                output, code = await _run_godot(
+                    command, work,
+                    ["--fixed-fps", "60", f"res://scenes/{level.name}", "--", f"--bench-frames={frames}"],
+                    BENCH_TIMEOUT,
+                )
+                samples = _bench_samples(output)
+                if samples is None:
+                    tail = "\n".join(output.strip().splitlines()[-5:])
+                    report["levels"][level.stem] = {"error": f"no benchmark output (exit {code})\n{tail}"}
+                    continue
+                samples_by_level[level.stem] = samples
+                report["levels"][level.stem] = _summarize(samples)
+        except FileNotFoundError:
+            report["error"] = f"Godot binary not found at: {GODOT_BIN}"
+            return report
+
+    merged: dict[str, list[float]] = {}
+    for samples in samples_by_level.values():
+        for metric, values in samples.items():
+            merged.setdefault(metric, []).extend(values)
+    report["genre_summary"] = _summarize(merged) if merged else {}
+
+    baseline = _load_baseline()
+    key = f"{genre}/{scenario}" if scenario else genre
+    report["regressions"], report["improvements"] = _compare(report["levels"], baseline.get(key, {}))
+    if update_baseline:
+        baseline[key] = {
+            name: {m: stats[m][stat] for m, stat in _REGRESSION_METRICS.items() if m in stats}
+            for name, stats in report["levels"].items() if "error" not in stats
+        }
+        BENCH_BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BENCH_BASELINE_PATH.write_text(json.dumps(baseline, indent=1, sort_keys=True))
+    return report
+
+
+async def benchmark_network(project_dir: str, seconds: float = NET_BENCH_SECONDS, budget: int = 0) -> dict:
+    """Sync a host and a client of a multiplayer game over loopback for *seconds* and measure it.
+
+    Both run headless from one scratch copy with bench_scenarios/net_loopback.gd
+    injected, each moving a tracked puppet. *budget* caps the host's bytes per
+    second to the client (0 keeps NetworkManager.DEFAULT_BUDGET). Returns
+    what each side printed plus the bytes per second the host sent, the
+    latency it measured and whether the client ended on the host's score.
+    """
+    pdir = Path(project_dir)
+    if not (pdir / "project.godot").exists():
+        return {"project": pdir.name, "error": "project.godot not found"}
+    if "NetworkManager" not in project_autoloads(pdir):
+        return {"project": pdir.name, "error": "project has no multiplayer (no NetworkManager autoload)"}
+    command = get_pool().command
+    report: dict = {"project": pdir.name, "seconds": seconds, "budget": budget}
+
+    with tempfile.TemporaryDirectory(prefix="godot-bench-") as tmp:
+        work = Path(tmp) / pdir.name
+        await asyncio.to_thread(shutil.copytree, pdir, work, ignore=shutil.ignore_patterns(".godot"))
+        shutil.copy(NET_BENCH_SCRIPT, work / "net_bench.gd")
+        _add_autoloads(work, 'NetBench="*res://net_bench.gd"')
+        args = ["--", f"--net-port={_free_port()}", f"--net-seconds={seconds}", f"--net-budget={budget}"]
+        try:
+            await _run_godot(command, work, ["--import"], BENCH_TIMEOUT)
+            outputs = await asyncio.gather(
+                _run_godot(command, work, [*args, "--net-role=host"], BENCH_TIMEOUT + seconds),
+                _run_godot(command, work, [*args, "--net-role=client"], BENCH_TIMEOUT + seconds),
+            )
+        except FileNotFoundError:
+            report["error"] = f"Godot binary not found at: {GODOT_BIN}"
+            return report
+
+    for role, (output, code) in zip(("host", "client"), outputs):
+        result = _net_result(output)
+        if result is None:
+            tail = "\n".join(output.strip().splitlines()[-5:])
+            result = {"error": f"no network benchmark output (exit {code})\n{tail}"}
+        report[role] = result
+    clients = report["host"].get("peers") or {}
+    if clients:
+        stats = next(iter(clients.values()))
+        report["bytes_per_s"] = stats["bytes_per_s"]
+        report["latency_ms"] = stats["latency_ms"]
+        report["score_synced"] = report["client"].get("score") == report["host"].get("score")
+    return report
+
+
+def project_genre(project_dir: Path) -> str:
+    """The genre listed in project.godot's config/tags, or "" if there is none."""
+    try:
+        text = (Path(project_dir) / "project.godot").read_text(errors="replace")
+    except OSError:
+        return ""
+    match = _TAGS_RE.search(text)
+    tags = re.findall(r'"([^"]*)"', match.group(1)) if match else []
+    genres = {g.value for g in Genre}
+    return next((tag for tag in tags if tag in genres), "")
+
+
+def summarize_by_genre(reports: list[dict]) -> dict[str, dict]:
+    """Fold several benchmark reports into worst-case numbers per genre."""
+    by_genre: dict[str, dict] = {}
+    for report in reports:
+        summary = report.get("genre_summary") or {}
+        target = by_genre.setdefault(report["genre"], {})
+        for metric, stats in summary.items():
+            current = target.setdefault(metric, dict(stats))
+            for stat, value in stats.items():
+                current[stat] = max(current[stat], value)
+    return by_genre
+
+
+def _inject_profiler(work: Path, scenario_script: Optional[Path] = None) -> None:
+    shutil.copy(BENCH_PROFILER, work / BENCH_PROFILER.name)
+    entry = f'BenchProfiler="*res://{BENCH_PROFILER.name}"'
+    if scenario_script:
+        shutil.copy(scenario_script, work / "bench_scenario.gd")
+        entry += '\nBenchScenario="*res://bench_scenario.gd"'
+    _add_autoloads(work, entry)
+
+
+def _add_autoloads(work: Path, entry: str) -> None:
+    """Register the project.godot [autoload] lines in *entry* ahead of the game's own."""
+    project = work / "project.godot"
+    text = project.read_text()
+    if "[autoload]\n" in text:
+        text = text.replace("[autoload]\n", f"[autoload]\n\n{entry}\n", 1)
+    else:
+        text += f"\n[autoload]\n\n{entry}\n"
+    project.write_text(text)
+
+
+async def _run_godot(command: list[str], work: Path, args: list[str], timeout: float) -> tuple[str, int]:
+    proc = await asyncio.create_subprocess_exec(
+        *command, "--headless", "--path", str(work), *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env={**os.environ, "HOME": os.environ.get("HOME", "/tmp")},
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return f"timed out after {timeout:.0f}s", -1
+    return stdout.decode(errors="replace"), proc.returncode
+
+
+def _bench_samples(output: str) -> Optional[dict[str, list[float]]]:
+    for line in output.splitlines():
+        if line.startswith("@@BENCH "):
+            try:
+                return json.loads(line[len("@@BENCH "):])["samples"]
+            except (ValueError, KeyError):
+                return None
+    return None
+
+
+def _net_result(output: str) -> Optional[dict]:
+    for line in output.splitlines():
+        if line.startswith("@@NET "):
+            try:
+                return json.loads(line[len("@@NET "):])
+            except ValueError:
+                return None
+    return None
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _summarize(samples: dict[str, list[float]]) -> dict[str, dict[str, float]]:
+    # The first frames include scene instancing; keep them out of the percentiles
+    warmup = 10
+    stats = {}
+    for metric, values in samples.items():
+        values = sorted(values[warmup:] if len(values) > warmup * 2 else values)
+        if not values:
+            continue
+        stats[metric] = {
+            "p50": round(_percentile(values, 50), 3),
+            "p95": round(_percentile(values, 95), 3),
+            "p99": round(_percentile(values, 99), 3),
+            "max": round(values[-1], 3),
+        }
+    return stats
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def _compare(levels: dict[str, dict], baseline: dict[str, dict]) -> tuple[list[dict], list[dict]]:
+    """(regressions, improvements): metrics that moved more than REGRESSION_TOLERANCE."""
+    regressions, improvements = [], []
+    for name, stats in levels.items():
+        for metric, stat in _REGRESSION_METRICS.items():
+            before = baseline.get(name, {}).get(metric)
+            if not before or metric not in stats:
+                continue
+            now = stats[metric][stat]
+            change = {
+                "level": name, "metric": f"{metric}.{stat}",
+                "baseline": before, "current": now, "ratio": round(now / before, 2),
+            }
+            if now > before * (1 + REGRESSION_TOLERANCE):
+                regressions.append(change)
+            elif now < before * (1 - REGRESSION_TOLERANCE):
+                improvements.append(change)
+    return regressions, improvements
+
+
+def _load_baseline() -> dict:
+    try:
+        return json.loads(BENCH_BASELINE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark generated levels headless.")
+    parser.add_argument("projects", nargs="+", help="generated project directories")
+    parser.add_argument("--genre", default="", help="baseline key (default: the genre tag in project.godot)")
+    parser.add_argument("--frames", type=int, default=BENCH_FRAMES)
+    parser.add_argument("--scenario", default="", help="load generator from bench_scenarios/")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--network", action="store_true", help="run the host/client loopback sync benchmark instead")
+    parser.add_argument("--net-seconds", type=float, default=NET_BENCH_SECONDS)
+    parser.add_argument("--net-budget", type=int, default=0, help="host bytes/s per client (0: game default)")
+    args = parser.parse_args()
+
+    async def _main() -> None:
+        if args.network:
+            reports = [await benchmark_network(p, args.net_seconds, args.net_budget) for p in args.projects]
+            print(json.dumps({"reports": reports}, indent=1))
+            return
+        reports = [
+            await benchmark_project(p, args.genre, args.frames, args.update_baseline, args.scenario)
+            for p in args.projects
+        ]
+        print(json.dumps({"reports": reports, "by_genre": summarize_by_genre(reports)}, indent=1))
+
+    asyncio.run(_main())
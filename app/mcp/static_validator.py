@@ -0,0 +1,369 @@
+"""In-process static checks for generated Godot projects.
+
+Catches the mistakes a template change is most likely to introduce without
+needing a Godot binary, and fast enough (milliseconds per project) to run
+on every build ahead of the headless engine pass:
+
+- .tscn / .tres: every ext_resource path exists, ExtResource/SubResource
+  references are declared, load_steps matches the resource count, node
+  parents and connection endpoints name earlier nodes.
+- .gd: tokenization (unterminated strings, unbalanced brackets, stray
+  characters), tab/space indentation and block structure, preload/extends
+  paths, and autoload singletons that project.godot does not register.
+- project.godot: the main scene and autoload scripts exist.
+
+It is not a GDScript compiler — type errors and unknown identifiers are
+left to Godot.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from app.generator.godot_project import AUTOLOADS
+
+_VALUE = r"(?:\"(?:[^\"\\]|\\.)*\"|\[[^\]]*\]|[^\s\]]+)"
+_SECTION_RE = re.compile(rf"^\[(\w+)((?:\s+\w+={_VALUE})*)\s*\]\s*$")
+_ATTR_RE = re.compile(rf"(\w+)=({_VALUE})")
+_REF_RE = re.compile(r"\b(ExtResource|SubResource)\(\s*\"([^\"]*)\"\s*\)")
+_RES_PATH_RE = re.compile(r"\b(preload|extends)\s*\(?\s*\"(res://[^\"]+)\"")
+_PYTHON_LITERALS = {"True", "False", "None"}
+_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+
+
+@dataclass
+class Diagnostic:
+    path: str
+    line: int
+    message: str
+    severity: str = "error"
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.severity}: {self.message}"
+
+
+def check_project(project_dir: Path, scripts: bool = True) -> list[Diagnostic]:
+    """Statically check every scene and resource (and script, if *scripts*) in *project_dir*."""
+    project_dir = Path(project_dir)
+    exists = res_exists(project_dir)
+    autoloads = project_autoloads(project_dir)
+
+    diagnostics = check_project_file(project_dir, exists)
+    for path in sorted(project_dir.rglob("*")):
+        rel = path.relative_to(project_dir).as_posix()
+        if rel.startswith(".godot/") or path.suffix not in (".gd", ".tscn", ".tres"):
+            continue
+        if path.suffix == ".gd" and not scripts:
+            continue
+        text = path.read_text(errors="replace")
+        if path.suffix == ".gd":
+            diagnostics.extend(check_gdscript(text, rel, autoloads, exists))
+        else:
+            diagnostics.extend(check_resource(text, rel, exists))
+    return diagnostics
+
+
+def project_autoloads(project_dir: Path) -> dict[str, str]:
+    """Autoload name -> res:// script path registered in project.godot."""
+    project = Path(project_dir) / "project.godot"
+    if not project.exists():
+        return {}
+    autoloads = {}
+    section = ""
+    for line in project.read_text(errors="replace").splitlines():
+        if line.startswith("["):
+            section = line.strip("[] ")
+        elif section == "autoload" and "=" in line:
+            name, value = line.split("=", 1)
+            autoloads[name.strip()] = value.strip().strip('"').lstrip("*")
+    return autoloads
+
+
+def check_project_file(project_dir: Path, exists: Callable[[str], bool]) -> list[Diagnostic]:
+    project = Path(project_dir) / "project.godot"
+    if not project.exists():
+        return [Diagnostic("project.godot", 0, "project.godot not found")]
+    diagnostics = []
+    for lineno, line in enumerate(project.read_text(errors="replace").splitlines(), 1):
+        match = re.match(r'^(?:run/main_scene|\w+)="\*?(res://[^"]+)"', line)
+        if match and not exists(match.group(1)):
+            diagnostics.append(Diagnostic("project.godot", lineno, f"missing file {match.group(1)}"))
+    return diagnostics
+
+
+# ── scenes and resources ────────────────────────────────────────────────
+
+def check_resource(text: str, rel_path: str, exists: Callable[[str], bool]) -> list[Diagnostic]:
+    """Check a text scene (.tscn) or resource (.tres)."""
+    diagnostics: list[Diagnostic] = []
+
+    def error(lineno: int, message: str, severity: str = "error") -> None:
+        diagnostics.append(Diagnostic(rel_path, lineno, message, severity))
+
+    header: dict[str, str] = {}
+    ext_ids: set[str] = set()
+    sub_ids: set[str] = set()
+    refs: list[tuple[int, str, str]] = []
+    nodes: set[str] = set()
+    instanced: set[str] = set()  # nodes whose children come from another scene
+    connections: list[tuple[int, dict[str, str]]] = []
+    depth = 0  # bracket depth of a multi-line property value
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if depth == 0 and line.startswith("["):
+            match = _SECTION_RE.match(line)
+            if not match:
+                error(lineno, f"malformed section header: {line.strip()}")
+                continue
+            kind, attrs = match.group(1), _attrs(match.group(2))
+            if lineno == 1:
+                if kind not in ("gd_scene", "gd_resource"):
+                    error(lineno, f"expected gd_scene or gd_resource header, got [{kind}]")
+                header = attrs
+            elif kind == "ext_resource":
+                _declare(attrs.get("id"), ext_ids, "ext_resource", lineno, error)
+                path = attrs.get("path", "")
+                if not path:
+                    error(lineno, "ext_resource without a path")
+                elif path.startswith("res://") and not exists(path):
+                    error(lineno, f"ext_resource path does not exist: {path}")
+            elif kind == "sub_resource":
+                _declare(attrs.get("id"), sub_ids, "sub_resource", lineno, error)
+            elif kind == "node":
+                _check_node(attrs, nodes, instanced, lineno, error)
+            elif kind == "connection":
+                connections.append((lineno, attrs))
+            for ref_kind, ref_id in _REF_RE.findall(match.group(2)):
+                refs.append((lineno, ref_kind, ref_id))
+            continue
+
+        stripped = _strip_strings(line)
+        depth += sum(stripped.count(c) for c in "([{") - sum(stripped.count(c) for c in ")]}")
+        if depth < 0:
+            error(lineno, "unbalanced closing bracket")
+            depth = 0
+        for ref_kind, ref_id in _REF_RE.findall(line):
+            refs.append((lineno, ref_kind, ref_id))
+
+    if not header and text.strip():
+        error(1, "missing gd_scene/gd_resource header")
+    if depth:
+        error(len(text.splitlines()), "unterminated property value (unbalanced brackets)")
+
+    for lineno, ref_kind, ref_id in refs:
+        declared = ext_ids if ref_kind == "ExtResource" else sub_ids
+        if ref_id not in declared:
+            error(lineno, f'{ref_kind}("{ref_id}") is not declared')
+
+    for lineno, attrs in connections:
+        for end in ("from", "to"):
+            path = attrs.get(end, "")
+            if path not in nodes:
+                error(lineno, f"connection {end}={path!r} does not name a node")
+
+    if "load_steps" in header:
+        expected = len(ext_ids) + len(sub_ids) + 1
+        if header["load_steps"] != str(expected):
+            error(1, f"load_steps={header['load_steps']} but the file has {expected - 1} resources "
+                     f"(expected {expected})", "warning")
+    return diagnostics
+
+
+def _attrs(text: str) -> dict[str, str]:
+    return {k: v[1:-1] if v.startswith('"') else v for k, v in _ATTR_RE.findall(text)}
+
+
+def _declare(res_id, declared: set[str], kind: str, lineno: int, error) -> None:
+    if not res_id:
+        error(lineno, f"{kind} without an id")
+    elif res_id in declared:
+        error(lineno, f'duplicate {kind} id "{res_id}"')
+    else:
+        declared.add(res_id)
+
+
+def _check_node(attrs: dict[str, str], nodes: set[str], instanced: set[str],
+                lineno: int, error) -> None:
+    name = attrs.get("name")
+    if not name:
+        error(lineno, "node without a name")
+        return
+    parent = attrs.get("parent")
+    if parent is None:
+        if "." in nodes:
+            error(lineno, f'second root node "{name}" (missing parent=)')
+            return
+        path = "."
+    else:
+        inside_instance = any(parent.startswith(p + "/") for p in instanced)
+        if parent not in nodes and not inside_instance:
+            error(lineno, f'node "{name}" has parent "{parent}", which is not declared before it')
+            return
+        path = name if parent == "." else f"{parent}/{name}"
+        if path in nodes:
+            error(lineno, f'duplicate node path "{path}"')
+    nodes.add(path)
+    if "instance" in attrs:
+        instanced.add(path)
+
+
+# ── GDScript ────────────────────────────────────────────────────────────
+
+def check_gdscript(text: str, rel_path: str, autoloads: dict[str, str],
+                   exists: Callable[[str], bool]) -> list[Diagnostic]:
+    """Tokenize-level and indentation checks for one GDScript file."""
+    diagnostics: list[Diagnostic] = []
+
+    def error(lineno: int, message: str) -> None:
+        diagnostics.append(Diagnostic(rel_path, lineno, message))
+
+    indent_char = ""
+    levels = [0]
+    expect_block = False
+    opener_line = 0
+    brackets: list[tuple[str, int]] = []
+    in_string = ""  # closing quote of an open multi-line string
+    continuation = False
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        logical_start = not in_string and not brackets and not continuation
+        code, in_string, unterminated = _scan_line(line, in_string, brackets, lineno, error)
+        if unterminated:
+            error(lineno, "unterminated string literal")
+        continuation = code.rstrip().endswith("\\")
+
+        if not code.strip():
+            continue
+        if not logical_start:
+            # The last line of a wrapped statement ("func f(a,\n\t\tb) -> void:") can open a block
+            if not brackets and not in_string and not continuation:
+                expect_block = code.rstrip().endswith(":")
+                opener_line = lineno
+            continue
+
+        indent = line[:len(line) - len(line.lstrip(" \t"))]
+        if indent:
+            if " " in indent and "\t" in indent:
+                error(lineno, "mixed tabs and spaces in indentation")
+            elif not indent_char:
+                indent_char = indent[0]
+            elif indent[0] != indent_char:
+                used, before = ("tab", "space") if indent[0] == "\t" else ("space", "tab")
+                error(lineno, f"{used} used for indentation but the file indents with {before}s")
+        width = len(indent)
+
+        if expect_block:
+            if width <= levels[-1]:
+                error(lineno, f"expected an indented block after line {opener_line}")
+            else:
+                levels.append(width)
+        elif width > levels[-1]:
+            error(lineno, "unexpected indent")
+        else:
+            while width < levels[-1]:
+                levels.pop()
+            if width != levels[-1]:
+                error(lineno, "unindent does not match any outer indentation level")
+                levels.append(width)
+
+        # A statement ending in ":" opens a block unless it is a one-liner
+        # ("if x: return") — which the colon being last already rules out.
+        expect_block = code.rstrip().endswith(":") and not brackets
+        if expect_block:
+            opener_line = lineno
+
+        for word in re.findall(r"(?<![\w.$%&^])[A-Za-z_]\w*", code):
+            if word in _PYTHON_LITERALS:
+                error(lineno, f"{word} is Python, GDScript uses {word.lower().replace('none', 'null')}")
+            elif word in AUTOLOADS and word not in autoloads:
+                error(lineno, f"autoload {word} is not registered in project.godot")
+
+        for _, path in _RES_PATH_RE.findall(line):
+            if not exists(path):
+                error(lineno, f"{path} does not exist")
+
+    if in_string:
+        error(len(text.splitlines()), "unterminated multi-line string")
+    for opened, lineno in brackets:
+        error(lineno, f"unclosed '{opened}'")
+    if expect_block:
+        error(len(text.splitlines()), f"expected an indented block after line {opener_line}")
+    return diagnostics
+
+
+def _scan_line(line: str, in_string: str, brackets: list[tuple[str, int]],
+               lineno: int, error) -> tuple[str, str, bool]:
+    """Tokenize one physical line.
+
+    Returns the line with string contents and comments blanked out (so the
+    caller can look at code only), the still-open multi-line string
+    delimiter if any, and whether a single-line string was left open.
+    Bracket balance is tracked in *brackets* across lines.
+    """
+    out = []
+    i = 0
+    n = len(line)
+    while i < n:
+        if in_string:
+            end = line.find(in_string, i)
+            if end < 0:
+                return "".join(out), in_string, False
+            i = end + len(in_string)
+            in_string = ""
+            out.append('""')
+            continue
+        c = line[i]
+        if c == "#":
+            break
+        if c in "\"'":
+            quote = line[i:i + 3] if line[i:i + 3] in ('"""', "'''") else c
+            raw = i > 0 and line[i - 1] == "r"
+            if len(quote) == 3:
+                in_string = quote
+                i += 3
+                continue
+            j = i + 1
+            while j < n and line[j] != quote:
+                j += 1 if raw or line[j] != "\\" else 2
+            if j >= n:
+                return "".join(out), "", True
+            out.append('""')
+            i = j + 1
+            continue
+        if c in _BRACKETS:
+            brackets.append((c, lineno))
+        elif c in ")]}":
+            if not brackets:
+                error(lineno, f"unmatched '{c}'")
+            elif _BRACKETS[brackets[-1][0]] != c:
+                error(lineno, f"'{c}' does not close '{brackets[-1][0]}' from line {brackets[-1][1]}")
+                brackets.pop()
+            else:
+                brackets.pop()
+        elif c in "`?":
+            error(lineno, f"unexpected character {c!r}")
+        out.append(c)
+        i += 1
+    return "".join(out), in_string, False
+
+
+def _strip_strings(line: str) -> str:
+    return re.sub(r'"(?:[^"\\]|\\.)*"', '""', line)
+
+
+def referenced_paths(text: str) -> list[str]:
+    """res:// paths a script preloads or extends."""
+    return sorted({path for _, path in _RES_PATH_RE.findall(text)})
+
+
+def res_exists(project_dir: Path) -> Callable[[str], bool]:
+    def exists(res_path: str) -> bool:
+        return (project_dir / res_path.removeprefix("res://")).exists()
+    return exists
+
+
+def format_diagnostics(diagnostics: list[Diagnostic]) -> str:
+    return "\n".join(str(d) for d in diagnostics)
@@ -0,0 +1,73 @@
+extends SceneTree
+## Long-lived validation worker, started by app/mcp/worker_pool.py as
+##   godot --headless --path <workspace> --script res://validator_worker.gd -- --port=N --worker=I
+##
+## Receives newline-delimited JSON jobs over a localhost socket. For a
+## "check" job it loads every listed resource from disk (bypassing the
+## cache) and brackets the engine's own error output with BEGIN/END markers
+## on stderr, which the pool reads back as the job's diagnostics. A FILE
+## marker before each resource attributes the output to it.
+
+const BEGIN := "@@BEGIN"
+const FILE := "@@FILE"
+const END := "@@END"
+
+var _peer := StreamPeerTCP.new()
+var _worker := -1
+var _greeted := false
+var _buffer := ""
+
+
+func _initialize() -> void:
+	Engine.max_fps = 20
+	var port := 0
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--port="):
+			port = int(arg.get_slice("=", 1))
+		elif arg.begins_with("--worker="):
+			_worker = int(arg.get_slice("=", 1))
+	if port == 0 or _peer.connect_to_host("127.0.0.1", port) != OK:
+		printerr("validator worker: cannot reach pool on port %d" % port)
+		quit(1)
+
+
+func _process(_delta: float) -> bool:
+	_peer.poll()
+	var status := _peer.get_status()
+	if status == StreamPeerTCP.STATUS_ERROR or status == StreamPeerTCP.STATUS_NONE:
+		return true  # pool went away
+	if status != StreamPeerTCP.STATUS_CONNECTED:
+		return false
+	if not _greeted:
+		_peer.put_data(("worker %d\n" % _worker).to_utf8_buffer())
+		_greeted = true
+	var available := _peer.get_available_bytes()
+	if available > 0:
+		_buffer += _peer.get_utf8_string(available)
+	while _buffer.contains("\n"):
+		var line := _buffer.get_slice("\n", 0)
+		_buffer = _buffer.substr(line.length() + 1)
+		var job = JSON.parse_string(line)
+		if not job is Dictionary:
+			continue
+		if job.get("op", "") == "quit":
+			return true
+		_check(job)
+	return false
+
+
+func _check(job: Dictionary) -> void:
+	var id: String = job.get("id", "")
+	var files: Array = job.get("files", [])
+	var failed: Array[String] = []
+	var times := {}
+	printerr("%s %s" % [BEGIN, id])
+	for path: String in files:
+		printerr("%s %s" % [FILE, path])
+		var started := Time.get_ticks_usec()
+		var res := ResourceLoader.load(path, "", ResourceLoader.CACHE_MODE_IGNORE_DEEP)
+		times[path] = Time.get_ticks_usec() - started
+		if res == null:
+			failed.append(path)
+	var summary := {"checked": files.size(), "failed": failed, "times": times}
+	printerr("%s %s %s" % [END, id, JSON.stringify(summary)])
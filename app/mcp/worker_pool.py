@@ -0,0 +1,295 @@
+"""Pool of long-lived headless Godot processes for project validation.
+
+Engine start-up dominates a `godot --headless --quit` run, so validation is
+handed to workers that stay up between builds. Each worker owns a scratch
+project directory: a job mirrors the game's files into it (copying only
+what changed) and asks the worker, over a localhost socket, to load every
+script and scene. Whatever the engine prints between the job's BEGIN/END
+markers is that job's diagnostics, split per resource by FILE markers.
+
+Workers are recycled after MAX_JOBS_PER_WORKER jobs, after a timeout or
+crash, and when a project's [autoload] section differs from the one the
+worker booted with — ProjectSettings are only read at start-up.
+
+Set GODOT_BIN="python -m app.mcp.fake_godot" to run the pool without an
+engine installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import re
+import shlex
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from app.config import GODOT_BIN
+
+POOL_SIZE = 2
+MAX_JOBS_PER_WORKER = 50
+JOB_TIMEOUT = 30.0
+START_TIMEOUT = 30.0
+
+WORKER_SCRIPT = Path(__file__).parent / "validator_worker.gd"
+_SKIP = {".godot", WORKER_SCRIPT.name}  # workspace entries that are not the game's
+BEGIN = "@@BEGIN"
+FILE = "@@FILE"
+END = "@@END"
+
+
+@dataclass
+class WorkerResult:
+    output: str = ""
+    checked: int = 0
+    failed: list[str] = field(default_factory=list)
+    error: str = ""  # timeout / crash, as opposed to files that failed to load
+    per_file: dict[str, list[str]] = field(default_factory=dict)  # res path -> output lines
+    times: dict[str, float] = field(default_factory=dict)  # res path -> load time (ms)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.error
+
+
+class _Worker:
+    def __init__(self, pool: GodotWorkerPool, index: int) -> None:
+        self.pool = pool
+        self.index = index
+        self.workspace = Path(tempfile.mkdtemp(prefix=f"godot-worker-{index}-"))
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.autoloads: Optional[str] = None
+        self.jobs_done = 0
+        self._job_ids = itertools.count()
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self) -> None:
+        shutil.copy(WORKER_SCRIPT, self.workspace / WORKER_SCRIPT.name)
+        connected = self.pool._expect(self.index)
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.pool.command, "--headless",
+            "--path", str(self.workspace),
+            "--script", f"res://{WORKER_SCRIPT.name}",
+            "--", f"--port={self.pool.port}", f"--worker={self.index}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env={**os.environ, "HOME": os.environ.get("HOME", "/tmp")},
+        )
+        exited = asyncio.ensure_future(self.proc.wait())
+        done, _ = await asyncio.wait({connected, exited}, timeout=START_TIMEOUT,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        exited.cancel()
+        if connected not in done:
+            output = ""
+            if exited in done:
+                output = (await self.proc.stdout.read()).decode(errors="replace").strip()
+            await self.stop()
+            raise ConnectionError(output or "Godot worker failed to start")
+        self.writer = connected.result()
+        self.autoloads = _autoloads(self.workspace)
+        self.jobs_done = 0
+
+    async def run(self, files: list[str], timeout: float) -> WorkerResult:
+        job_id = f"{self.index}-{next(self._job_ids)}"
+        self.writer.write((json.dumps({"id": job_id, "op": "check", "files": files}) + "\n").encode())
+        await self.writer.drain()
+
+        lines: list[str] = []
+        per_file: dict[str, list[str]] = {}
+
+        async def _collect() -> dict:
+            begun = False
+            current: list[str] = []
+            while True:
+                raw = await self.proc.stdout.readline()
+                if not raw:
+                    raise ConnectionError("Godot worker exited unexpectedly")
+                line = raw.decode(errors="replace").rstrip()
+                if line == f"{BEGIN} {job_id}":
+                    begun = True
+                elif line.startswith(f"{END} {job_id} "):
+                    return json.loads(line.split(" ", 2)[2])
+                elif line.startswith(f"{FILE} ") and begun:
+                    current = per_file.setdefault(line[len(FILE) + 1:], [])
+                elif begun:
+                    lines.append(line)
+                    current.append(line)
+
+        try:
+            summary = await asyncio.wait_for(_collect(), timeout)
+        except asyncio.TimeoutError:
+            return WorkerResult("\n".join(lines), error=f"Validation timed out ({timeout:.0f}s)")
+        except ConnectionError as e:
+            return WorkerResult("\n".join(lines), error=str(e))
+        self.jobs_done += 1
+        times = {path: usec / 1000 for path, usec in summary.get("times", {}).items()}
+        return WorkerResult("\n".join(lines), summary.get("checked", 0), summary.get("failed", []),
+                            per_file=per_file, times=times)
+
+    async def stop(self) -> None:
+        if self.writer:
+            try:
+                self.writer.write(b'{"op": "quit"}\n')
+                self.writer.close()
+            except (ConnectionError, RuntimeError):
+                pass
+            self.writer = None
+        if self.alive:
+            try:
+                await asyncio.wait_for(self.proc.wait(), 2)
+            except asyncio.TimeoutError:
+                self.proc.kill()
+                await self.proc.wait()
+        self.proc = None
+
+
+class GodotWorkerPool:
+    def __init__(self, godot_bin: str = GODOT_BIN, size: int = POOL_SIZE,
+                 max_jobs: int = MAX_JOBS_PER_WORKER, timeout: float = JOB_TIMEOUT) -> None:
+        self.command = shlex.split(godot_bin)
+        self.size = size
+        self.max_jobs = max_jobs
+        self.timeout = timeout
+        self.port = 0
+        self._server: Optional[asyncio.Server] = None
+        self._idle: Optional[asyncio.Queue[_Worker]] = None
+        self._workers: list[_Worker] = []
+        self._pending: dict[int, asyncio.Future] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether the Godot command can be found at all."""
+        return bool(self.command) and shutil.which(self.command[0]) is not None
+
+    async def check(self, project_dir: Path, files: Optional[list[str]] = None) -> WorkerResult:
+        """Load *files* (res:// paths; default every script and scene) of *project_dir* in a worker.
+
+        Raises FileNotFoundError if the Godot binary is missing.
+        """
+        await self._ensure_started()
+        worker = await self._idle.get()
+        try:
+            await asyncio.to_thread(_mirror, project_dir, worker.workspace)
+            if files is None:
+                files = _project_resources(worker.workspace)
+            if worker.alive and (worker.jobs_done >= self.max_jobs
+                                 or worker.autoloads != _autoloads(worker.workspace)):
+                await worker.stop()
+            if not worker.alive:
+                try:
+                    await worker.start()
+                except ConnectionError as e:
+                    return WorkerResult(error=str(e))
+            result = await worker.run(files, self.timeout)
+            if result.error:
+                await worker.stop()
+            return result
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            await worker.stop()
+            shutil.rmtree(worker.workspace, ignore_errors=True)
+        self._workers = []
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _ensure_started(self) -> None:
+        async with self._lock:
+            if self._server is not None:
+                return
+            self._server = await asyncio.start_server(self._on_connect, "127.0.0.1", 0)
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._idle = asyncio.Queue()
+            self._workers = [_Worker(self, i) for i in range(self.size)]
+            for worker in self._workers:
+                self._idle.put_nowait(worker)
+
+    def _expect(self, index: int) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending[index] = future
+        return future
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        hello = (await reader.readline()).decode(errors="replace").split()
+        future = None
+        if len(hello) == 2 and hello[0] == "worker" and hello[1].isdigit():
+            future = self._pending.pop(int(hello[1]), None)
+        if future is None or future.done():
+            writer.close()
+            return
+        future.set_result(writer)
+
+
+def _mirror(src: Path, dst: Path) -> None:
+    """Make *dst* match *src* (apart from the worker's own files), copying only changed files."""
+    wanted = set()
+    for path in src.rglob("*"):
+        rel = path.relative_to(src)
+        if rel.parts[0] in _SKIP:
+            continue
+        wanted.add(rel)
+        target = dst / rel
+        if path.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        st = path.stat()
+        try:
+            current = target.stat()
+        except FileNotFoundError:
+            current = None
+        if current is None or (current.st_size, current.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+            shutil.copy2(path, target)
+    for path in sorted(dst.rglob("*"), reverse=True):
+        rel = path.relative_to(dst)
+        if rel.parts[0] in _SKIP or rel in wanted:
+            continue
+        if path.is_dir():
+            path.rmdir()
+        else:
+            path.unlink()
+
+
+def _project_resources(root: Path) -> list[str]:
+    return sorted(
+        "res://" + p.relative_to(root).as_posix()
+        for p in root.rglob("*")
+        if p.suffix in (".gd", ".tscn") and p.relative_to(root).parts[0] not in _SKIP
+    )
+
+
+def _autoloads(root: Path) -> str:
+    project = root / "project.godot"
+    text = project.read_text(errors="replace") if project.exists() else ""
+    match = re.search(r"^\[autoload\]\n(.*?)(?=^\[|\Z)", text, re.M | re.S)
+    return match.group(1).strip() if match else ""
+
+
+_pool: Optional[GodotWorkerPool] = None
+
+
+def get_pool() -> GodotWorkerPool:
+    global _pool
+    if _pool is None:
+        _pool = GodotWorkerPool()
+    return _pool
+
+
+async def close_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
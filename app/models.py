@@ -42,6 +42,13 @@ class VisualStyle(str, Enum):
     MINIMALIST = "minimalist"
 
 
+class Quality(str, Enum):
+    AUTO = "auto"
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
 class GameSpec(BaseModel):
     """Fully resolved specification for a game to be generated."""
 
@@ -61,6 +68,11 @@ class GameSpec(BaseModel):
     input_method: InputMethod = InputMethod.BOTH
     multiplayer: MultiplayerMode = MultiplayerMode.NONE
     level_count: int = 3
+    quality: Quality = Field(
+        Quality.HIGH,
+        description="Graphics quality tier; auto steps it down at runtime when frames run slow.",
+    )
+    perf_overlay: bool = Field(False, description="Show the FPS / frame time overlay in game.")
     color_primary: str = "#4a90d9"
     color_secondary: str = "#d94a4a"
     color_accent: str = "#f9ca24"
@@ -109,12 +121,34 @@ class UndoRequest(BaseModel):
     session_id: str
 
 
+class BuildStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+class BuildJob(BaseModel):
+    """Progress of the background part of a build (validation + AI art pass)."""
+
+    job_id: str
+    game_name: str
+    status: BuildStatus = BuildStatus.RUNNING
+    revision: int = 1
+    art_total: int = 0
+    art_done: int = 0
+    ai_art_count: int = 0
+    changed_files: list[str] = Field(default_factory=list)
+    preview_log: Optional[str] = None
+    error: Optional[str] = None
+
+
 class ChatResponse(BaseModel):
     message: str
     state: ConversationState
     game_ready: bool = False
     download_url: Optional[str] = None
     preview_log: Optional[str] = None
+    job_id: Optional[str] = None
     spec: Optional[GameSpec] = None
     suggestions: list[Suggestion] = Field(default_factory=list)
     can_undo: bool = False
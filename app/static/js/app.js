@@ -33,6 +33,9 @@ const previewCanvas   = document.getElementById("previewCanvas");
 let isWaiting   = false;
 let downloadUrl = null;
 let currentSpec = null;
+let buildJobId  = null;
+let currentRevision    = 0;  // newest published revision of the game
+let downloadedRevision = 0;  // revision the user last downloaded in full or as an update
 
 /* ── Preview init ──────────────────────────────────── */
 Preview.init(previewCanvas);
@@ -120,6 +123,7 @@ function updateSpecPanel(spec) {
     ["Enemies", spec.has_enemies], ["Collectibles", spec.has_collectibles],
     ["Power-ups", spec.has_powerups], ["Dialogue", spec.has_dialogue],
     ["Particles", spec.has_particles], ["Parallax BG", spec.has_parallax_bg],
+    ["FPS Overlay", spec.perf_overlay],
   ];
   for (const [label, val] of feats) {
     if (val) featRows += `<div class="spec-row"><span class="label">${label}</span><span class="value" style="color:var(--success)">Yes</span></div>`;
@@ -130,6 +134,9 @@ function updateSpecPanel(spec) {
   if (spec.weather && spec.weather !== "none") {
     featRows += `<div class="spec-row"><span class="label">Weather</span><span class="value">${spec.weather}</span></div>`;
   }
+  if (spec.quality && spec.quality !== "high") {
+    featRows += `<div class="spec-row"><span class="label">Quality</span><span class="value">${spec.quality}</span></div>`;
+  }
   featRows += `<div class="spec-row"><span class="label">Difficulty</span><span class="value">${spec.difficulty}</span></div>`;
 
   specPanel.innerHTML = `
@@ -224,11 +231,15 @@ async function sendMessage(text) {
 
     if (data.game_ready && data.download_url) {
       downloadUrl = data.download_url;
+      currentRevision = 1;
+      downloadedRevision = 0;
+      downloadBtn.textContent = "⬇ Download Godot Project";
       downloadArea.classList.add("visible");
       if (data.preview_log) {
         validationLog.textContent = data.preview_log;
         validationLog.classList.add("visible");
       }
+      if (data.job_id) watchBuildJob(data.job_id);
     }
   } catch (err) {
     typingIndicator.classList.remove("active");
@@ -242,6 +253,53 @@ async function sendMessage(text) {
   chatInput.focus();
 }
 
+/* ── Background build job (validation + AI art revision) ── */
+async function watchBuildJob(jobId) {
+  buildJobId = jobId;
+  let lastArtDone = -1;
+  while (buildJobId === jobId) {
+    let job;
+    try {
+      const res = await fetch(`${API}/jobs/${jobId}`);
+      if (!res.ok) throw new Error(`HTTP ${res.status}`);
+      job = await res.json();
+    } catch (err) {
+      console.error(err);
+      return;
+    }
+
+    if (job.preview_log && validationLog.textContent !== job.preview_log) {
+      validationLog.textContent = job.preview_log;
+      validationLog.classList.add("visible");
+    }
+    if (job.art_done !== lastArtDone && job.art_total) {
+      lastArtDone = job.art_done;
+      downloadBtn.textContent = `⬇ Download Godot Project (AI art ${job.art_done}/${job.art_total})`;
+    }
+
+    if (job.status !== "running") {
+      downloadBtn.textContent = "⬇ Download Godot Project";
+      if (job.status === "complete" && job.revision > currentRevision) {
+        currentRevision = job.revision;
+        if (downloadedRevision) {
+          downloadBtn.textContent = "⬇ Download AI Art Update";
+          addMessage("assistant",
+            `**AI art is ready!** Revision ${job.revision} replaces ` +
+            `${job.changed_files.length} file(s) — the download button now fetches ` +
+            `just those; unzip them over your project.`);
+        } else {
+          addMessage("assistant",
+            `**AI art is ready!** Revision ${job.revision} replaces ` +
+            `${job.changed_files.length} file(s) and is what you'll download.`);
+        }
+      }
+      if (buildJobId === jobId) buildJobId = null;
+      return;
+    }
+    await new Promise((r) => setTimeout(r, 3000));
+  }
+}
+
 /* ── Undo ──────────────────────────────────────────── */
 async function doUndo() {
   if (isWaiting) return;
@@ -299,7 +357,12 @@ chatInput.addEventListener("input", () => {
 });
 
 downloadBtn.addEventListener("click", () => {
-  if (downloadUrl) window.location.href = downloadUrl;
+  if (!downloadUrl) return;
+  // Already have an older revision: fetch only the files that changed since
+  const update = downloadedRevision && downloadedRevision < currentRevision;
+  window.location.href = update ? `${downloadUrl}?since=${downloadedRevision}` : downloadUrl;
+  downloadedRevision = currentRevision;
+  downloadBtn.textContent = "⬇ Download Godot Project";
 });
 
 togglePanelBtn.addEventListener("click", () => {
@@ -318,7 +381,10 @@ newChatBtn.addEventListener("click", () => {
   downloadArea.classList.remove("visible");
   validationLog.classList.remove("visible");
   downloadUrl = null;
+  currentRevision = 0;
+  downloadedRevision = 0;
   currentSpec = null;
+  buildJobId = null;
   quickActions.style.display = "";
   suggestionsBar.innerHTML = "";
   updateSpecPanel(null);
@@ -0,0 +1,69 @@
+"""Shared fixtures: small projects, generated games and the Godot binaries to run them.
+
+Tests that need an engine run against app/mcp/fake_godot.py, and also
+against the real one when GODOT_BIN names an installed Godot.
+"""
+
+from __future__ import annotations
+
+import shlex
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+import app.mcp.fake_godot
+from app.config import GODOT_BIN
+from app.generator.godot_project import write_project_file
+from app.generator.project_builder import _TEMPLATE_MAP
+from app.models import GameSpec
+
+FAKE_GODOT = f"{shlex.quote(sys.executable)} {shlex.quote(app.mcp.fake_godot.__file__)}"
+REAL_GODOT = GODOT_BIN if "fake_godot" not in GODOT_BIN and shutil.which(shlex.split(GODOT_BIN)[0]) else None
+
+PROJECT_GODOT = """; Engine configuration file.
+config_version=5
+
+[application]
+
+config/name="Test"
+
+[autoload]
+
+GameManager="*res://scripts/game_manager.gd"
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A tiny project with an autoload and a script that uses it."""
+    root = tmp_path / "game"
+    (root / "scripts").mkdir(parents=True)
+    (root / "project.godot").write_text(PROJECT_GODOT)
+    (root / "scripts" / "game_manager.gd").write_text("extends Node\n\nvar score := 0\n")
+    (root / "scripts" / "player.gd").write_text(
+        "extends Node\n\n\nfunc _ready() -> void:\n\tGameManager.score += 1\n"
+    )
+    return root
+
+
+@pytest.fixture(params=["fake", "godot"])
+def godot_command(request) -> str:
+    """The fake Godot binary, then the real one (skipped unless GODOT_BIN is installed)."""
+    if request.param == "fake":
+        return FAKE_GODOT
+    if REAL_GODOT is None:
+        pytest.skip(f"no Godot binary at GODOT_BIN={GODOT_BIN!r}")
+    return REAL_GODOT
+
+
+def generate_project(root: Path, **spec_fields) -> Path:
+    """Render a game from GameSpec(**spec_fields) into root/<name>, as generate_game does."""
+    spec = GameSpec(**spec_fields)
+    project_dir = root / spec.name.replace(" ", "_")
+    for sub in ("scenes", "scripts", "assets", "ui"):
+        (project_dir / sub).mkdir(parents=True)
+    write_project_file(project_dir, spec)
+    _TEMPLATE_MAP[spec.genre](spec, project_dir).generate()
+    return project_dir
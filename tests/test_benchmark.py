@@ -0,0 +1,112 @@
+"""benchmark_project's scenarios and baseline comparison, and benchmark_network's budget."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.mcp import godot_mcp
+from app.mcp.worker_pool import GodotWorkerPool
+from app.models import Genre, MultiplayerMode
+
+from conftest import generate_project
+
+FRAMES = 60
+NET_SECONDS = 3.0
+
+
+@pytest.fixture
+def baseline_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "bench_baseline.json"
+    monkeypatch.setattr(godot_mcp, "BENCH_BASELINE_PATH", path)
+    return path
+
+
+def _bench(project_dir: Path, command: str, monkeypatch, **kwargs) -> dict:
+    monkeypatch.setattr(godot_mcp, "get_pool", lambda: GodotWorkerPool(command))
+    return asyncio.run(godot_mcp.benchmark_project(str(project_dir), frames=FRAMES, **kwargs))
+
+
+def _scale_baseline(path: Path, key: str, factor: float) -> None:
+    baseline = json.loads(path.read_text())
+    for metrics in baseline[key].values():
+        for metric in metrics:
+            metrics[metric] *= factor
+    path.write_text(json.dumps(baseline))
+
+
+@pytest.mark.parametrize("genre, scenario", [
+    (Genre.SHOOTER, "shooter_bullets"),
+    (Genre.TOPDOWN, "topdown_horde"),
+])
+def test_scenario_baseline_then_regressions(genre, scenario, godot_command, baseline_path,
+                                            tmp_path, monkeypatch):
+    project_dir = generate_project(tmp_path, name="Bench Game", genre=genre, level_count=2)
+
+    first = _bench(project_dir, godot_command, monkeypatch, scenario=scenario, update_baseline=True)
+    assert "error" not in first
+    assert first["genre"] == genre.value  # from project.godot, not the directory name
+    assert set(first["levels"]) == {"level_1", "level_2"}
+    for stats in first["levels"].values():
+        assert "error" not in stats
+        assert {"frame_ms", "physics_ms", "nodes", "memory_mb"} <= set(stats)
+    assert first["genre_summary"]["frame_ms"]["p95"] > 0
+
+    key = f"{genre.value}/{scenario}"
+    stored = json.loads(baseline_path.read_text())[key]
+    assert set(stored) == {"level_1", "level_2"}
+    assert set(stored["level_1"]) == set(godot_mcp._REGRESSION_METRICS)
+
+    # A baseline from a build twice as fast: every level regresses
+    _scale_baseline(baseline_path, key, 0.5)
+    slower = _bench(project_dir, godot_command, monkeypatch, scenario=scenario)
+    assert {r["level"] for r in slower["regressions"]} == {"level_1", "level_2"}
+    assert {r["metric"] for r in slower["regressions"]} >= {"nodes.max", "memory_mb.max"}
+    assert all(r["ratio"] > 1 + godot_mcp.REGRESSION_TOLERANCE for r in slower["regressions"])
+
+    # ...and against one twice as slow, the same build is an improvement
+    _scale_baseline(baseline_path, key, 4.0)
+    faster = _bench(project_dir, godot_command, monkeypatch, scenario=scenario)
+    assert not faster["regressions"]
+    assert {r["level"] for r in faster["improvements"]} == {"level_1", "level_2"}
+
+
+def test_baselines_are_kept_per_scenario(godot_command, baseline_path, tmp_path, monkeypatch):
+    project_dir = generate_project(tmp_path, name="Bench Game", genre=Genre.SHOOTER, level_count=1)
+    _bench(project_dir, godot_command, monkeypatch, update_baseline=True)
+    _bench(project_dir, godot_command, monkeypatch, scenario="shooter_bullets", update_baseline=True)
+    assert set(json.loads(baseline_path.read_text())) == {"shooter", "shooter/shooter_bullets"}
+
+
+def test_unknown_scenario_and_missing_genre_are_errors(tmp_path, monkeypatch):
+    project_dir = generate_project(tmp_path, name="Bench Game", genre=Genre.SHOOTER, level_count=1)
+    report = asyncio.run(godot_mcp.benchmark_project(str(project_dir), scenario="nope"))
+    assert "unknown benchmark scenario" in report["error"]
+
+    text = (project_dir / "project.godot").read_text()
+    (project_dir / "project.godot").write_text(text.replace('config/tags=PackedStringArray("shooter")\n', ""))
+    report = asyncio.run(godot_mcp.benchmark_project(str(project_dir)))
+    assert "genre" in report["error"]
+
+
+@pytest.mark.parametrize("budget", [600, 4000])
+def test_network_stays_within_budget(budget, godot_command, tmp_path, monkeypatch):
+    project_dir = generate_project(tmp_path, name="Net Game", genre=Genre.SHOOTER, level_count=1,
+                                   multiplayer=MultiplayerMode.ONLINE_IP)
+    monkeypatch.setattr(godot_mcp, "get_pool", lambda: GodotWorkerPool(godot_command))
+    report = asyncio.run(godot_mcp.benchmark_network(str(project_dir), NET_SECONDS, budget))
+
+    assert "error" not in report, report
+    assert "error" not in report["host"] and "error" not in report["client"]
+    assert 0 < report["bytes_per_s"] <= budget
+    assert isinstance(report["latency_ms"], (int, float)) and report["latency_ms"] >= 0
+    assert report["score_synced"]
+
+
+def test_network_needs_multiplayer(tmp_path):
+    project_dir = generate_project(tmp_path, name="Solo Game", genre=Genre.SHOOTER, level_count=1)
+    report = asyncio.run(godot_mcp.benchmark_network(str(project_dir), NET_SECONDS, 600))
+    assert "NetworkManager" in report["error"]
@@ -0,0 +1,77 @@
+"""check_scripts' per-file content-hash cache, with the fake Godot binary as the engine."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.mcp import godot_mcp
+from app.mcp.worker_pool import GodotWorkerPool
+
+from conftest import FAKE_GODOT
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(godot_mcp, "CHECK_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(godot_mcp, "_memory_cache", {})
+    return tmp_path / "cache"
+
+
+def _check(project: Path, monkeypatch) -> dict:
+    """check_scripts on a fresh pool of fake workers (a pool belongs to one event loop)."""
+    pool = GodotWorkerPool(FAKE_GODOT, size=2)
+    monkeypatch.setattr(godot_mcp, "get_pool", lambda: pool)
+
+    async def _main():
+        try:
+            return await godot_mcp.check_scripts(project)
+        finally:
+            await pool.close()
+    return asyncio.run(_main())
+
+
+def test_first_check_misses_second_hits(project: Path, monkeypatch, cache_dir: Path):
+    first = _check(project, monkeypatch)
+    assert first["engine"]
+    assert first["summary"] == {**first["summary"], "files": 2, "cached": 0, "errors": 0}
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+    second = _check(project, monkeypatch)
+    assert second["summary"]["cached"] == 2
+    assert {rel: f["sha256"] for rel, f in second["files"].items()} == \
+        {rel: f["sha256"] for rel, f in first["files"].items()}
+
+
+def test_disk_cache_survives_a_restart(project: Path, monkeypatch):
+    _check(project, monkeypatch)
+    monkeypatch.setattr(godot_mcp, "_memory_cache", {})
+    assert _check(project, monkeypatch)["summary"]["cached"] == 2
+
+
+def test_editing_a_script_misses_only_that_script(project: Path, monkeypatch):
+    _check(project, monkeypatch)
+    (project / "scripts" / "player.gd").write_text(
+        "extends Node\n\n\nfunc _ready() -> void:\n\tGameManager.score += 2\n"
+    )
+    report = _check(project, monkeypatch)
+    assert report["files"]["scripts/player.gd"]["cached"] is False
+    assert report["files"]["scripts/game_manager.gd"]["cached"] is True
+
+
+def test_autoload_change_invalidates_every_script(project: Path, monkeypatch):
+    _check(project, monkeypatch)
+    with open(project / "project.godot", "a") as f:
+        f.write('Extra="*res://scripts/game_manager.gd"\n')
+    assert _check(project, monkeypatch)["summary"]["cached"] == 0
+
+
+def test_engine_failures_are_reported_and_cached(project: Path, monkeypatch):
+    (project / "scripts" / "empty.gd").write_text("")
+    report = _check(project, monkeypatch)
+    entry = report["files"]["scripts/empty.gd"]
+    assert not entry["ok"]
+    assert any(d["source"] == "godot" for d in entry["diagnostics"])
+    assert _check(project, monkeypatch)["files"]["scripts/empty.gd"]["cached"] is True
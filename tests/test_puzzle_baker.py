@@ -0,0 +1,118 @@
+"""Baked puzzle boards, replayed one at a time by a plain-Python greedy player."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.generator import puzzle_baker
+from app.generator.puzzle_baker import MOVE_SLACK, POINTS_PER_TILE, REFILL_LENGTH, bake_board, play_greedy
+from app.generator.templates.puzzle import level_config
+
+CANDIDATES = 48
+LEVELS = [1, 2, 3, 5]
+
+
+def _largest_group(cells: list[list[int]]) -> set[tuple[int, int]]:
+    """The biggest 4-neighbour same-colour group; ties go to the one starting first in row order."""
+    rows, cols = len(cells), len(cells[0])
+    seen: set[tuple[int, int]] = set()
+    best: set[tuple[int, int]] = set()
+    for r in range(rows):
+        for c in range(cols):
+            if (r, c) in seen:
+                continue
+            group, stack = {(r, c)}, [(r, c)]
+            while stack:
+                y, x = stack.pop()
+                for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                    if (0 <= ny < rows and 0 <= nx < cols and (ny, nx) not in group
+                            and cells[ny][nx] == cells[r][c]):
+                        group.add((ny, nx))
+                        stack.append((ny, nx))
+            seen |= group
+            if len(group) > len(best):
+                best = group
+    return best
+
+
+def replay(cells, refills, target: int, max_moves: int = puzzle_baker.MAX_MOVES) -> int:
+    """Clicks to reach *target* on one board as puzzle_grid.gd plays it, or -1 if stuck."""
+    board = [[int(v) for v in row] for row in cells]
+    rows, cols = len(board), len(board[0])
+    queue_pos = [0] * cols
+    score = 0
+    for move in range(1, max_moves + 1):
+        group = _largest_group(board)
+        if len(group) < 2:
+            return -1
+        score += len(group) * POINTS_PER_TILE
+        if score >= target:
+            return move
+        for c in range(cols):
+            kept = [board[r][c] for r in range(rows) if (r, c) not in group]
+            gaps = rows - len(kept)
+            # Row 0 is the top: the lowest empty row takes the next queued colour
+            fresh = [int(refills[c][(queue_pos[c] + gaps - 1 - r) % REFILL_LENGTH]) for r in range(gaps)]
+            for r, colour in enumerate(fresh + kept):
+                board[r][c] = colour
+            queue_pos[c] += gaps
+    return -1
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_play_greedy_matches_reference(level):
+    cols, rows, colors, target = level_config(level)
+    rng = np.random.default_rng(level)
+    cells = rng.integers(0, colors, (CANDIDATES, rows, cols), dtype=np.uint8)
+    refills = rng.integers(0, colors, (CANDIDATES, cols, REFILL_LENGTH), dtype=np.uint8)
+    moves = play_greedy(cells, refills, target)
+    assert list(moves) == [replay(cells[i], refills[i], target) for i in range(CANDIDATES)]
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_baked_board_reaches_target_in_exactly_its_moves(level):
+    cols, rows, colors, target = level_config(level)
+    seed = level * 1000 + 42
+    board = bake_board(seed, cols, rows, colors, target, "normal", CANDIDATES)
+    assert board is not None
+    assert board.cells.shape == (rows, cols)
+    assert board.refills.shape == (cols, REFILL_LENGTH)
+    assert replay(board.cells, board.refills, target) == board.moves > 1
+    # One move fewer must not be enough
+    assert replay(board.cells, board.refills, target, max_moves=board.moves - 1) == -1
+
+    # The pick: the solvable candidate (more than one click) nearest the median, first on ties
+    rng = np.random.default_rng(seed)
+    cells = rng.integers(0, colors, (CANDIDATES, rows, cols), dtype=np.uint8)
+    refills = rng.integers(0, colors, (CANDIDATES, cols, REFILL_LENGTH), dtype=np.uint8)
+    moves = [replay(cells[i], refills[i], target) for i in range(CANDIDATES)]
+    solvable = [i for i, m in enumerate(moves) if m > 1]
+    median = float(np.median([moves[i] for i in solvable]))
+    pick = min(solvable, key=lambda i: (abs(moves[i] - median), i))
+    assert np.array_equal(board.cells, cells[pick])
+    assert np.array_equal(board.refills, refills[pick])
+
+
+@pytest.mark.parametrize("difficulty", sorted(MOVE_SLACK))
+@pytest.mark.parametrize("level", LEVELS)
+def test_move_limit_leaves_slack(level, difficulty):
+    cols, rows, colors, target = level_config(level)
+    board = bake_board(level * 1000 + 42, cols, rows, colors, target, difficulty, CANDIDATES)
+    assert board.move_limit > board.moves
+    assert board.move_limit == max(math.ceil(board.moves * (1 + MOVE_SLACK[difficulty])), board.moves + 1)
+
+
+def test_boards_are_reproducible():
+    cols, rows, colors, target = level_config(2)
+    a = bake_board(7, cols, rows, colors, target, "hard", CANDIDATES)
+    b = bake_board(7, cols, rows, colors, target, "hard", CANDIDATES)
+    assert np.array_equal(a.cells, b.cells) and np.array_equal(a.refills, b.refills)
+    assert (a.moves, a.move_limit) == (b.moves, b.move_limit)
+
+
+def test_unsolvable_target_gives_no_board():
+    assert bake_board(1, 4, 4, 6, 10**6, "normal", 16) is None
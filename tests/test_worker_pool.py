@@ -0,0 +1,135 @@
+"""GodotWorkerPool against app/mcp/fake_godot.py: protocol, recycling, recovery, mirroring."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+from pathlib import Path
+
+from app.mcp import worker_pool
+from app.mcp.fake_godot import CRASH_MARKER, HANG_MARKER
+from app.mcp.worker_pool import GodotWorkerPool
+
+from conftest import FAKE_GODOT
+
+
+def _run(pool: GodotWorkerPool, *checks):
+    """Run (project, files) checks one after another on *pool*; return (results, worker pids)."""
+    async def _main():
+        results, pids = [], []
+        try:
+            for project_dir, files in checks:
+                results.append(await pool.check(project_dir, files))
+                pids.append(pool._workers[0].proc.pid if pool._workers[0].alive else None)
+        finally:
+            await pool.close()
+        return results, pids
+    return asyncio.run(_main())
+
+
+def test_check_splits_output_per_file(project: Path):
+    (project / "scripts" / "empty.gd").write_text("")
+    pool = GodotWorkerPool(FAKE_GODOT, size=1)
+    files = ["res://scripts/player.gd", "res://scripts/empty.gd"]
+    [result], _ = _run(pool, (project, files))
+
+    assert result.checked == 2
+    assert result.failed == ["res://scripts/empty.gd"]
+    assert not result.error
+    assert result.per_file["res://scripts/player.gd"] == []
+    assert "Failed loading resource" in result.per_file["res://scripts/empty.gd"][0]
+    assert set(result.times) == set(files)
+
+
+def test_default_files_are_every_script_and_scene(project: Path):
+    (project / "scenes").mkdir()
+    (project / "scenes" / "main.tscn").write_text('[gd_scene format=3]\n\n[node name="Main" type="Node"]\n')
+    [result], _ = _run(GodotWorkerPool(FAKE_GODOT, size=1), (project, None))
+    assert result.checked == 3
+    assert result.ok
+
+
+def test_worker_is_reused_then_recycled_after_max_jobs(project: Path):
+    pool = GodotWorkerPool(FAKE_GODOT, size=1, max_jobs=2)
+    files = ["res://scripts/player.gd"]
+    results, pids = _run(pool, *[(project, files)] * 5)
+
+    assert all(r.ok for r in results)
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[1]  # third job: fresh process
+    assert pids[2] == pids[3]
+    assert pids[4] != pids[3]
+
+
+def test_worker_restarts_when_autoloads_change(project: Path, tmp_path: Path):
+    other = tmp_path / "other"
+    shutil.copytree(project, other)
+    with open(other / "project.godot", "a") as f:
+        f.write('Extra="*res://scripts/player.gd"\n')
+    files = ["res://scripts/player.gd"]
+    results, pids = _run(GodotWorkerPool(FAKE_GODOT, size=1), (project, files), (project, files), (other, files))
+
+    assert all(r.ok for r in results)
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[1]
+
+
+def test_recovers_after_a_worker_crash(project: Path, tmp_path: Path):
+    crashing = tmp_path / "crashing"
+    shutil.copytree(project, crashing)
+    (crashing / "scripts" / "player.gd").write_text(f"# {CRASH_MARKER}\n")
+    files = ["res://scripts/player.gd"]
+    (crashed, after), _ = _run(GodotWorkerPool(FAKE_GODOT, size=1), (crashing, files), (project, files))
+
+    assert "exited unexpectedly" in crashed.error
+    assert after.ok
+
+
+def test_recovers_after_a_timeout(project: Path, tmp_path: Path):
+    hanging = tmp_path / "hanging"
+    shutil.copytree(project, hanging)
+    (hanging / "scripts" / "player.gd").write_text(f"# {HANG_MARKER}\n")
+    files = ["res://scripts/player.gd"]
+    pool = GodotWorkerPool(FAKE_GODOT, size=1, timeout=1.0)
+    (hung, after), _ = _run(pool, (hanging, files), (project, files))
+
+    assert "timed out" in hung.error
+    assert after.ok
+
+
+def test_jobs_spread_over_the_pool(project: Path):
+    pool = GodotWorkerPool(FAKE_GODOT, size=2)
+
+    async def _main():
+        try:
+            return await asyncio.gather(*(pool.check(project, ["res://scripts/player.gd"]) for _ in range(4)))
+        finally:
+            await pool.close()
+
+    results = asyncio.run(_main())
+    assert all(r.ok for r in results)
+
+
+def test_mirror_copies_only_changed_files(project: Path, tmp_path: Path, monkeypatch):
+    copied = []
+    real_copy2 = shutil.copy2
+    monkeypatch.setattr(worker_pool.shutil, "copy2",
+                        lambda src, dst: copied.append(Path(src).name) or real_copy2(src, dst))
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / worker_pool.WORKER_SCRIPT.name).write_text("extends SceneTree\n")
+
+    worker_pool._mirror(project, workspace)
+    assert sorted(copied) == ["game_manager.gd", "player.gd", "project.godot"]
+
+    copied.clear()
+    worker_pool._mirror(project, workspace)
+    assert copied == []
+
+    (project / "scripts" / "player.gd").write_text("extends Node2D\n")
+    (project / "scripts" / "game_manager.gd").unlink()
+    worker_pool._mirror(project, workspace)
+    assert copied == ["player.gd"]
+    assert (workspace / "scripts" / "player.gd").read_text() == "extends Node2D\n"
+    assert not (workspace / "scripts" / "game_manager.gd").exists()
+    assert (workspace / worker_pool.WORKER_SCRIPT.name).exists()  # the worker's own file stays
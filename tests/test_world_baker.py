@@ -0,0 +1,73 @@
+"""bake_world: reproducible layouts and chunk offsets that index the packed entity arrays."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.generator.world_baker import CHUNK_TILES, T, WorldLayout, bake_world, world_resource
+
+FIELDS = ("heights", "decorations", "platforms", "enemies", "collectibles")
+CHUNK_PX = CHUNK_TILES * T
+
+
+@pytest.mark.parametrize("difficulty", [1, 2, 3])
+def test_same_seed_bakes_byte_identical_layouts(difficulty: int):
+    first = bake_world(1042, 210, 50, difficulty)
+    second = bake_world(1042, 210, 50, difficulty)
+    for name in FIELDS:
+        a, b = getattr(first, name), getattr(second, name)
+        assert a.dtype == b.dtype and a.shape == b.shape
+        assert a.tobytes() == b.tobytes(), name
+    assert world_resource(first) == world_resource(second)
+
+
+def test_different_seeds_bake_different_layouts():
+    first, second = bake_world(1042, 210, 50, 1), bake_world(2042, 210, 50, 1)
+    for name in FIELDS:
+        assert getattr(first, name).tobytes() != getattr(second, name).tobytes(), name
+
+
+def test_layout_shapes_and_ordering():
+    layout = bake_world(7, 250, 50, 2)
+    assert layout.heights.shape == (250,) and layout.heights.dtype == np.float32
+    assert layout.decorations.shape == (250,) and layout.decorations.dtype == np.uint8
+    assert layout.platforms.shape[1] == 3
+    assert layout.enemies.shape[1] == 3
+    assert layout.collectibles.shape[1] == 2
+    for entities in (layout.platforms, layout.enemies, layout.collectibles):
+        assert np.all(np.diff(entities[:, 0]) >= 0)  # sorted by x, as chunk_offsets needs
+        assert entities[:, 0].min() >= 0 and entities[:, 0].max() < 250 * T
+
+
+@pytest.mark.parametrize("world_width", [33, 64, 65, 210, 250])
+def test_chunk_offsets_slice_each_chunks_entities(world_width: int):
+    layout = bake_world(99, world_width, 50, 3)
+    # What world_generator.gd computes for the chunk count
+    assert layout.chunk_count == max(1, -(-(world_width - 1) // CHUNK_TILES))
+    for entities in (layout.platforms, layout.enemies, layout.collectibles):
+        offsets = layout.chunk_offsets(entities)
+        assert offsets.dtype == np.int32
+        assert len(offsets) == layout.chunk_count + 1
+        assert offsets[0] == 0 and offsets[-1] == len(entities)
+        assert np.all(np.diff(offsets) >= 0)
+        for chunk in range(layout.chunk_count):
+            xs = entities[offsets[chunk]:offsets[chunk + 1], 0]
+            expected = np.clip(xs // CHUNK_PX, 0, layout.chunk_count - 1)
+            assert np.all(expected == chunk)
+
+
+def test_chunk_offsets_at_chunk_boundaries():
+    layout = WorldLayout(
+        heights=np.zeros(3 * CHUNK_TILES + 1, np.float32),  # exactly 3 chunks
+        decorations=np.zeros(3 * CHUNK_TILES + 1, np.uint8),
+        platforms=np.zeros((0, 3), np.float32),
+        enemies=np.zeros((0, 3), np.float32),
+        collectibles=np.zeros((0, 2), np.float32),
+    )
+    xs = [0.0, CHUNK_PX - 0.5, CHUNK_PX, CHUNK_PX + 1, 2 * CHUNK_PX - 0.5, 2 * CHUNK_PX, 3 * CHUNK_PX + 40]
+    entities = np.array([[x, 0.0] for x in xs], np.float32)
+    # chunk 0: 0, 511.5 | chunk 1: 512, 513, 1023.5 | chunk 2: 1024 and the overhang past the end
+    assert layout.chunk_offsets(entities).tolist() == [0, 2, 5, 7]
+    assert layout.chunk_offsets(np.zeros((0, 2), np.float32)).tolist() == [0, 0, 0, 0]